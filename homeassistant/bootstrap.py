@@ -64,6 +64,8 @@ from .components import (
 from .components.sensor import recorder as sensor_recorder  # noqa: F401
 from .const import (
     BASE_PLATFORMS,
+    CONF_DEVICE_ID,
+    CONF_ENTITY_ID,
     FORMAT_DATETIME,
     KEY_DATA_LOGGING as DATA_LOGGING,
     REQUIRED_NEXT_PYTHON_HA_RELEASE,
@@ -966,6 +968,53 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+def _collect_automation_references(
+    config: Any, entity_ids: set[str], device_ids: set[str]
+) -> None:
+    """Collect the entity and device ids an automation config refers to."""
+    if isinstance(config, list):
+        for item in config:
+            _collect_automation_references(item, entity_ids, device_ids)
+        return
+    if not isinstance(config, dict):
+        return
+    for key, value in config.items():
+        if key in (CONF_ENTITY_ID, CONF_DEVICE_ID):
+            ids = device_ids if key == CONF_DEVICE_ID else entity_ids
+            if isinstance(value, str):
+                ids.update(item.strip() for item in value.split(","))
+            elif isinstance(value, list):
+                ids.update(item for item in value if isinstance(item, str))
+        else:
+            _collect_automation_references(value, entity_ids, device_ids)
+
+
+@core.callback
+def _async_prioritize_automation_config_entries(
+    hass: core.HomeAssistant, config: dict[str, Any]
+) -> None:
+    """Prioritize the config entries providing entities and devices for automations.
+
+    The automations can only run once these config entries are set up, so they
+    are set up first if the config entry setups are limited.
+    """
+    entity_ids: set[str] = set()
+    device_ids: set[str] = set()
+    for key in conf_util.extract_domain_configs(config, "automation"):
+        _collect_automation_references(config[key], entity_ids, device_ids)
+    ent_reg = entity_registry.async_get(hass)
+    dev_reg = device_registry.async_get(hass)
+    entry_ids = {
+        entry.config_entry_id
+        for entity_id in entity_ids
+        if (entry := ent_reg.async_get(entity_id)) and entry.config_entry_id
+    }
+    for device_id in device_ids:
+        if device := dev_reg.async_get(device_id):
+            entry_ids.update(device.config_entries)
+    hass.config_entries.setup_scheduler.async_prioritize(entry_ids)
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -976,6 +1025,7 @@ async def _async_set_up_integrations(
     domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
         hass, config
     )
+    _async_prioritize_automation_config_entries(hass, config)
 
     # Initialize recorder
     if "recorder" in domains_to_setup:
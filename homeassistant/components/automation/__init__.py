@@ -8,6 +8,7 @@ from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from functools import partial
 import logging
+from time import monotonic
 from typing import Any, Protocol, cast
 
 from propcache import cached_property
@@ -64,6 +65,7 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
+from homeassistant.helpers.json import json_bytes_sorted
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -356,6 +358,7 @@ class BaseAutomationEntity(ToggleEntity, ABC):
         (ATTR_LAST_TRIGGERED, ATTR_MODE, ATTR_CUR, ATTR_MAX, CONF_ID)
     )
     raw_config: ConfigType | None
+    config_hash: int | None = None
 
     @property
     def capability_attributes(self) -> dict[str, Any] | None:
@@ -886,6 +889,17 @@ class AutomationEntityConfig:
     raw_config: ConfigType | None
     validation_error: str | None
     validation_status: ValidationStatus
+    config_hash: int | None
+
+
+def _config_hash(raw_config: ConfigType | None) -> int | None:
+    """Return a hash of the raw config of an automation, None if it has none."""
+    if raw_config is None:
+        return None
+    try:
+        return hash(json_bytes_sorted(raw_config))
+    except TypeError:
+        return None
 
 
 async def _prepare_automation_config(
@@ -915,6 +929,7 @@ async def _prepare_automation_config(
                 raw_config,
                 validation_error,
                 validation_status,
+                _config_hash(raw_config),
             )
         )
 
@@ -935,21 +950,22 @@ async def _create_automation_entities(
     entities: list[BaseAutomationEntity] = []
 
     for automation_config in automation_configs:
+        start = monotonic()
         config_block = automation_config.config_block
 
         automation_id: str | None = config_block.get(CONF_ID)
         name = _automation_name(automation_config)
 
         if automation_config.validation_status != ValidationStatus.OK:
-            entities.append(
-                UnavailableAutomationEntity(
-                    automation_id,
-                    name,
-                    automation_config.raw_config,
-                    cast(str, automation_config.validation_error),
-                    automation_config.validation_status,
-                )
+            unavailable_entity = UnavailableAutomationEntity(
+                automation_id,
+                name,
+                automation_config.raw_config,
+                cast(str, automation_config.validation_error),
+                automation_config.validation_status,
             )
+            unavailable_entity.config_hash = automation_config.config_hash
+            entities.append(unavailable_entity)
             continue
 
         initial_state: bool | None = config_block.get(CONF_INITIAL_STATE)
@@ -1002,7 +1018,9 @@ async def _create_automation_entities(
             automation_config.raw_blueprint_inputs,
             config_block[CONF_TRACE],
         )
+        entity.config_hash = automation_config.config_hash
         entities.append(entity)
+        LOGGER.debug("Created %s in %.3f seconds", name, monotonic() - start)
 
     return entities
 
@@ -1012,13 +1030,11 @@ async def _async_process_config(
     config: dict[str, Any],
     component: EntityComponent[BaseAutomationEntity],
 ) -> None:
-    """Process config and add automations."""
+    """Process config and add automations.
 
-    def automation_matches_config(
-        automation: BaseAutomationEntity, config: AutomationEntityConfig
-    ) -> bool:
-        name = _automation_name(config)
-        return automation.name == name and automation.raw_config == config.raw_config
+    Automations whose config did not change keep running, only automations
+    which were added or changed are created.
+    """
 
     def find_matches(
         automations: list[BaseAutomationEntity],
@@ -1034,7 +1050,10 @@ async def _async_process_config(
         automation_matches: set[int] = set()
         config_matches: set[int] = set()
         automation_configs_with_id: dict[str, tuple[int, AutomationEntityConfig]] = {}
-        automation_configs_without_id: list[tuple[int, AutomationEntityConfig]] = []
+        # Configurations without id are indexed by name and config hash
+        automation_configs_without_id: dict[
+            tuple[str, int | None], list[tuple[int, AutomationEntityConfig]]
+        ] = {}
 
         for config_idx, automation_config in enumerate(automation_configs):
             if automation_id := automation_config.config_block.get(CONF_ID):
@@ -1043,7 +1062,10 @@ async def _async_process_config(
                     automation_config,
                 )
                 continue
-            automation_configs_without_id.append((config_idx, automation_config))
+            automation_configs_without_id.setdefault(
+                (_automation_name(automation_config), automation_config.config_hash),
+                [],
+            ).append((config_idx, automation_config))
 
         for automation_idx, automation in enumerate(automations):
             if automation.unique_id:
@@ -1052,23 +1074,25 @@ async def _async_process_config(
                 config_idx, automation_config = automation_configs_with_id.pop(
                     automation.unique_id
                 )
-                if automation_matches_config(automation, automation_config):
+                if _automation_matches_config(automation, automation_config):
                     automation_matches.add(automation_idx)
                     config_matches.add(config_idx)
                 continue
 
-            for config_idx, automation_config in automation_configs_without_id:
-                if config_idx in config_matches:
-                    # Only allow an automation config to match at most once
-                    continue
-                if automation_matches_config(automation, automation_config):
+            candidates = automation_configs_without_id.get(
+                (cast(str, automation.name), automation.config_hash), []
+            )
+            for candidate_idx, (config_idx, automation_config) in enumerate(candidates):
+                if _automation_matches_config(automation, automation_config):
                     automation_matches.add(automation_idx)
                     config_matches.add(config_idx)
-                    # Only allow an automation to match at most once
+                    # Only allow an automation and a config to match at most once
+                    del candidates[candidate_idx]
                     break
 
         return automation_matches, config_matches
 
+    start = monotonic()
     automation_configs = await _prepare_automation_config(hass, config, None)
     automations: list[BaseAutomationEntity] = list(component.entities)
 
@@ -1091,6 +1115,13 @@ async def _async_process_config(
     ]
     entities = await _create_automation_entities(hass, updated_automation_configs)
     await component.async_add_entities(entities)
+    LOGGER.debug(
+        "Processed automations in %.3f seconds: %s unchanged, %s removed, %s created",
+        monotonic() - start,
+        len(automation_matches),
+        len(tasks),
+        len(entities),
+    )
 
 
 def _automation_matches_config(
@@ -1102,7 +1133,11 @@ def _automation_matches_config(
     if not config:
         return False
     name = _automation_name(config)
-    return automation.name == name and automation.raw_config == config.raw_config
+    return (
+        automation.name == name
+        and automation.config_hash == config.config_hash
+        and automation.raw_config == config.raw_config
+    )
 
 
 async def _async_process_single_config(
@@ -24,6 +24,10 @@ DATA_MANAGER: Final = "bluetooth_manager"
 
 UNAVAILABLE_TRACK_SECONDS: Final = 60 * 5
 
+# Advertisements identical to the last one dispatched for an address,
+# from any source, within this window are not dispatched again
+ADVERTISEMENT_DEDUP_SECONDS: Final = 5
+
 START_TIMEOUT = 15
 
 
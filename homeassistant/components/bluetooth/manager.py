@@ -6,10 +6,12 @@ from collections.abc import Callable, Iterable
 from functools import partial
 import itertools
 import logging
+from typing import Any
 
 from bleak_retry_connector import BleakSlotManager
 from bluetooth_adapters import BluetoothAdapters
 from habluetooth import BaseHaRemoteScanner, BaseHaScanner, BluetoothManager
+from lru import LRU
 
 from homeassistant import config_entries
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_LOGGING_CHANGED
@@ -22,11 +24,12 @@ from homeassistant.core import (
 from homeassistant.helpers import discovery_flow
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN
+from .const import ADVERTISEMENT_DEDUP_SECONDS, DOMAIN
 from .match import (
     ADDRESS,
     CALLBACK,
     CONNECTABLE,
+    MAX_REMEMBER_ADDRESSES,
     BluetoothCallbackMatcher,
     BluetoothCallbackMatcherIndex,
     BluetoothCallbackMatcherWithCallback,
@@ -40,6 +43,20 @@ from .util import async_load_history_from_system
 _LOGGER = logging.getLogger(__name__)
 
 
+def _same_advertisement(
+    service_info: BluetoothServiceInfoBleak,
+    previous_service_info: BluetoothServiceInfoBleak,
+) -> bool:
+    """Return if the advertisement data of two service infos is the same."""
+    return (
+        service_info.connectable == previous_service_info.connectable
+        and service_info.name == previous_service_info.name
+        and service_info.manufacturer_data == previous_service_info.manufacturer_data
+        and service_info.service_data == previous_service_info.service_data
+        and service_info.service_uuids == previous_service_info.service_uuids
+    )
+
+
 class HomeAssistantBluetoothManager(BluetoothManager):
     """Manage Bluetooth for Home Assistant."""
 
@@ -49,6 +66,10 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         "_integration_matcher",
         "_callback_index",
         "_cancel_logging_listener",
+        "_last_dispatched",
+        "_received_count",
+        "_deduped_count",
+        "_dispatched_count",
     )
 
     def __init__(
@@ -65,6 +86,15 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         self._integration_matcher = integration_matcher
         self._callback_index = BluetoothCallbackMatcherIndex()
         self._cancel_logging_listener: CALLBACK_TYPE | None = None
+        # The last dispatched service info of each address from any source.
+        # Some devices use a random address so we need to use
+        # an LRU to avoid memory issues.
+        self._last_dispatched: LRU[str, BluetoothServiceInfoBleak] = LRU(
+            MAX_REMEMBER_ADDRESSES
+        )
+        self._received_count = 0
+        self._deduped_count = 0
+        self._dispatched_count = 0
         super().__init__(bluetooth_adapters, slot_manager)
         self._async_logging_changed()
 
@@ -95,6 +125,7 @@ class HomeAssistantBluetoothManager(BluetoothManager):
     def async_rediscover_address(self, address: str) -> None:
         """Trigger discovery of devices which have already been seen."""
         self._integration_matcher.async_clear_address(address)
+        self._last_dispatched.pop(address, None)
         if service_info := self._connectable_history.get(address):
             self._async_trigger_matching_discovery(service_info)
             return
@@ -102,6 +133,22 @@ class HomeAssistantBluetoothManager(BluetoothManager):
             self._async_trigger_matching_discovery(service_info)
 
     def _discover_service_info(self, service_info: BluetoothServiceInfoBleak) -> None:
+        self._received_count += 1
+        address = service_info.address
+        if (
+            (previous_service_info := self._last_dispatched.get(address))
+            and previous_service_info.time
+            <= service_info.time
+            < previous_service_info.time + ADVERTISEMENT_DEDUP_SECONDS
+            and _same_advertisement(service_info, previous_service_info)
+        ):
+            # Nothing changed since the last dispatch, the history
+            # and availability were already updated by the manager
+            self._deduped_count += 1
+            return
+        self._last_dispatched[address] = service_info
+        self._dispatched_count += 1
+
         matched_domains = self._integration_matcher.match_domains(service_info)
         if self._debug:
             _LOGGER.debug(
@@ -135,9 +182,23 @@ class HomeAssistantBluetoothManager(BluetoothManager):
                 discovery_key=discovery_key,
             )
 
+    def _async_check_unavailable(self) -> None:
+        """Watch for unavailable devices and cleanup state history."""
+        super()._async_check_unavailable()
+        # A device coming back must be dispatched even if its advertisement
+        # did not change, so forget the addresses which went unavailable
+        all_history = self._all_history
+        connectable_history = self._connectable_history
+        for address, service_info in self._last_dispatched.items():
+            if address not in all_history or (
+                service_info.connectable and address not in connectable_history
+            ):
+                del self._last_dispatched[address]
+
     def _address_disappeared(self, address: str) -> None:
         """Dismiss all discoveries for the given address."""
         self._integration_matcher.async_clear_address(address)
+        self._last_dispatched.pop(address, None)
         for flow in self.hass.config_entries.flow.async_progress_by_init_data_type(
             BluetoothServiceInfoBleak,
             lambda service_info: bool(service_info.address == address),
@@ -168,6 +229,16 @@ class HomeAssistantBluetoothManager(BluetoothManager):
             self._handle_config_entry_removed,
         )
 
+    async def async_diagnostics(self) -> dict[str, Any]:
+        """Diagnostics for the manager."""
+        diagnostics = await super().async_diagnostics()
+        diagnostics["advertisement_counters"] = {
+            "received": self._received_count,
+            "deduped": self._deduped_count,
+            "dispatched": self._dispatched_count,
+        }
+        return diagnostics
+
     def async_register_callback(
         self,
         callback: BluetoothCallback,
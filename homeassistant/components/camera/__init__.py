@@ -177,6 +177,9 @@ class Image:
     content: bytes = attr.ib()
 
 
+type _ImageSize = tuple[int | None, int | None]
+
+
 @dataclass(frozen=True)
 class CameraCapabilities:
     """Camera capabilities."""
@@ -204,35 +207,47 @@ async def _async_get_image(
     Not all cameras can scale images or return jpegs
     that we can scale, however the majority of cases
     are handled.
+
+    Concurrent requests for the same size share a single fetch, and
+    images are reused for the camera's image_cache_duration.
     """
     with suppress(asyncio.CancelledError, TimeoutError):
         async with asyncio.timeout(timeout):
-            image_bytes = (
-                await _async_get_stream_image(
-                    camera, width=width, height=height, wait_for_next_keyframe=False
-                )
-                if camera.use_stream_for_stills
-                else await camera.async_camera_image(width=width, height=height)
-            )
-            if image_bytes:
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
-
+            if image := await camera.async_get_shared_image(timeout, width, height):
                 return image
 
     raise HomeAssistantError("Unable to get image")
 
 
+async def _async_fetch_image(
+    camera: Camera,
+    width: int | None = None,
+    height: int | None = None,
+) -> Image | None:
+    """Fetch a snapshot image from a camera, scaling it if needed."""
+    image_bytes = (
+        await _async_get_stream_image(
+            camera, width=width, height=height, wait_for_next_keyframe=False
+        )
+        if camera.use_stream_for_stills
+        else await camera.async_camera_image(width=width, height=height)
+    )
+    if not image_bytes:
+        return None
+    return _scale_image(Image(camera.content_type, image_bytes), width, height)
+
+
+def _scale_image(image: Image, width: int | None, height: int | None) -> Image:
+    """Scale a jpeg image if width and height are passed."""
+    if (
+        width is not None
+        and height is not None
+        and ("jpeg" in image.content_type or "jpg" in image.content_type)
+    ):
+        return Image(image.content_type, scale_jpeg_camera_image(image, width, height))
+    return image
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -447,6 +462,7 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "brand",
     "frame_interval",
     "frontend_stream_type",
+    "image_cache_duration",
     "is_on",
     "is_recording",
     "is_streaming",
@@ -467,6 +483,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     _attr_brand: str | None = None
     _attr_frame_interval: float = MIN_STREAM_INTERVAL
     _attr_frontend_stream_type: StreamType | None
+    _attr_image_cache_duration: float = 0
     _attr_is_on: bool = True
     _attr_is_recording: bool = False
     _attr_is_streaming: bool = False
@@ -490,6 +507,8 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self._create_stream_lock: asyncio.Lock | None = None
         self._webrtc_provider: CameraWebRTCProvider | None = None
         self._legacy_webrtc_provider: CameraWebRTCLegacyProvider | None = None
+        self._image_cache: dict[_ImageSize, tuple[float, Image]] = {}
+        self._image_fetches: dict[_ImageSize, asyncio.Task[Image | None]] = {}
         self._supports_native_sync_webrtc = (
             type(self).async_handle_web_rtc_offer != Camera.async_handle_web_rtc_offer
         )
@@ -558,6 +577,11 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         """Return the interval between frames of the mjpeg stream."""
         return self._attr_frame_interval
 
+    @cached_property
+    def image_cache_duration(self) -> float:
+        """Return how long in seconds a fetched still image may be reused."""
+        return self._attr_image_cache_duration
+
     @property
     def frontend_stream_type(self) -> StreamType | None:
         """Return the type of stream supported by this camera.
@@ -695,6 +719,74 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
             partial(self.camera_image, width=width, height=height)
         )
 
+    @final
+    async def async_get_shared_image(
+        self, timeout: float, width: int | None = None, height: int | None = None
+    ) -> Image | None:
+        """Return a still image shared between concurrent and recent callers.
+
+        Concurrent callers requesting the same size await a single fetch. When
+        image_cache_duration is set, images are reused until they are older than
+        that duration, and scaled variants are derived from a fresh full size
+        jpeg instead of fetching them from the camera again.
+        """
+        key = (width, height)
+        if cache_duration := self.image_cache_duration:
+            now = time.monotonic()
+            cached = self._image_cache.get(key)
+            if cached and now - cached[0] < cache_duration:
+                return cached[1]
+            if (
+                width is not None
+                and height is not None
+                and (cached := self._image_cache.get((None, None)))
+                and now - cached[0] < cache_duration
+                and (image := _scale_image(cached[1], width, height)) is not cached[1]
+            ):
+                self._async_cache_image(key, cached[0], image)
+                return image
+
+        if (fetch := self._image_fetches.get(key)) is None:
+            fetch = self.hass.async_create_task(
+                self._async_fetch_shared_image(timeout, width, height),
+                f"camera {self.entity_id} image fetch",
+            )
+            if not fetch.done():
+                self._image_fetches[key] = fetch
+                fetch.add_done_callback(partial(self._async_fetch_done, key))
+        # Shield the fetch so a caller timing out does not cancel it for others
+        return await asyncio.shield(fetch)
+
+    async def _async_fetch_shared_image(
+        self, timeout: float, width: int | None, height: int | None
+    ) -> Image | None:
+        """Fetch an image for async_get_shared_image and cache it."""
+        fetched = time.monotonic()
+        try:
+            async with asyncio.timeout(timeout):
+                image = await _async_fetch_image(self, width, height)
+        except TimeoutError:
+            return None
+        if image and self.image_cache_duration:
+            self._async_cache_image((width, height), fetched, image)
+        return image
+
+    @callback
+    def _async_fetch_done(self, key: _ImageSize, _: asyncio.Task[Image | None]) -> None:
+        """Forget a finished fetch so the next request starts a new one."""
+        del self._image_fetches[key]
+
+    @callback
+    def _async_cache_image(self, key: _ImageSize, fetched: float, image: Image) -> None:
+        """Cache an image and drop the images that are no longer fresh."""
+        expired = time.monotonic() - self.image_cache_duration
+        self._image_cache = {
+            cached_key: cached
+            for cached_key, cached in self._image_cache.items()
+            if cached[0] > expired
+        }
+        self._image_cache[key] = (fetched, image)
+
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
@@ -45,14 +45,8 @@ def websocket_list_entities(
         f'{{"id":{msg["id"]},"type": "{websocket_api.TYPE_RESULT}",'
         '"success":true,"result": ['
     ).encode()
-    # Concatenate cached entity registry item JSON serializations
-    inner = b",".join(
-        [
-            entry.partial_json_repr
-            for entry in registry.entities.values()
-            if entry.partial_json_repr is not None
-        ]
-    )
+    # Cached concatenation of the entity registry item JSON serializations
+    inner = registry.entities.get_partial_json_repr()
     msg_json = b"".join((msg_json_prefix, inner, b"]}"))
     connection.send_message(msg_json)
 
@@ -76,14 +70,8 @@ def websocket_list_entities_for_display(
         f'{{"id":{msg["id"]},"type":"{websocket_api.TYPE_RESULT}","success":true,'
         f'"result":{{"entity_categories":{_ENTITY_CATEGORIES_JSON},"entities":['
     ).encode()
-    # Concatenate cached entity registry item JSON serializations
-    inner = b",".join(
-        [
-            entry.display_json_repr
-            for entry in registry.entities.values()
-            if entry.disabled_by is None and entry.display_json_repr is not None
-        ]
-    )
+    # Cached concatenation of the entity registry item JSON serializations
+    inner = registry.entities.get_display_json_repr()
     msg_json = b"".join((msg_json_prefix, inner, b"]}}"))
     connection.send_message(msg_json)
 
@@ -0,0 +1,405 @@
+"""Materialized fossil energy consumption of the energy dashboard sources.
+
+The fossil energy of a source is its hourly energy change weighted by the
+fossil percentage of the grid during that hour. It only depends on the source
+and the CO2 signal statistic, so it is rolled up per day and month for each
+pair of them and the rollups are summed when answering a request. Hours are
+loaded from the database once and the rollups grow with later requests, only
+the hours that may still be compiled are loaded again.
+
+When the recorder compiles an hour, cached responses and the hours which were
+not final are dropped, and the rollups are extended with the hours compiled
+since their end. Rollups are only dropped when long term statistics were
+imported or modified.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import math
+from typing import Any
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.const import (
+    SIGNAL_STATISTICS_HOUR_COMPILED,
+    SIGNAL_STATISTICS_UPDATED,
+)
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+DATA_FOSSIL_ENERGY: HassKey[FossilEnergyRollups] = HassKey(f"{DOMAIN}_fossil_energy")
+
+MAX_CACHED_RESPONSES = 32
+MAX_ROLLUPS = 64
+
+HOUR_SECONDS = 3600.0
+
+type PeriodStartEnd = Callable[[float], tuple[float, float]]
+
+
+@dataclass(slots=True)
+class _SourceRollup:
+    """Fossil energy of one source, per hour and per day and month.
+
+    Hours in [start, end) are final. Hours after end are kept to answer the
+    request that loaded them, but are loaded again by later requests. A
+    period total only exists when the whole period is final.
+    """
+
+    start: float
+    end: float
+    hours: dict[float, float] = field(default_factory=dict)
+    periods: dict[str, dict[float, float]] = field(default_factory=dict)
+
+
+class FossilEnergyRollups:
+    """Answer fossil energy consumption requests from rolled up statistics."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the rollups."""
+        self.hass = hass
+        self._rollups: OrderedDict[tuple[str, str], _SourceRollup] = OrderedDict()
+        self._responses: OrderedDict[tuple[Any, ...], dict[str, float]] = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._generation = 0
+        self._responses_generation = 0
+        self._time_zone = dt_util.get_default_time_zone()
+        self._period_start_end: dict[str, PeriodStartEnd] = {}
+
+    @callback
+    def async_setup(self) -> None:
+        """Follow the statistics compiled or changed by the recorder."""
+        async_dispatcher_connect(
+            self.hass, SIGNAL_STATISTICS_HOUR_COMPILED, self.async_hour_compiled
+        )
+        async_dispatcher_connect(
+            self.hass, SIGNAL_STATISTICS_UPDATED, self.async_invalidate
+        )
+
+    @callback
+    def async_hour_compiled(self, compiled_end: datetime) -> None:
+        """Drop the hours which were not final and extend the rollups."""
+        self._responses_generation += 1
+        self._responses.clear()
+        for rollup in self._rollups.values():
+            hours = rollup.hours
+            for hour in [hour for hour in hours if hour >= rollup.end]:
+                del hours[hour]
+        if self._rollups:
+            self.hass.async_create_background_task(
+                self._async_extend(compiled_end.timestamp()),
+                "energy fossil energy rollups",
+            )
+
+    @callback
+    def async_invalidate(self) -> None:
+        """Drop all rollups and cached responses."""
+        self._generation += 1
+        self._responses_generation += 1
+        self._rollups.clear()
+        self._responses.clear()
+
+    async def async_get(
+        self,
+        start: float,
+        end: float,
+        energy_statistic_ids: Iterable[str],
+        co2_statistic_id: str,
+        period: str,
+    ) -> dict[str, float]:
+        """Return the fossil energy consumption per period."""
+        if self._time_zone is not dt_util.get_default_time_zone():
+            self._time_zone = dt_util.get_default_time_zone()
+            self._period_start_end.clear()
+            for rollup in self._rollups.values():
+                rollup.periods.clear()
+            self._responses.clear()
+
+        energy_ids = sorted(set(energy_statistic_ids))
+        key = (start, end, tuple(energy_ids), co2_statistic_id, period)
+        if (response := self._responses.get(key)) is not None:
+            self._responses.move_to_end(key)
+            return response
+
+        async with self._lock:
+            generation = self._responses_generation
+            rollups = await self._async_load(start, end, energy_ids, co2_statistic_id)
+            if period == "hour":
+                response = _reduce_hours(rollups, start, end)
+            else:
+                response = self._reduce_periods(
+                    rollups, start, end, "day" if period == "day" else "month"
+                )
+
+        if generation == self._responses_generation:
+            self._responses[key] = response
+            if len(self._responses) > MAX_CACHED_RESPONSES:
+                self._responses.popitem(last=False)
+        return response
+
+    async def _async_load(
+        self, start: float, end: float, energy_ids: list[str], co2_statistic_id: str
+    ) -> list[_SourceRollup]:
+        """Return the rollups of the sources, loading the hours they miss."""
+        while True:
+            generation = self._generation
+            ranges: dict[tuple[float, float], list[str]] = {}
+            for energy_id in energy_ids:
+                rollup = self._rollups.get((energy_id, co2_statistic_id))
+                if load_range := _missing_range(rollup, start, end):
+                    ranges.setdefault(load_range, []).append(energy_id)
+            loaded: list[tuple[float, float, dict[str, dict[float, float]]]] = []
+            for (load_start, load_end), load_ids in ranges.items():
+                hours = await recorder.get_instance(self.hass).async_add_executor_job(
+                    _load_fossil_energy,
+                    self.hass,
+                    load_start,
+                    load_end,
+                    load_ids,
+                    co2_statistic_id,
+                )
+                loaded.append((load_start, load_end, hours))
+            if generation == self._generation:
+                break
+            # Statistics changed while loading, load everything again
+
+        final_end = _final_end()
+        for load_start, load_end, hours in loaded:
+            for energy_id, source_hours in hours.items():
+                self._merge(
+                    (energy_id, co2_statistic_id),
+                    load_start,
+                    load_end,
+                    min(load_end, final_end),
+                    source_hours,
+                )
+
+        rollups: list[_SourceRollup] = []
+        for energy_id in energy_ids:
+            pair = (energy_id, co2_statistic_id)
+            rollups.append(self._rollups[pair])
+            self._rollups.move_to_end(pair)
+        while len(self._rollups) > MAX_ROLLUPS:
+            self._rollups.popitem(last=False)
+        return rollups
+
+    async def _async_extend(self, compiled_end: float) -> None:
+        """Load the hours compiled since the end of each rollup."""
+        async with self._lock:
+            generation = self._generation
+            ranges: dict[tuple[float, str], list[str]] = {}
+            for (energy_id, co2_statistic_id), rollup in self._rollups.items():
+                if rollup.end < compiled_end:
+                    ranges.setdefault((rollup.end, co2_statistic_id), []).append(
+                        energy_id
+                    )
+            for (load_start, co2_statistic_id), energy_ids in ranges.items():
+                hours = await recorder.get_instance(self.hass).async_add_executor_job(
+                    _load_fossil_energy,
+                    self.hass,
+                    load_start,
+                    compiled_end,
+                    energy_ids,
+                    co2_statistic_id,
+                )
+                if generation != self._generation:
+                    # Statistics changed while loading, the rollups are gone
+                    return
+                for energy_id, source_hours in hours.items():
+                    self._merge(
+                        (energy_id, co2_statistic_id),
+                        load_start,
+                        compiled_end,
+                        compiled_end,
+                        source_hours,
+                    )
+
+    def _merge(
+        self,
+        pair: tuple[str, str],
+        load_start: float,
+        load_end: float,
+        final_end: float,
+        source_hours: dict[float, float],
+    ) -> None:
+        """Merge loaded hours into the rollup of a source."""
+        if (rollup := self._rollups.get(pair)) is None:
+            rollup = self._rollups[pair] = _SourceRollup(
+                load_start, max(load_start, final_end)
+            )
+        else:
+            rollup.start = min(rollup.start, load_start)
+            rollup.end = max(rollup.end, final_end)
+        hours = rollup.hours
+        for hour in [hour for hour in hours if load_start <= hour < load_end]:
+            del hours[hour]
+        hours.update(source_hours)
+
+        # Total the periods which became final
+        for name, totals in rollup.periods.items():
+            period_start_end = self._get_period_start_end(name)
+            ts = load_start
+            while ts < load_end:
+                period_start, period_end = period_start_end(ts)
+                totals.pop(period_start, None)
+                if rollup.start <= period_start and period_end <= rollup.end:
+                    if (
+                        total := _sum_hours(hours, period_start, period_end)
+                    ) is not None:
+                        totals[period_start] = total
+                ts = period_end
+
+    def _reduce_periods(
+        self, rollups: list[_SourceRollup], start: float, end: float, name: str
+    ) -> dict[str, float]:
+        """Return the fossil energy per day or month."""
+        period_start_end = self._get_period_start_end(name)
+        result: dict[str, float] = {}
+        ts = start
+        while ts < end:
+            period_start, period_end = period_start_end(ts)
+            full = start <= period_start and period_end <= end
+            delta: float | None = None
+            for rollup in rollups:
+                if full:
+                    total = self._get_period_total(
+                        rollup, name, period_start, period_end
+                    )
+                else:
+                    total = _sum_hours(
+                        rollup.hours, max(start, period_start), min(end, period_end)
+                    )
+                if total is not None:
+                    delta = total if delta is None else delta + total
+            if delta is not None:
+                result[dt_util.utc_from_timestamp(period_start).isoformat()] = delta
+            ts = period_end
+        return result
+
+    def _get_period_total(
+        self, rollup: _SourceRollup, name: str, period_start: float, period_end: float
+    ) -> float | None:
+        """Return the total of a period, rolling it up if it is final."""
+        if not rollup.start <= period_start or not period_end <= rollup.end:
+            return _sum_hours(rollup.hours, period_start, period_end)
+        if (totals := rollup.periods.get(name)) is None:
+            totals = rollup.periods[name] = {}
+            period_start_end = self._get_period_start_end(name)
+            ts = rollup.start
+            while ts < rollup.end:
+                total_start, total_end = period_start_end(ts)
+                if rollup.start <= total_start and total_end <= rollup.end:
+                    if (
+                        total := _sum_hours(rollup.hours, total_start, total_end)
+                    ) is not None:
+                        totals[total_start] = total
+                ts = total_end
+        return totals.get(period_start)
+
+    def _get_period_start_end(self, name: str) -> PeriodStartEnd:
+        """Return the function finding the local day or month of a timestamp."""
+        if (period_start_end := self._period_start_end.get(name)) is None:
+            if name == "day":
+                _, period_start_end = recorder.statistics.reduce_day_ts_factory()
+            else:
+                _, period_start_end = recorder.statistics.reduce_month_ts_factory()
+            self._period_start_end[name] = period_start_end
+        return period_start_end
+
+
+@callback
+def async_get_fossil_energy_rollups(hass: HomeAssistant) -> FossilEnergyRollups:
+    """Return the fossil energy rollups, setting them up on first use."""
+    if (rollups := hass.data.get(DATA_FOSSIL_ENERGY)) is None:
+        rollups = hass.data[DATA_FOSSIL_ENERGY] = FossilEnergyRollups(hass)
+        rollups.async_setup()
+    return rollups
+
+
+def _final_end() -> float:
+    """Return the start of the first hour which may not be compiled yet."""
+    now = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    return (now - timedelta(hours=1)).timestamp()
+
+
+def _missing_range(
+    rollup: _SourceRollup | None, start: float, end: float
+) -> tuple[float, float] | None:
+    """Return the range to load for a rollup to cover start to end."""
+    if rollup is None:
+        return (start, end)
+    if start < rollup.start:
+        # The range also covers any gap between the request and the rollup
+        return (start, end if end > rollup.end else rollup.start)
+    if end > rollup.end:
+        return (rollup.end, end)
+    return None
+
+
+def _sum_hours(hours: dict[float, float], start: float, end: float) -> float | None:
+    """Return the total of the hours starting in [start, end), None if none."""
+    total: float | None = None
+    hour = math.ceil(start / HOUR_SECONDS) * HOUR_SECONDS
+    while hour < end:
+        if (delta := hours.get(hour)) is not None:
+            total = delta if total is None else total + delta
+        hour += HOUR_SECONDS
+    return total
+
+
+def _reduce_hours(
+    rollups: list[_SourceRollup], start: float, end: float
+) -> dict[str, float]:
+    """Return the fossil energy per hour."""
+    result: dict[str, float] = {}
+    hour = math.ceil(start / HOUR_SECONDS) * HOUR_SECONDS
+    while hour < end:
+        delta: float | None = None
+        for rollup in rollups:
+            if (source_delta := rollup.hours.get(hour)) is not None:
+                delta = source_delta if delta is None else delta + source_delta
+        if delta is not None:
+            result[dt_util.utc_from_timestamp(hour).isoformat()] = delta
+        hour += HOUR_SECONDS
+    return result
+
+
+def _load_fossil_energy(
+    hass: HomeAssistant,
+    start: float,
+    end: float,
+    energy_statistic_ids: list[str],
+    co2_statistic_id: str,
+) -> dict[str, dict[float, float]]:
+    """Load the hourly fossil energy of the sources."""
+    statistics = recorder.statistics.statistics_during_period(
+        hass,
+        dt_util.utc_from_timestamp(start),
+        dt_util.utc_from_timestamp(end),
+        {*energy_statistic_ids, co2_statistic_id},
+        "hour",
+        {"energy": UnitOfEnergy.KILO_WATT_HOUR},
+        {"mean", "change"},
+    )
+    co2_means: dict[float, float] = {
+        row["start"]: row["mean"]  # type: ignore[misc]
+        for row in statistics.get(co2_statistic_id, ())
+    }
+    result: dict[str, dict[float, float]] = {}
+    for energy_id in energy_statistic_ids:
+        # Assume 100% fossil if the fossil percentage is missing
+        result[energy_id] = {
+            row["start"]: change * co2_means.get(row["start"], 100) / 100
+            for row in statistics.get(energy_id, ())
+            if (change := row["change"]) is not None
+        }
+    return result
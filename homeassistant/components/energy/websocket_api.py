@@ -3,18 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
 from collections.abc import Callable, Coroutine
-from datetime import timedelta
 import functools
-from itertools import chain
 from typing import Any, cast
 
 import voluptuous as vol
 
-from homeassistant.components import recorder, websocket_api
-from homeassistant.components.recorder.statistics import StatisticsRow
-from homeassistant.const import UnitOfEnergy
+from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
@@ -30,6 +25,7 @@ from .data import (
     EnergyPreferencesUpdate,
     async_get_manager,
 )
+from .fossil import async_get_fossil_energy_rollups
 from .types import EnergyPlatform, GetSolarForecastType, SolarForecastType
 from .validate import async_validate
 
@@ -268,114 +264,11 @@ async def ws_get_fossil_energy_consumption(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
-    statistic_ids = set(msg["energy_statistic_ids"])
-    statistic_ids.add(msg["co2_statistic_id"])
-
-    # Fetch energy + CO2 statistics
-    statistics = await recorder.get_instance(hass).async_add_executor_job(
-        recorder.statistics.statistics_during_period,
-        hass,
-        start_time,
-        end_time,
-        statistic_ids,
-        "hour",
-        {"energy": UnitOfEnergy.KILO_WATT_HOUR},
-        {"mean", "change"},
+    result = await async_get_fossil_energy_rollups(hass).async_get(
+        start_time.timestamp(),
+        end_time.timestamp(),
+        msg["energy_statistic_ids"],
+        msg["co2_statistic_id"],
+        msg["period"],
     )
-
-    def _combine_change_statistics(
-        stats: dict[str, list[StatisticsRow]], statistic_ids: list[str]
-    ) -> dict[float, float]:
-        """Combine multiple statistics, returns a dict indexed by start time."""
-        result: defaultdict[float, float] = defaultdict(float)
-
-        for statistics_id, stat in stats.items():
-            if statistics_id not in statistic_ids:
-                continue
-            for period in stat:
-                if period["change"] is None:
-                    continue
-                result[period["start"]] += period["change"]
-
-        return {key: result[key] for key in sorted(result)}
-
-    def _reduce_deltas(
-        stat_list: list[dict[str, Any]],
-        same_period: Callable[[float, float], bool],
-        period_start_end: Callable[[float], tuple[float, float]],
-        period: timedelta,
-    ) -> list[dict[str, Any]]:
-        """Reduce hourly deltas to daily or monthly deltas."""
-        result: list[dict[str, Any]] = []
-        deltas: list[float] = []
-        if not stat_list:
-            return result
-        prev_stat: dict[str, Any] = stat_list[0]
-        fake_stat = {"start": stat_list[-1]["start"] + period.total_seconds()}
-
-        # Loop over the hourly deltas + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_stat,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, _ = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                result.append(
-                    {
-                        "start": dt_util.utc_from_timestamp(start).isoformat(),
-                        "delta": sum(deltas),
-                    }
-                )
-                deltas = []
-            if statistic.get("delta") is not None:
-                deltas.append(statistic["delta"])
-            prev_stat = statistic
-
-        return result
-
-    merged_energy_statistics = _combine_change_statistics(
-        statistics, msg["energy_statistic_ids"]
-    )
-    indexed_co2_statistics = cast(
-        dict[float, float],
-        {
-            period["start"]: period["mean"]
-            for period in statistics.get(msg["co2_statistic_id"], {})
-        },
-    )
-
-    # Calculate amount of fossil based energy, assume 100% fossil if missing
-    fossil_energy = [
-        {"start": start, "delta": delta * indexed_co2_statistics.get(start, 100) / 100}
-        for start, delta in merged_energy_statistics.items()
-    ]
-
-    if msg["period"] == "hour":
-        reduced_fossil_energy = [
-            {
-                "start": dt_util.utc_from_timestamp(period["start"]).isoformat(),
-                "delta": period["delta"],
-            }
-            for period in fossil_energy
-        ]
-
-    elif msg["period"] == "day":
-        _same_day_ts, _day_start_end_ts = recorder.statistics.reduce_day_ts_factory()
-        reduced_fossil_energy = _reduce_deltas(
-            fossil_energy,
-            _same_day_ts,
-            _day_start_end_ts,
-            timedelta(days=1),
-        )
-    else:
-        (
-            _same_month_ts,
-            _month_start_end_ts,
-        ) = recorder.statistics.reduce_month_ts_factory()
-        reduced_fossil_energy = _reduce_deltas(
-            fossil_energy,
-            _same_month_ts,
-            _month_start_end_ts,
-            timedelta(days=1),
-        )
-
-    result = {period["start"]: period["delta"] for period in reduced_fossil_energy}
     connection.send_result(msg["id"], result)
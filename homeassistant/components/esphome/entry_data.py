@@ -132,6 +132,12 @@ class RuntimeEntryData:
     state_subscriptions: dict[tuple[type[EntityState], int], CALLBACK_TYPE] = field(
         default_factory=dict
     )
+    # State updates waiting to be dispatched together in the next loop
+    # iteration, a dict is used as an ordered set.
+    _pending_state_updates: dict[tuple[type[EntityState], int], None] = field(
+        default_factory=dict
+    )
+    _pending_state_updates_handle: asyncio.Handle | None = None
     device_update_subscriptions: set[CALLBACK_TYPE] = field(default_factory=set)
     static_info_update_subscriptions: set[Callable[[list[EntityInfo]], None]] = field(
         default_factory=set
@@ -369,27 +375,66 @@ class RuntimeEntryData:
 
     @callback
     def async_update_state(self, state: EntityState) -> None:
-        """Distribute an update of state information to the target."""
+        """Distribute an update of state information to the target.
+
+        The first update is dispatched right away, the updates following
+        it in the same loop iteration are dispatched together in the next
+        one so an entity updated several times in a burst only writes its
+        latest state. Camera images, events and force update sensors are
+        always dispatched right away since every update has to be seen.
+        """
         key = state.key
         state_type = type(state)
         stale_state = self.stale_state
         current_state_by_type = self.state[state_type]
         current_state = current_state_by_type.get(key, _SENTINEL)
         subscription_key = (state_type, key)
+        dispatch_now = state_type in (CameraState, Event) or bool(
+            state_type is SensorState
+            and (platform_info := self.info.get(SensorInfo))
+            and (entity_info := platform_info.get(state.key))
+            and (cast(SensorInfo, entity_info)).force_update
+        )
         if (
             current_state == state
             and subscription_key not in stale_state
-            and state_type not in (CameraState, Event)
-            and not (
-                state_type is SensorState
-                and (platform_info := self.info.get(SensorInfo))
-                and (entity_info := platform_info.get(state.key))
-                and (cast(SensorInfo, entity_info)).force_update
-            )
+            and not dispatch_now
         ):
             return
         stale_state.discard(subscription_key)
         current_state_by_type[key] = state
+        if self._pending_state_updates_handle is not None and not dispatch_now:
+            # A burst is in progress, dispatch with the rest of it
+            self._pending_state_updates[subscription_key] = None
+            return
+        if self._pending_state_updates_handle is None:
+            self._pending_state_updates_handle = asyncio.get_running_loop().call_soon(
+                self._async_dispatch_pending_state_updates
+            )
+        self._async_dispatch_state_update(subscription_key)
+
+    @callback
+    def _async_dispatch_pending_state_updates(self) -> None:
+        """Dispatch the state updates received since the last dispatch."""
+        self._pending_state_updates_handle = None
+        pending_state_updates = self._pending_state_updates
+        self._pending_state_updates = {}
+        for subscription_key in pending_state_updates:
+            self._async_dispatch_state_update(subscription_key)
+
+    @callback
+    def _async_cancel_pending_state_updates(self) -> None:
+        """Drop the state updates waiting to be dispatched."""
+        if self._pending_state_updates_handle is not None:
+            self._pending_state_updates_handle.cancel()
+            self._pending_state_updates_handle = None
+        self._pending_state_updates.clear()
+
+    @callback
+    def _async_dispatch_state_update(
+        self, subscription_key: tuple[type[EntityState], int]
+    ) -> None:
+        """Call the subscription of a state."""
         if subscription := self.state_subscriptions.get(subscription_key):
             try:
                 subscription()
@@ -456,6 +501,7 @@ class RuntimeEntryData:
 
     async def async_cleanup(self) -> None:
         """Cleanup the entry data when disconnected or unloading."""
+        self._async_cancel_pending_state_updates()
         if self._pending_storage:
             # Ensure we save the data if we are unloading before the
             # save delay has passed.
@@ -478,6 +524,7 @@ class RuntimeEntryData:
         self.available = False
         if self.bluetooth_device:
             self.bluetooth_device.available = False
+        self._async_cancel_pending_state_updates()
         # Make a copy since calling the disconnect callbacks
         # may also try to discard/remove themselves.
         for disconnect_cb in self.disconnect_callbacks.copy():
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from collections import Counter, deque
 from copy import copy
 from dataclasses import dataclass
@@ -297,6 +298,67 @@ class SensorFilter(SensorEntity):
         if update_ha:
             self.async_write_ha_state()
 
+    @callback
+    def _replay_history(self, states: list[State]) -> None:
+        """Replay states through the filter chain without writing them.
+
+        Runs of states in the current unit are filtered as a batch. A state in
+        another unit goes through the per-state path, which resets the filters
+        once such a state makes it through the chain.
+        """
+        idx = 0
+        while idx < len(states):
+            unit = states[idx].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            if unit != self._attr_native_unit_of_measurement:
+                self._update_filter_sensor_state(states[idx], False)
+                idx += 1
+                continue
+            end = idx + 1
+            while (
+                end < len(states)
+                and states[end].attributes.get(ATTR_UNIT_OF_MEASUREMENT) == unit
+            ):
+                end += 1
+            self._update_filter_sensor_states(states[idx:end])
+            idx = end
+
+    @callback
+    def _update_filter_sensor_states(self, states: list[State]) -> None:
+        """Process a batch of states in the current unit without writing them.
+
+        Gives the same result as passing each state to
+        _update_filter_sensor_state in turn.
+        """
+        self._attr_available = True
+        indexes = list(range(len(states)))
+        timestamps = [state.last_updated for state in states]
+        values: list[str | float | int] = [state.state for state in states]
+        for filt in self._filters:
+            passed = filt.filter_values(timestamps, values)
+            kept: list[int] = []
+            for position, result in enumerate(passed):
+                if result:
+                    kept.append(position)
+                elif result is None:
+                    state = states[indexes[position]]
+                    _LOGGER.error(
+                        "Could not convert state: %s (%s) to number",
+                        state.state,
+                        type(state.state),
+                    )
+            if len(kept) != len(indexes):
+                indexes = [indexes[position] for position in kept]
+                timestamps = [timestamps[position] for position in kept]
+                values = [values[position] for position in kept]
+            if not indexes:
+                return
+
+        new_state = states[indexes[-1]]
+        self._state = values[-1]
+        self._attr_icon = new_state.attributes.get(ATTR_ICON, ICON)
+        self._attr_device_class = new_state.attributes.get(ATTR_DEVICE_CLASS)
+        self._attr_state_class = new_state.attributes.get(ATTR_STATE_CLASS)
+
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
 
@@ -332,13 +394,8 @@ class SensorFilter(SensorEntity):
                     history_list.extend(filter_history[self._entity])
             if largest_window_time > timedelta(seconds=0):
                 start = dt_util.utcnow() - largest_window_time
-                filter_history = await get_instance(self.hass).async_add_executor_job(
-                    partial(
-                        history.state_changes_during_period,
-                        self.hass,
-                        start,
-                        entity_id=self._entity,
-                    )
+                filter_history = await history.async_state_changes_during_period(
+                    self.hass, start, entity_id=self._entity
                 )
                 if self._entity in filter_history:
                     history_list.extend(
@@ -357,9 +414,13 @@ class SensorFilter(SensorEntity):
             )
 
             # Replay history through the filter chain
-            for state in history_list:
-                if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]:
-                    self._update_filter_sensor_state(state, False)
+            self._replay_history(
+                [
+                    state
+                    for state in history_list
+                    if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]
+                ]
+            )
 
         @callback
         def _async_hass_started(hass: HomeAssistant) -> None:
@@ -396,9 +457,7 @@ class FilterState:
 
     def set_precision(self, precision: int | None) -> None:
         """Set precision of Number based states."""
-        if precision is not None and isinstance(self.state, Number):
-            value = round(float(self.state), precision)
-            self.state = int(value) if precision == 0 else value
+        self.state = _round(self.state, precision)
 
     def __str__(self) -> str:
         """Return state as the string representation of FilterState."""
@@ -409,6 +468,29 @@ class FilterState:
         return f"{self.timestamp} : {self.state}"
 
 
+def _to_number(value: str | float) -> str | float:
+    """Convert a value to float like FilterState does, if it is a number."""
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _round(value: str | float, precision: int | None) -> str | float:
+    """Round a number like FilterState.set_precision does."""
+    if precision is not None and isinstance(value, Number):
+        rounded = round(float(value), precision)
+        return int(rounded) if precision == 0 else rounded
+    return value
+
+
+def _stored_state(timestamp: datetime, value: str | float) -> FilterState:
+    """Create the window entry filter_state would have stored for a value."""
+    stored = FilterState(_State(timestamp, value))
+    stored.state = value
+    return stored
+
+
 @dataclass
 class _State:
     """Simplified State class.
@@ -474,6 +556,38 @@ class Filter:
         """Implement filter."""
         raise NotImplementedError
 
+    def filter_values(
+        self, timestamps: list[datetime], values: list[str | float | int]
+    ) -> list[bool | None]:
+        """Filter a batch of values in place.
+
+        Gives the same results as passing each value to filter_state in turn.
+        Returns for each value True if it passed the filter, False if it was
+        skipped and None if it is not a number while the filter needs one.
+        """
+        passed: list[bool | None] = []
+        for idx, timestamp in enumerate(timestamps):
+            try:
+                filtered = self.filter_state(_State(timestamp, values[idx]))
+            except ValueError:
+                passed.append(None)
+                continue
+            values[idx] = filtered.state
+            passed.append(not self._skip_processing)
+        return passed
+
+    def _store_values(
+        self,
+        timestamps: list[datetime],
+        values: list[str | float | int],
+        indexes: list[int],
+    ) -> None:
+        """Store the window entries for the processed values of a batch."""
+        if maxlen := self.states.maxlen:
+            self.states.extend(
+                _stored_state(timestamps[idx], values[idx]) for idx in indexes[-maxlen:]
+            )
+
     def filter_state(self, new_state: _State) -> _State:
         """Implement a common interface for filters."""
         fstate = FilterState(new_state)
@@ -549,6 +663,30 @@ class RangeFilter(Filter, SensorEntity):
 
         return new_state
 
+    def filter_values(
+        self, timestamps: list[datetime], values: list[str | float | int]
+    ) -> list[bool | None]:
+        """Filter a batch of values in place."""
+        passed: list[bool | None] = []
+        processed: list[int] = []
+        upper_bound = self._upper_bound
+        lower_bound = self._lower_bound
+        for idx, value in enumerate(values):
+            if not isinstance(number := _to_number(value), float):
+                passed.append(None)
+                continue
+            if upper_bound is not None and number > upper_bound:
+                self._stats_internal["erasures_up"] += 1
+                number = upper_bound
+            elif lower_bound is not None and number < lower_bound:
+                self._stats_internal["erasures_low"] += 1
+                number = lower_bound
+            values[idx] = _round(number, self.filter_precision)
+            processed.append(idx)
+            passed.append(True)
+        self._store_values(timestamps, values, processed)
+        return passed
+
 
 @FILTERS.register(FILTER_NAME_OUTLIER)
 class OutlierFilter(Filter, SensorEntity):
@@ -599,6 +737,45 @@ class OutlierFilter(Filter, SensorEntity):
             new_state.state = median
         return new_state
 
+    def filter_values(
+        self, timestamps: list[datetime], values: list[str | float | int]
+    ) -> list[bool | None]:
+        """Filter a batch of values in place.
+
+        Keeps the window sorted so the median does not need a sort per value.
+        """
+        passed: list[bool | None] = []
+        processed: list[int] = []
+        raw_values: list[str | float | int] = [0.0] * len(values)
+        maxlen = self.states.maxlen
+        window = deque(cast(float, state.state) for state in self.states)
+        ordered = sorted(window)
+        for idx, value in enumerate(values):
+            if not isinstance(number := _to_number(value), float):
+                passed.append(None)
+                continue
+            median: float = 0
+            if ordered:
+                half, odd = divmod(len(ordered), 2)
+                median = (
+                    ordered[half] if odd else (ordered[half - 1] + ordered[half]) / 2
+                )
+            if len(window) == maxlen and abs(number - median) > self._radius:
+                self._stats_internal["erasures"] += 1
+                values[idx] = _round(median, self.filter_precision)
+            else:
+                values[idx] = _round(number, self.filter_precision)
+            if maxlen:
+                if len(window) == maxlen:
+                    del ordered[bisect_left(ordered, window.popleft())]
+                window.append(number)
+                insort(ordered, number)
+            raw_values[idx] = number
+            processed.append(idx)
+            passed.append(True)
+        self._store_values(timestamps, raw_values, processed)
+        return passed
+
 
 @FILTERS.register(FILTER_NAME_LOWPASS)
 class LowPassFilter(Filter, SensorEntity):
@@ -633,6 +810,32 @@ class LowPassFilter(Filter, SensorEntity):
 
         return new_state
 
+    def filter_values(
+        self, timestamps: list[datetime], values: list[str | float | int]
+    ) -> list[bool | None]:
+        """Filter a batch of values in place."""
+        passed: list[bool | None] = []
+        processed: list[int] = []
+        new_weight = 1.0 / self._time_constant
+        prev_weight = 1.0 - new_weight
+        prev_value: float | None = None
+        if self.states:
+            prev_value = cast(float, self.states[-1].state)
+        for idx, value in enumerate(values):
+            if not isinstance(number := _to_number(value), float):
+                passed.append(None)
+                continue
+            if prev_value is not None:
+                number = prev_weight * prev_value + new_weight * number
+            filtered = _round(number, self.filter_precision)
+            values[idx] = filtered
+            if self.states.maxlen:
+                prev_value = cast(float, filtered)
+            processed.append(idx)
+            passed.append(True)
+        self._store_values(timestamps, values, processed)
+        return passed
+
 
 @FILTERS.register(FILTER_NAME_TIME_SMA)
 class TimeSMAFilter(Filter, SensorEntity):
@@ -688,6 +891,70 @@ class TimeSMAFilter(Filter, SensorEntity):
 
         return new_state
 
+    def filter_values(
+        self, timestamps: list[datetime], values: list[str | float | int]
+    ) -> list[bool | None]:
+        """Filter a batch of values in place.
+
+        The queue holds (timestamp, value, seconds since the previous entry)
+        tuples, so only the first entry needs datetime arithmetic per value.
+        """
+        passed: list[bool | None] = []
+        time_window = self._time_window
+        window_seconds = time_window.total_seconds()
+        queue: deque[tuple[datetime, float, float]] = deque()
+        prev_timestamp: datetime | None = None
+        for state in self.queue:
+            queue.append(
+                (
+                    state.timestamp,
+                    cast(float, state.state),
+                    (state.timestamp - prev_timestamp).total_seconds()
+                    if prev_timestamp
+                    else 0.0,
+                )
+            )
+            prev_timestamp = state.timestamp
+        last_leak: tuple[datetime, float, float] | None = None
+        if self.last_leak is not None:
+            last_leak = (
+                self.last_leak.timestamp,
+                cast(float, self.last_leak.state),
+                0.0,
+            )
+        for idx, value in enumerate(values):
+            if not isinstance(number := _to_number(value), float):
+                passed.append(None)
+                continue
+            timestamp = timestamps[idx]
+            while queue and queue[0][0] + time_window <= timestamp:
+                last_leak = queue.popleft()
+            queue.append(
+                (
+                    timestamp,
+                    number,
+                    (timestamp - queue[-1][0]).total_seconds() if queue else 0.0,
+                )
+            )
+            first_timestamp, first_value, _ = queue[0]
+            prev_value = last_leak[1] if last_leak is not None else first_value
+            moving_sum: float = (
+                first_timestamp - (timestamp - time_window)
+            ).total_seconds() * prev_value
+            prev_value = first_value
+            for entry_index in range(1, len(queue)):
+                _, entry_value, seconds = queue[entry_index]
+                moving_sum += seconds * prev_value
+                prev_value = entry_value
+            values[idx] = _round(moving_sum / window_seconds, self.filter_precision)
+            passed.append(True)
+        self.queue = deque(
+            _stored_state(timestamp, value) for timestamp, value, _ in queue
+        )
+        if last_leak is not None:
+            self.last_leak = _stored_state(last_leak[0], last_leak[1])
+        return passed
+
 
 @FILTERS.register(FILTER_NAME_THROTTLE)
 class ThrottleFilter(Filter, SensorEntity):
@@ -715,6 +982,32 @@ class ThrottleFilter(Filter, SensorEntity):
 
         return new_state
 
+    def filter_values(
+        self, timestamps: list[datetime], values: list[str | float | int]
+    ) -> list[bool | None]:
+        """Filter a batch of values in place."""
+        passed: list[bool | None] = []
+        maxlen = self.states.maxlen
+        count = len(self.states)
+        cleared_at: int | None = None
+        for idx, value in enumerate(values):
+            values[idx] = _round(_to_number(value), self.filter_precision)
+            if not count or count == maxlen:
+                count = 0
+                cleared_at = idx
+                passed.append(True)
+            else:
+                passed.append(False)
+            count += 1
+        if cleared_at is not None:
+            self.states.clear()
+            self._store_values(timestamps, values, list(range(cleared_at, len(values))))
+        else:
+            self._store_values(timestamps, values, list(range(len(values))))
+        if passed:
+            self._skip_processing = not passed[-1]
+        return passed
+
 
 @FILTERS.register(FILTER_NAME_TIME_THROTTLE)
 class TimeThrottleFilter(Filter, SensorEntity):
@@ -744,3 +1037,23 @@ class TimeThrottleFilter(Filter, SensorEntity):
             self._skip_processing = True
 
         return new_state
+
+    def filter_values(
+        self, timestamps: list[datetime], values: list[str | float | int]
+    ) -> list[bool | None]:
+        """Filter a batch of values in place."""
+        passed: list[bool | None] = []
+        time_window = self._time_window
+        last_emitted_at = self._last_emitted_at
+        for idx, value in enumerate(values):
+            values[idx] = _round(_to_number(value), self.filter_precision)
+            timestamp = timestamps[idx]
+            if not last_emitted_at or last_emitted_at <= timestamp - time_window:
+                last_emitted_at = timestamp
+                passed.append(True)
+            else:
+                passed.append(False)
+        self._last_emitted_at = last_emitted_at
+        if passed:
+            self._skip_processing = not passed[-1]
+        return passed
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections import deque
 import logging
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
@@ -14,6 +13,7 @@ from homeassistant.core import (
     EventStateChangedData,
     HassJob,
     HomeAssistant,
+    State,
     callback,
 )
 from homeassistant.helpers.event import async_call_later
@@ -23,6 +23,7 @@ from .const import DOMAIN
 from .error import SmartHomeError
 from .helpers import (
     AbstractConfig,
+    GoogleEntity,
     async_get_entities,
     async_get_google_entity_if_supported_cached,
 )
@@ -44,23 +45,20 @@ def async_enable_report_state(
     """Enable state and notification reporting."""
     checker = None
     unsub_pending: CALLBACK_TYPE | None = None
-    pending: deque[dict[str, Any]] = deque([{}])
+    # Latest serialized state of each entity changed since the last report
+    pending: dict[str, dict[str, Any]] = {}
 
     async def report_states(now=None):
         """Report the states."""
         nonlocal pending
         nonlocal unsub_pending
 
-        pending.append({})
+        states = pending
+        pending = {}
+        await google_config.async_report_state_all({"devices": {"states": states}})
 
-        # We will report all batches except last one because those are finalized.
-        while len(pending) > 1:
-            await google_config.async_report_state_all(
-                {"devices": {"states": pending.popleft()}}
-            )
-
-        # If things got queued up in last batch while we were reporting, schedule ourselves again
-        if pending[0]:
+        # If things got queued up while we were reporting, schedule ourselves again
+        if pending:
             unsub_pending = async_call_later(
                 hass, REPORT_STATE_WINDOW, report_states_job
             )
@@ -75,23 +73,64 @@ def async_enable_report_state(
             hass.is_running
             and (new_state := data["new_state"])
             and google_config.should_expose(new_state)
-            and async_get_google_entity_if_supported_cached(
-                hass, google_config, new_state
-            )
         )
 
-    async def _async_entity_state_listener(event: Event[EventStateChangedData]) -> None:
+    @callback
+    def _async_queue_state(new_state: State, entity: GoogleEntity) -> None:
+        """Queue the state of an entity for the next report."""
+        nonlocal unsub_pending
+        changed_entity = new_state.entity_id
+        try:
+            entity_data = entity.query_serialize()
+        except SmartHomeError as err:
+            _LOGGER.debug("Not reporting state for %s: %s", changed_entity, err.code)
+            return
+
+        assert checker is not None
+        if not checker.async_is_significant_change(new_state, extra_arg=entity_data):
+            return
+
+        _LOGGER.debug("Scheduling report state for %s: %s", changed_entity, entity_data)
+
+        # Report State only needs the latest state, an entity changing again
+        # before the report replaces its pending state instead of adding a report
+        pending[changed_entity] = entity_data
+
+        if unsub_pending is None:
+            unsub_pending = async_call_later(
+                hass, REPORT_STATE_WINDOW, report_states_job
+            )
+
+    async def _async_notify_and_queue_state(
+        new_state: State, entity: GoogleEntity, notifications: dict[str, Any]
+    ) -> None:
+        """Send an event notification before queuing the state."""
+        entity_id = new_state.entity_id
+        event_id = uuid4().hex
+        payload = {"devices": {"notifications": {entity_id: notifications}}}
+        _LOGGER.info("Sending event notification for entity %s", entity_id)
+        result = await google_config.async_sync_notification_all(event_id, payload)
+        if result != 200:
+            _LOGGER.error(
+                "Unable to send notification with result code: %s, check log for more"
+                " info",
+                result,
+            )
+        _async_queue_state(new_state, entity)
+
+    @callback
+    def _async_entity_state_listener(event: Event[EventStateChangedData]) -> None:
         """Handle state changes."""
-        nonlocal unsub_pending, checker
         data = event.data
         new_state = data["new_state"]
         if TYPE_CHECKING:
             assert new_state is not None  # verified in filter
-        entity = async_get_google_entity_if_supported_cached(
-            hass, google_config, new_state
-        )
-        if TYPE_CHECKING:
-            assert entity is not None  # verified in filter
+        if not (
+            entity := async_get_google_entity_if_supported_cached(
+                hass, google_config, new_state
+            )
+        ):
+            return
 
         # We only trigger notifications on changes in the state value, not attributes.
         # This is mainly designed for our event entity types
@@ -102,46 +141,14 @@ def async_enable_report_state(
             and old_state.state != new_state.state
             and (notifications := entity.notifications_serialize()) is not None
         ):
-            event_id = uuid4().hex
-            payload = {
-                "devices": {"notifications": {entity.state.entity_id: notifications}}
-            }
-            _LOGGER.info(
-                "Sending event notification for entity %s",
-                entity.state.entity_id,
+            # The state is only queued once the notification was sent
+            hass.async_create_task(
+                _async_notify_and_queue_state(new_state, entity, notifications),
+                "google_assistant report_state notification",
             )
-            result = await google_config.async_sync_notification_all(event_id, payload)
-            if result != 200:
-                _LOGGER.error(
-                    "Unable to send notification with result code: %s, check log for more"
-                    " info",
-                    result,
-                )
-
-        changed_entity = data["entity_id"]
-        try:
-            entity_data = entity.query_serialize()
-        except SmartHomeError as err:
-            _LOGGER.debug("Not reporting state for %s: %s", changed_entity, err.code)
             return
 
-        assert checker is not None
-        if not checker.async_is_significant_change(new_state, extra_arg=entity_data):
-            return
-
-        _LOGGER.debug("Scheduling report state for %s: %s", changed_entity, entity_data)
-
-        # If a significant change is already scheduled and we have another significant one,
-        # let's create a new batch of changes
-        if changed_entity in pending[-1]:
-            pending.append({})
-
-        pending[-1][changed_entity] = entity_data
-
-        if unsub_pending is None:
-            unsub_pending = async_call_later(
-                hass, REPORT_STATE_WINDOW, report_states_job
-            )
+        _async_queue_state(new_state, entity)
 
     @callback
     def extra_significant_check(
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from datetime import timedelta
 import logging
-from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import (
@@ -16,7 +15,6 @@ from homeassistant.core import (
 )
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.event import async_track_state_change_event
-from homeassistant.helpers.start import async_at_start
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .data import HistoryStats, HistoryStatsState
@@ -40,7 +38,6 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
         """Initialize DataUpdateCoordinator."""
         self._history_stats = history_stats
         self._subscriber_count = 0
-        self._at_start_listener: CALLBACK_TYPE | None = None
         self._track_events_listener: CALLBACK_TYPE | None = None
         super().__init__(
             hass,
@@ -73,21 +70,15 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
         if self._track_events_listener:
             self._track_events_listener()
             self._track_events_listener = None
-        if self._at_start_listener:
-            self._at_start_listener()
-            self._at_start_listener = None
+        self._history_stats.async_release()
 
     @callback
     def _async_add_listener(self) -> None:
-        """Add a listener to start tracking state changes after start."""
-        self._at_start_listener = async_at_start(
-            self.hass, self._async_add_events_listener
-        )
+        """Add a listener to start tracking state changes.
 
-    @callback
-    def _async_add_events_listener(self, *_: Any) -> None:
-        """Handle hass starting and start tracking events."""
-        self._at_start_listener = None
+        The shared history is only fetched once, so state changes are
+        tracked right away, also while Home Assistant is starting.
+        """
         self._track_events_listener = async_track_state_change_event(
             self.hass, [self._history_stats.entity_id], self._async_update_from_event
         )
@@ -2,18 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
+from bisect import bisect_right
 from dataclasses import dataclass
 import datetime
+from operator import attrgetter
 
-from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.components.recorder import history
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
+from .const import DOMAIN
 from .helpers import async_calculate_period, floored_timestamp
 
 MIN_TIME_UTC = datetime.datetime.min.replace(tzinfo=dt_util.UTC)
 
+DATA_ENTITY_HISTORY: HassKey[dict[str, EntityHistory]] = HassKey(
+    f"{DOMAIN}_entity_history"
+)
+
+_last_changed = attrgetter("last_changed")
+
 
 @dataclass
 class HistoryStatsState:
@@ -32,6 +49,122 @@ class HistoryState:
     last_changed: float
 
 
+@dataclass(slots=True)
+class PeriodTotals:
+    """The running totals of the states of a period folded so far."""
+
+    start: float
+    end: float
+    generation: int
+    next_index: int
+    last_changed: float
+    last_matches: bool | None = None
+    seconds_matched: float = 0.0
+    match_count: int = 0
+
+
+@callback
+def async_get_entity_history(hass: HomeAssistant, entity_id: str) -> EntityHistory:
+    """Return the shared history of an entity."""
+    entity_histories = hass.data.setdefault(DATA_ENTITY_HISTORY, {})
+    if (entity_history := entity_histories.get(entity_id)) is None:
+        entity_history = entity_histories[entity_id] = EntityHistory(hass, entity_id)
+    return entity_history
+
+
+class EntityHistory:
+    """The history of an entity shared by all history stats watching it.
+
+    The history is fetched from the recorder once, from the earliest period
+    start of the history stats, and then kept up to date from state changed
+    events. States older than needed by any of the history stats are dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Init the entity history."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self.states: list[HistoryState] = []
+        # The number of states dropped from the front, so history stats can
+        # refer to states by an index that does not move
+        self.offset = 0
+        # Bumped every time the states are replaced by a fetch
+        self.generation = 0
+        self._start: float | None = None
+        self._period_starts: dict[HistoryStats, float] = {}
+        self._fetch_lock = asyncio.Lock()
+
+    @callback
+    def async_add_state(self, state: State) -> None:
+        """Add a state from a state changed event."""
+        last_changed = state.last_changed.timestamp()
+        # The same event is added by every history stats of the entity
+        if self.states and self.states[-1].last_changed >= last_changed:
+            return
+        self.states.append(HistoryState(state.state, last_changed))
+
+    async def async_set_period(
+        self, history_stats: HistoryStats, start_timestamp: float, end_timestamp: float
+    ) -> None:
+        """Make sure the history covers the period of history stats."""
+        self._period_starts[history_stats] = start_timestamp
+        if self._start is None or start_timestamp < self._start:
+            async with self._fetch_lock:
+                if self._start is None or start_timestamp < self._start:
+                    await self._async_history_from_db(start_timestamp, end_timestamp)
+        self._async_drop_old_states()
+
+    @callback
+    def async_remove(self, history_stats: HistoryStats) -> None:
+        """Remove history stats, dropping the history once unused."""
+        self._period_starts.pop(history_stats, None)
+        if not self._period_starts:
+            entity_histories = self.hass.data[DATA_ENTITY_HISTORY]
+            if entity_histories.get(self.entity_id) is self:
+                del entity_histories[self.entity_id]
+
+    async def _async_history_from_db(
+        self, start_timestamp: float, end_timestamp: float
+    ) -> None:
+        """Fetch the history from the start timestamp until now."""
+        # Later states are added from state changed events
+        end_timestamp = max(end_timestamp, floored_timestamp(dt_util.utcnow()))
+        states = (
+            await history.async_state_changes_during_period(
+                self.hass,
+                dt_util.utc_from_timestamp(start_timestamp),
+                dt_util.utc_from_timestamp(end_timestamp),
+                self.entity_id,
+                include_start_time_state=True,
+                no_attributes=True,
+            )
+        ).get(self.entity_id, [])
+        fetched = [
+            HistoryState(state.state, state.last_changed.timestamp())
+            for state in states
+        ]
+        # Keep the states added while the recorder had not written them yet
+        last_fetched = fetched[-1].last_changed if fetched else start_timestamp
+        fetched.extend(
+            state for state in self.states if state.last_changed > last_fetched
+        )
+        self.states = fetched
+        self.offset = 0
+        self.generation += 1
+        self._start = start_timestamp
+
+    @callback
+    def _async_drop_old_states(self) -> None:
+        """Drop the states before the state at the earliest period start."""
+        assert self._start is not None
+        earliest_start = min(self._period_starts.values())
+        index = bisect_right(self.states, earliest_start, key=_last_changed) - 1
+        if index > 0:
+            del self.states[:index]
+            self.offset += index
+            self._start = max(self._start, earliest_start)
+
+
 class HistoryStats:
     """Manage history stats."""
 
@@ -49,8 +182,8 @@ class HistoryStats:
         self.entity_id = entity_id
         self._period = (MIN_TIME_UTC, MIN_TIME_UTC)
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
-        self._history_current_period: list[HistoryState] = []
-        self._previous_run_before_start = False
+        self._history: EntityHistory | None = None
+        self._totals: PeriodTotals | None = None
         self._entity_states = set(entity_states)
         self._duration = duration
         self._start = start
@@ -60,74 +193,34 @@ class HistoryStats:
         self, event: Event[EventStateChangedData] | None
     ) -> HistoryStatsState:
         """Update the stats at a given time."""
-        # Get previous values of start and end
-        previous_period_start, previous_period_end = self._period
         # Parse templates
         self._period = async_calculate_period(self._duration, self._start, self._end)
         # Get the current period
         current_period_start, current_period_end = self._period
 
-        # Convert times to UTC
-        current_period_start = dt_util.as_utc(current_period_start)
-        current_period_end = dt_util.as_utc(current_period_end)
-        previous_period_start = dt_util.as_utc(previous_period_start)
-        previous_period_end = dt_util.as_utc(previous_period_end)
-
         # Compute integer timestamps
         current_period_start_timestamp = floored_timestamp(current_period_start)
         current_period_end_timestamp = floored_timestamp(current_period_end)
-        previous_period_start_timestamp = floored_timestamp(previous_period_start)
-        previous_period_end_timestamp = floored_timestamp(previous_period_end)
         utc_now = dt_util.utcnow()
         now_timestamp = floored_timestamp(utc_now)
 
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
-            self._history_current_period = []
-            self._previous_run_before_start = True
+            self.async_release()
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
-        #
-        # We avoid querying the database if the below did NOT happen:
-        #
-        # - The previous run happened before the start time
-        # - The start time changed
-        # - The period shrank in size
-        # - The previous period ended before now
-        #
-        if (
-            not self._previous_run_before_start
-            and current_period_start_timestamp == previous_period_start_timestamp
-            and (
-                current_period_end_timestamp == previous_period_end_timestamp
-                or (
-                    current_period_end_timestamp >= previous_period_end_timestamp
-                    and previous_period_end_timestamp <= now_timestamp
-                )
-            )
-        ):
-            new_data = False
-            if event and (new_state := event.data["new_state"]) is not None:
-                if (
-                    current_period_start_timestamp
-                    <= floored_timestamp(new_state.last_changed)
-                    <= current_period_end_timestamp
-                ):
-                    self._history_current_period.append(
-                        HistoryState(
-                            new_state.state, new_state.last_changed.timestamp()
-                        )
-                    )
-                    new_data = True
-            if not new_data and current_period_end_timestamp < now_timestamp:
-                # If period has not changed and current time after the period end...
-                # Don't compute anything as the value cannot have changed
-                return self._state
-        else:
-            await self._async_history_from_db(
-                current_period_start_timestamp, current_period_end_timestamp
-            )
-            self._previous_run_before_start = False
+
+        if self._history is None:
+            self._history = async_get_entity_history(self.hass, self.entity_id)
+        if event and (new_state := event.data["new_state"]) is not None:
+            self._history.async_add_state(new_state)
+        elif (current_state := self.hass.states.get(self.entity_id)) is not None:
+            # Catch up with a state which changed before state changes
+            # were tracked, the history is not fetched again
+            self._history.async_add_state(current_state)
+        await self._history.async_set_period(
+            self, current_period_start_timestamp, current_period_end_timestamp
+        )
 
         seconds_matched, match_count = self._async_compute_seconds_and_changes(
             now_timestamp,
@@ -137,71 +230,71 @@ class HistoryStats:
         self._state = HistoryStatsState(seconds_matched, match_count, self._period)
         return self._state
 
-    async def _async_history_from_db(
-        self,
-        current_period_start_timestamp: float,
-        current_period_end_timestamp: float,
-    ) -> None:
-        """Update history data for the current period from the database."""
-        instance = get_instance(self.hass)
-        states = await instance.async_add_executor_job(
-            self._state_changes_during_period,
-            current_period_start_timestamp,
-            current_period_end_timestamp,
-        )
-        self._history_current_period = [
-            HistoryState(state.state, state.last_changed.timestamp())
-            for state in states
-        ]
-
-    def _state_changes_during_period(
-        self, start_ts: float, end_ts: float
-    ) -> list[State]:
-        """Return state changes during a period."""
-        start = dt_util.utc_from_timestamp(start_ts)
-        end = dt_util.utc_from_timestamp(end_ts)
-        return history.state_changes_during_period(
-            self.hass,
-            start,
-            end,
-            self.entity_id,
-            include_start_time_state=True,
-            no_attributes=True,
-        ).get(self.entity_id, [])
+    @callback
+    def async_release(self) -> None:
+        """Stop using the shared history of the entity."""
+        if self._history is not None:
+            self._history.async_remove(self)
+            self._history = None
+            self._totals = None
 
     def _async_compute_seconds_and_changes(
         self, now_timestamp: float, start_timestamp: float, end_timestamp: float
     ) -> tuple[float, int]:
-        """Compute the seconds matched and changes from the history list and first state."""
-        # state_changes_during_period is called with include_start_time_state=True
-        # which is the default and always provides the state at the start
-        # of the period
-        previous_state_matches = (
-            self._history_current_period
-            and self._history_current_period[0].state in self._entity_states
-        )
-        last_state_change_timestamp = start_timestamp
-        elapsed = 0.0
-        match_count = 1 if previous_state_matches else 0
+        """Compute the seconds matched and changes from the history list and first state.
 
-        # Make calculations
-        for history_state in self._history_current_period:
-            current_state_matches = history_state.state in self._entity_states
-            state_change_timestamp = history_state.last_changed
+        The running totals of the period are kept, so only the states added
+        since the previous update are processed unless the period moved.
+        """
+        entity_history = self._history
+        assert entity_history is not None
+        states = entity_history.states
+        totals = self._totals
+        if (
+            totals is None
+            or totals.start != start_timestamp
+            or totals.end > end_timestamp
+            or totals.generation != entity_history.generation
+        ):
+            # Start over from the state at the start of the period, which
+            # is the first state if the entity had no state before
+            start_index = max(
+                bisect_right(states, start_timestamp, key=_last_changed) - 1, 0
+            )
+            totals = self._totals = PeriodTotals(
+                start_timestamp,
+                end_timestamp,
+                entity_history.generation,
+                entity_history.offset + start_index,
+                start_timestamp,
+            )
+        totals.end = end_timestamp
+
+        entity_states = self._entity_states
+        for index in range(totals.next_index - entity_history.offset, len(states)):
+            history_state = states[index]
+            if history_state.last_changed > end_timestamp:
+                break
+            current_state_matches = history_state.state in entity_states
+            # The state at the start of the period may have changed before it
+            state_change_timestamp = max(history_state.last_changed, start_timestamp)
 
-            if previous_state_matches:
-                elapsed += state_change_timestamp - last_state_change_timestamp
+            if totals.last_matches is None:
+                # The first state counts as a match at the start of the period
+                totals.match_count = 1 if current_state_matches else 0
+                totals.last_matches = current_state_matches
+            if totals.last_matches:
+                totals.seconds_matched += state_change_timestamp - totals.last_changed
             elif current_state_matches:
-                match_count += 1
+                totals.match_count += 1
 
-            previous_state_matches = current_state_matches
-            last_state_change_timestamp = state_change_timestamp
+            totals.last_matches = current_state_matches
+            totals.last_changed = state_change_timestamp
+            totals.next_index = entity_history.offset + index + 1
 
         # Count time elapsed between last history state and end of measure
-        if previous_state_matches:
+        seconds_matched = totals.seconds_matched
+        if totals.last_matches:
             measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_state_change_timestamp
-
-        # Save value in seconds
-        seconds_matched = elapsed
-        return seconds_matched, match_count
+            seconds_matched += measure_end - totals.last_changed
+        return seconds_matched, totals.match_count
@@ -5,6 +5,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import lru_cache
 import logging
 import math
 import queue
@@ -81,12 +83,8 @@ from .const import (
     DEFAULT_SSL_V2,
     DOMAIN,
     EVENT_NEW_STATE,
-    INFLUX_CONF_FIELDS,
-    INFLUX_CONF_MEASUREMENT,
     INFLUX_CONF_ORG,
     INFLUX_CONF_STATE,
-    INFLUX_CONF_TAGS,
-    INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
@@ -201,23 +199,90 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | None]:
-    """Build event to json converter and add to config."""
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+PRECISION_DIVISORS = {None: 1, "ns": 1, "us": 10**3, "ms": 10**6, "s": 10**9}
+
+
+@lru_cache(maxsize=4096)
+def _escape_key(key: str) -> str:
+    """Escape a measurement, tag key, tag value or field key for line protocol."""
+    return (
+        key.replace("\\", "\\\\")
+        .replace(" ", "\\ ")
+        .replace(",", "\\,")
+        .replace("=", "\\=")
+        .replace("\n", "\\n")
+    )
+
+
+def _escape_field_value(value: float | str) -> str:
+    """Encode a field value for line protocol."""
+    if type(value) is float:
+        return repr(value)
+    return (
+        '"'
+        + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        + '"'
+    )
+
+
+def _encode_tags(tags: dict[str, Any]) -> str:
+    """Encode tags sorted by key, skipping empty keys and values."""
+    encoded = ""
+    for key in sorted(tags):
+        value = tags[key]
+        if key and (value := _escape_key(str(value) if value is not None else "")):
+            encoded += f",{_escape_key(key)}={value}"
+    return encoded
+
+
+@dataclass(slots=True, frozen=True)
+class _EntityTemplate:
+    """Precompiled line protocol parts that only depend on the entity config."""
+
+    override_measurement: str | None
+    ignore_attributes: frozenset[str]
+    # Tags that are not taken from attributes, before global tags are applied
+    base_tags: dict[str, str]
+    # Encoded base and global tags, used when no attribute is a tag
+    encoded_tags: str
+
+
+def _generate_event_to_line(conf: dict) -> Callable[[Event], str | None]:
+    """Build event to line protocol converter."""
     entity_filter = convert_include_exclude_filter(conf)
-    tags = conf.get(CONF_TAGS)
+    tags: dict[str, str] = conf[CONF_TAGS]
     tags_attributes: list[str] = conf[CONF_TAGS_ATTRIBUTES]
     default_measurement = conf.get(CONF_DEFAULT_MEASUREMENT)
     measurement_attr: str = conf[CONF_MEASUREMENT_ATTR]
     override_measurement = conf.get(CONF_OVERRIDE_MEASUREMENT)
     global_ignore_attributes = set(conf[CONF_IGNORE_ATTRIBUTES])
+    divisor = PRECISION_DIVISORS[conf.get(CONF_PRECISION)]
     component_config = EntityValues(
         conf[CONF_COMPONENT_CONFIG],
         conf[CONF_COMPONENT_CONFIG_DOMAIN],
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
+    templates: dict[str, _EntityTemplate] = {}
 
-    def event_to_json(event: Event) -> dict[str, Any] | None:
-        """Convert event into json in format Influx expects."""
+    def _compile_template(state: State) -> _EntityTemplate:
+        """Compile the per entity parts of the line protocol."""
+        entity_config = component_config.get(state.entity_id)
+        base_tags = {CONF_DOMAIN: state.domain, CONF_ENTITY_ID: state.object_id}
+        return _EntityTemplate(
+            override_measurement=entity_config.get(CONF_OVERRIDE_MEASUREMENT)
+            or override_measurement,
+            ignore_attributes=frozenset(
+                global_ignore_attributes.union(
+                    entity_config.get(CONF_IGNORE_ATTRIBUTES, [])
+                )
+            ),
+            base_tags=base_tags,
+            encoded_tags=_encode_tags(base_tags | tags),
+        )
+
+    def event_to_line(event: Event) -> str | None:
+        """Convert event into a line in the line protocol Influx expects."""
         state: State | None = event.data.get(EVENT_NEW_STATE)
         if (
             state is None
@@ -226,99 +291,93 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
         ):
             return None
 
-        try:
-            _include_state = _include_value = False
+        if (template := templates.get(state.entity_id)) is None:
+            template = templates[state.entity_id] = _compile_template(state)
 
-            _state_as_value = float(state.state)
-            _include_value = True
+        fields: dict[str, float | str] = {}
+        try:
+            fields[INFLUX_CONF_VALUE] = float(state.state)
         except ValueError:
-            try:
-                _state_as_value = float(state_helper.state_as_number(state))
-                _include_state = _include_value = True
-            except ValueError:
-                _include_state = True
+            fields[INFLUX_CONF_STATE] = state.state
+            with suppress(ValueError):
+                fields[INFLUX_CONF_VALUE] = float(state_helper.state_as_number(state))
 
         include_uom = True
         include_dc = True
-        entity_config = component_config.get(state.entity_id)
-        measurement = entity_config.get(CONF_OVERRIDE_MEASUREMENT)
-        if measurement in (None, ""):
-            if override_measurement:
-                measurement = override_measurement
-            else:
-                if measurement_attr == "entity_id":
-                    measurement = state.entity_id
-                elif measurement_attr == "domain__device_class":
-                    device_class = state.attributes.get("device_class")
-                    if device_class is None:
-                        # This entity doesn't have a device_class set, use only domain
-                        measurement = state.domain
-                    else:
-                        measurement = f"{state.domain}__{device_class}"
-                        include_dc = False
+        if not (measurement := template.override_measurement):
+            if measurement_attr == "entity_id":
+                measurement = state.entity_id
+            elif measurement_attr == "domain__device_class":
+                device_class = state.attributes.get("device_class")
+                if device_class is None:
+                    # This entity doesn't have a device_class set, use only domain
+                    measurement = state.domain
                 else:
-                    measurement = state.attributes.get(measurement_attr)
-                if measurement in (None, ""):
-                    if default_measurement:
-                        measurement = default_measurement
-                    else:
-                        measurement = state.entity_id
+                    measurement = f"{state.domain}__{device_class}"
+                    include_dc = False
+            else:
+                measurement = state.attributes.get(measurement_attr)
+            if measurement in (None, ""):
+                if default_measurement:
+                    measurement = default_measurement
                 else:
-                    include_uom = measurement_attr != "unit_of_measurement"
-
-        json: dict[str, Any] = {
-            INFLUX_CONF_MEASUREMENT: measurement,
-            INFLUX_CONF_TAGS: {
-                CONF_DOMAIN: state.domain,
-                CONF_ENTITY_ID: state.object_id,
-            },
-            INFLUX_CONF_TIME: event.time_fired,
-            INFLUX_CONF_FIELDS: {},
-        }
-        if _include_state:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_STATE] = state.state
-        if _include_value:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_VALUE] = _state_as_value
-
-        ignore_attributes = set(entity_config.get(CONF_IGNORE_ATTRIBUTES, []))
-        ignore_attributes.update(global_ignore_attributes)
+                    measurement = state.entity_id
+            else:
+                include_uom = measurement_attr != "unit_of_measurement"
+
+        attribute_tags: dict[str, Any] | None = None
+        ignore_attributes = template.ignore_attributes
         for key, value in state.attributes.items():
             if key in tags_attributes:
-                json[INFLUX_CONF_TAGS][key] = value
+                if attribute_tags is None:
+                    attribute_tags = {}
+                attribute_tags[key] = value
             elif (
                 (key != CONF_UNIT_OF_MEASUREMENT or include_uom)
                 and (key != "device_class" or include_dc)
                 and key not in ignore_attributes
             ):
                 # If the key is already in fields
-                if key in json[INFLUX_CONF_FIELDS]:
+                if key in fields:
                     key = f"{key}_"
                 # Prevent column data errors in influxDB.
                 # For each value we try to cast it as float
                 # But if we cannot do it we store the value
                 # as string add "_str" postfix to the field key
                 try:
-                    json[INFLUX_CONF_FIELDS][key] = float(value)
+                    fields[key] = float(value)
                 except (ValueError, TypeError):
-                    new_key = f"{key}_str"
                     new_value = str(value)
-                    json[INFLUX_CONF_FIELDS][new_key] = new_value
+                    fields[f"{key}_str"] = new_value
 
                     if RE_DIGIT_TAIL.match(new_value):
-                        json[INFLUX_CONF_FIELDS][key] = float(
-                            RE_DECIMAL.sub("", new_value)
-                        )
+                        fields[key] = float(RE_DECIMAL.sub("", new_value))
 
                 # Infinity and NaN are not valid floats in InfluxDB
-                with suppress(KeyError, TypeError):
-                    if not math.isfinite(json[INFLUX_CONF_FIELDS][key]):
-                        del json[INFLUX_CONF_FIELDS][key]
+                if type(field := fields.get(key)) is float and not math.isfinite(field):
+                    del fields[key]
 
-        json[INFLUX_CONF_TAGS].update(tags)
-
-        return json
+        encoded_tags = (
+            template.encoded_tags
+            if attribute_tags is None
+            else _encode_tags(template.base_tags | attribute_tags | tags)
+        )
+        encoded_fields = ",".join(
+            f"{_escape_key(key)}={_escape_field_value(fields[key])}"
+            for key in sorted(fields)
+            if key
+        )
+        delta = event.time_fired - EPOCH
+        timestamp = (
+            (delta.days * 86400 + delta.seconds) * 10**9 + delta.microseconds * 10**3
+        ) // divisor
+
+        return (
+            f"{_escape_key(str(measurement))}{encoded_tags}"
+            f" {encoded_fields} {timestamp}"
+        )
 
-    return event_to_json
+    return event_to_line
 
 
 @dataclass
@@ -326,7 +385,7 @@ class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
 
     data_repositories: list[str]
-    write: Callable[[str], None]
+    write: Callable[[list[str]], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -354,9 +413,9 @@ def get_influx_connection(  # noqa: C901
         initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
         write_api = influx.write_api(write_options=initial_write_mode)
 
-        def write_v2(json):
-            """Write data to V2 influx."""
-            data = {"bucket": bucket, "record": json}
+        def write_v2(lines):
+            """Write line protocol data to V2 influx."""
+            data = {"bucket": bucket, "record": lines}
 
             if precision is not None:
                 data["write_precision"] = precision
@@ -367,7 +426,7 @@ def get_influx_connection(  # noqa: C901
                 raise ConnectionError(CONNECTION_ERROR % exc) from exc
             except ApiException as exc:
                 if exc.status == CODE_INVALID_INPUTS:
-                    raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
         def query_v2(query, _=None):
@@ -431,10 +490,10 @@ def get_influx_connection(  # noqa: C901
 
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
-        """Write data to V1 influx."""
+    def write_v1(lines):
+        """Write line protocol data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(lines, time_precision=precision, protocol="line")
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -443,7 +502,7 @@ def get_influx_connection(  # noqa: C901
             raise ConnectionError(CONNECTION_ERROR % exc) from exc
         except exceptions.InfluxDBClientError as exc:
             if exc.code == CODE_INVALID_INPUTS:
-                raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
     def query_v1(query, database=None):
@@ -491,9 +550,9 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
         return True
 
-    event_to_json = _generate_event_to_json(conf)
+    event_to_line = _generate_event_to_line(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_line, max_tries)
     instance.start()
 
     def shutdown(event):
@@ -510,14 +569,14 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(self, hass, influx, event_to_line, max_tries):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue: queue.SimpleQueue[threading.Event | tuple[float, Event] | None] = (
             queue.SimpleQueue()
         )
         self.influx = influx
-        self.event_to_json = event_to_json
+        self.event_to_line = event_to_line
         self.max_tries = max_tries
         self.write_errors = 0
         self.shutdown = False
@@ -534,17 +593,17 @@ class InfluxThread(threading.Thread):
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
-    def get_events_json(self):
-        """Return a batch of events formatted for writing."""
+    def get_events_lines(self):
+        """Return a batch of events encoded as line protocol for writing."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
         count = 0
-        json = []
+        lines = []
 
         dropped = 0
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while len(lines) < BATCH_BUFFER_SIZE and not self.shutdown:
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
@@ -556,8 +615,8 @@ class InfluxThread(threading.Thread):
                     age = time.monotonic() - timestamp
 
                     if age < queue_seconds:
-                        if event_json := self.event_to_json(event):
-                            json.append(event_json)
+                        if line := self.event_to_line(event):
+                            lines.append(line)
                     else:
                         dropped += 1
                 elif isinstance(item, threading.Event):
@@ -566,19 +625,19 @@ class InfluxThread(threading.Thread):
         if dropped:
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
 
-        return count, json
+        return count, lines
 
-    def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+    def write_to_influxdb(self, lines):
+        """Write encoded events to influxdb, with retry."""
         for retry in range(self.max_tries + 1):
             try:
-                self.influx.write(json)
+                self.influx.write(lines)
 
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
                     self.write_errors = 0
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
+                _LOGGER.debug(WROTE_MESSAGE, len(lines))
                 break
             except ValueError as err:
                 _LOGGER.error(err)
@@ -589,14 +648,14 @@ class InfluxThread(threading.Thread):
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    self.write_errors += len(lines)
 
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
-            _, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
+            _, lines = self.get_events_lines()
+            if lines:
+                self.write_to_influxdb(lines)
 
     def block_till_done(self):
         """Block till all events processed.
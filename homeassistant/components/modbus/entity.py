@@ -28,7 +28,7 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity, ToggleEntity
-from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import (
@@ -120,8 +120,8 @@ class BasePlatform(Entity):
             self.hass, timedelta(milliseconds=100), self.async_update
         )
         if self._scan_interval > 0:
-            self._cancel_timer = async_track_time_interval(
-                self.hass, self.async_update, timedelta(seconds=self._scan_interval)
+            self._cancel_timer = self._hub.async_track_poll(
+                self._slave, self._scan_interval, self.async_update
             )
         self._attr_available = True
         self.async_write_ha_state()
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import asyncio
 from collections import namedtuple
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
 import logging
-from typing import Any
+from typing import Any, cast
 
 from pymodbus.client import (
     AsyncModbusSerialClient,
@@ -29,11 +32,17 @@ from homeassistant.const import (
     CONF_TYPE,
     EVENT_HOMEASSISTANT_STOP,
 )
-from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.discovery import async_load_platform
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.helpers.typing import ConfigType
 
@@ -118,6 +127,81 @@ PB_CALL = [
     ),
 ]
 
+# Maximum number of items a single read request may return
+MAX_READ_COUNT = {
+    CALL_TYPE_COIL: 2000,
+    CALL_TYPE_DISCRETE: 2000,
+    CALL_TYPE_REGISTER_HOLDING: 125,
+    CALL_TYPE_REGISTER_INPUT: 125,
+}
+# Maximum number of unrequested addresses read to merge two reads
+MAX_READ_GAP = 8
+
+
+@dataclass(slots=True)
+class _PendingRead:
+    """A read request waiting to be merged into a block read."""
+
+    unit: int | None
+    address: int
+    count: int
+    use_call: str
+    future: asyncio.Future[ModbusResponse | None]
+
+
+@dataclass(slots=True)
+class _ReadBlock:
+    """A block read answering the read requests it covers."""
+
+    unit: int | None
+    use_call: str
+    address: int
+    count: int
+    reads: list[_PendingRead]
+
+
+class _BlockReadResult:
+    """The part of a block read answering one read request."""
+
+    __slots__ = ("bits", "registers")
+
+    def __init__(self, bits: list[bool], registers: list[int]) -> None:
+        """Initialize the result."""
+        self.bits = bits
+        self.registers = registers
+
+    def isError(self) -> bool:  # noqa: N802
+        """Return False, a block read with an error is not split."""
+        return False
+
+
+def _plan_block_reads(reads: list[_PendingRead]) -> list[_ReadBlock]:
+    """Merge read requests of the same device and type into block reads.
+
+    Reads are merged when the addresses between them are at most
+    MAX_READ_GAP and the block stays within the protocol limit.
+    """
+    groups: dict[tuple[int | None, str], list[_PendingRead]] = {}
+    for read in reads:
+        groups.setdefault((read.unit, read.use_call), []).append(read)
+    blocks: list[_ReadBlock] = []
+    for (unit, use_call), group in groups.items():
+        max_count = MAX_READ_COUNT[use_call]
+        block: _ReadBlock | None = None
+        for read in sorted(group, key=lambda read: read.address):
+            end = read.address + read.count
+            if (
+                block is not None
+                and read.address <= block.address + block.count + MAX_READ_GAP
+                and end - block.address <= max_count
+            ):
+                block.count = max(block.count, end - block.address)
+                block.reads.append(read)
+                continue
+            block = _ReadBlock(unit, use_call, read.address, read.count, [read])
+            blocks.append(block)
+    return blocks
+
 
 async def async_modbus_setup(
     hass: HomeAssistant,
@@ -257,6 +341,17 @@ class ModbusHub:
         self._config_type = client_config[CONF_TYPE]
         self._config_delay = client_config[CONF_DELAY]
         self._pb_request: dict[str, RunEntry] = {}
+        self._pending_reads: list[_PendingRead] = []
+        # Blocks which failed while their reads succeeded on their own
+        self._failed_blocks: set[tuple[int | None, str, int, int]] = set()
+        # Blocks which failed together with all their reads, e.g. slave offline,
+        # with the index of the read retried on its own in the next poll
+        self._offline_blocks: dict[tuple[int | None, str, int, int], int] = {}
+        self._polls: dict[
+            tuple[int | None, int],
+            list[Callable[[datetime], Coroutine[Any, Any, None]]],
+        ] = {}
+        self._cancel_polls: dict[tuple[int | None, int], CALLBACK_TYPE] = {}
         self._pb_class = {
             SERIAL: AsyncModbusSerialClient,
             TCP: AsyncModbusTcpClient,
@@ -409,6 +504,8 @@ class ModbusHub:
         """Convert async to sync pymodbus call."""
         if self._config_delay:
             return None
+        if use_call in MAX_READ_COUNT and isinstance(value, int):
+            return await self._async_read(unit, address, value, use_call)
         async with self._lock:
             if not self._client:
                 return None
@@ -417,3 +514,124 @@ class ModbusHub:
                 # small delay until next request/response
                 await asyncio.sleep(self._msg_wait)
             return result
+
+    @callback
+    def async_track_poll(
+        self,
+        unit: int | None,
+        scan_interval: int,
+        action: Callable[[datetime], Coroutine[Any, Any, None]],
+    ) -> CALLBACK_TYPE:
+        """Poll an entity together with the other entities of its slave.
+
+        Entities of a slave sharing a scan interval are updated at the same
+        time, so their reads are merged into block reads.
+        """
+        key = (unit, scan_interval)
+        if (actions := self._polls.get(key)) is None:
+            actions = self._polls[key] = []
+            self._cancel_polls[key] = async_track_time_interval(
+                self.hass,
+                partial(self._async_poll, actions),
+                timedelta(seconds=scan_interval),
+            )
+        actions.append(action)
+
+        @callback
+        def _async_remove() -> None:
+            actions.remove(action)
+            if not actions:
+                del self._polls[key]
+                self._cancel_polls.pop(key)()
+
+        return _async_remove
+
+    async def _async_poll(
+        self,
+        actions: list[Callable[[datetime], Coroutine[Any, Any, None]]],
+        now: datetime,
+    ) -> None:
+        """Update the entities of a slave."""
+        await asyncio.gather(*(action(now) for action in list(actions)))
+
+    async def _async_read(
+        self, unit: int | None, address: int, count: int, use_call: str
+    ) -> ModbusResponse | None:
+        """Read through a block read with the reads waiting for the hub."""
+        read = _PendingRead(
+            unit, address, count, use_call, self.hass.loop.create_future()
+        )
+        self._pending_reads.append(read)
+        # Let the reads of entities updating at the same time join the block
+        await asyncio.sleep(0)
+        async with self._lock:
+            if not read.future.done():
+                reads = self._pending_reads
+                self._pending_reads = []
+                try:
+                    if self._client:
+                        for block in _plan_block_reads(reads):
+                            await self._async_read_block(block)
+                finally:
+                    for pending in reads:
+                        if not pending.future.done():
+                            pending.future.set_result(None)
+        return read.future.result()
+
+    async def _async_read_block(self, block: _ReadBlock) -> None:
+        """Read a block and answer the reads it covers."""
+        block_key = (block.unit, block.use_call, block.address, block.count)
+        if len(block.reads) == 1 or block_key in self._failed_blocks:
+            for read in block.reads:
+                read.future.set_result(await self._async_low_level_read(read))
+            return
+
+        if (result := await self._async_low_level_read(block)) is None:
+            # Addresses in the gaps may not exist, read one by one
+            reads = block.reads
+            if (probe := self._offline_blocks.get(block_key)) is not None:
+                # While the slave is offline only one read is retried per poll,
+                # the others are read once it answers
+                reads = reads[probe:] + reads[:probe]
+            succeeded = False
+            for read in reads:
+                if probe is not None and not succeeded and read is not reads[0]:
+                    read.future.set_result(None)
+                    continue
+                read_result = await self._async_low_level_read(read)
+                succeeded = succeeded or read_result is not None
+                read.future.set_result(read_result)
+            if succeeded:
+                self._offline_blocks.pop(block_key, None)
+                self._failed_blocks.add(block_key)
+            else:
+                self._offline_blocks[block_key] = (
+                    0 if probe is None else (probe + 1) % len(reads)
+                )
+            return
+
+        self._offline_blocks.pop(block_key, None)
+
+        bits: list[bool] = getattr(result, "bits", [])
+        registers: list[int] = getattr(result, "registers", [])
+        for read in block.reads:
+            start = read.address - block.address
+            end = start + read.count
+            read.future.set_result(
+                cast(
+                    ModbusResponse,
+                    _BlockReadResult(bits[start:end], registers[start:end]),
+                )
+            )
+
+    async def _async_low_level_read(
+        self, read: _PendingRead | _ReadBlock
+    ) -> ModbusResponse | None:
+        """Do a single read and wait before the next request."""
+        result = await self.low_level_pb_call(
+            read.unit, read.address, read.count, read.use_call
+        )
+        if self._msg_wait:
+            # small delay until next request/response
+            await asyncio.sleep(self._msg_wait)
+        return result
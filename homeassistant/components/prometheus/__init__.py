@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Iterable
 from contextlib import suppress
 import logging
 import string
-from typing import Any, cast
+from typing import Any, Self, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
+from prometheus_client.exposition import choose_encoder
 from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.openmetrics import exposition as openmetrics
+from prometheus_client.utils import floatToGoString
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -61,7 +65,13 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_registry import (
@@ -88,6 +98,10 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+_OPENMETRICS_EOF = b"# EOF\n"
+
+type _SeriesChanges = dict[tuple[str, ...], MetricWrapperBase | None]
+
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
@@ -120,10 +134,144 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
+def _escape(value: str, quotes: bool = True) -> str:
+    """Escape a label value or help text for the exposition formats."""
+    value = value.replace("\\", r"\\").replace("\n", r"\n")
+    if quotes:
+        return value.replace('"', r"\"")
+    return value
+
+
+class _SeriesTrackingMixin(MetricWrapperBase):
+    """Record the series of a metric that changed since they were last taken."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the metric."""
+        super().__init__(name, documentation, labelnames, **kwargs)
+        self.series_labelnames = tuple(labelnames)
+        # Maps label values to the child, or None if the series was removed
+        self._series_changes: _SeriesChanges = {}
+
+    def labels(self, *labelvalues: Any, **labelkwargs: Any) -> Self:
+        """Return the child for the given labelset and record it as changed."""
+        child = super().labels(*labelvalues, **labelkwargs)
+        if labelkwargs:
+            labelvalues = tuple(labelkwargs[name] for name in self.series_labelnames)
+        self._series_changes[tuple(str(value) for value in labelvalues)] = child
+        return child
+
+    def remove(self, *labelvalues: Any) -> None:
+        """Remove the given labelset and record it as changed."""
+        super().remove(*labelvalues)
+        self._series_changes[tuple(str(value) for value in labelvalues)] = None
+
+    def pop_series_changes(self) -> _SeriesChanges:
+        """Return and reset the series changed since the last call."""
+        changes, self._series_changes = self._series_changes, {}
+        return changes
+
+
+class _Counter(_SeriesTrackingMixin, prometheus_client.Counter):
+    """Counter recording its changed series."""
+
+
+class _Gauge(_SeriesTrackingMixin, prometheus_client.Gauge):
+    """Gauge recording its changed series."""
+
+
+_SERIES_TRACKING_METRICS: dict[type[MetricWrapperBase], type[MetricWrapperBase]] = {
+    prometheus_client.Counter: _Counter,
+    prometheus_client.Gauge: _Gauge,
+}
+
+
+class _EncodedMetric:
+    """Keep the encoded series of a metric family between scrapes.
+
+    Only the series recorded as changed are encoded again, everything else is
+    joined from the lines encoded on previous scrapes.
+    """
+
+    def __init__(self, metric: _SeriesTrackingMixin) -> None:
+        """Initialize the encoded metric."""
+        family = metric.describe()[0]
+        self._labelnames = metric.series_labelnames
+        self._created_name = f"{family.name}_created"
+        # Label values to the lines of the series and of its created timestamp
+        self._series: dict[tuple[str, ...], tuple[str, str]] = {}
+        self._generation = 0
+        self._encoded: dict[bool, tuple[int, bytes]] = {}
+
+        documentation = _escape(family.documentation, quotes=False)
+        # The text format suffixes counters and moves their created
+        # timestamps into a separate gauge
+        name = f"{family.name}_total" if family.type == "counter" else family.name
+        self._text_headers = (
+            f"# HELP {name} {documentation}\n# TYPE {name} {family.type}\n",
+            f"# HELP {self._created_name} {documentation}\n"
+            f"# TYPE {self._created_name} gauge\n",
+        )
+        documentation = _escape(family.documentation)
+        self._openmetrics_header = (
+            f"# HELP {family.name} {documentation}\n"
+            f"# TYPE {family.name} {family.type}\n"
+        )
+
+    def update(self, changes: _SeriesChanges) -> None:
+        """Encode the changed series again."""
+        if not changes:
+            return
+        self._generation += 1
+        series = self._series
+        for labelvalues, child in changes.items():
+            if child is None:
+                series.pop(labelvalues, None)
+                continue
+            labels = ",".join(
+                f'{name}="{_escape(value)}"'
+                for name, value in sorted(
+                    zip(self._labelnames, labelvalues, strict=True)
+                )
+            )
+            line = created = ""
+            for sample in child.collect()[0].samples:  # type: ignore[index]
+                encoded = f"{sample.name}{{{labels}}} {floatToGoString(sample.value)}\n"
+                if sample.name == self._created_name:
+                    created += encoded
+                else:
+                    line += encoded
+            series[labelvalues] = (line, created)
+
+    def encode(self, open_metrics: bool) -> bytes:
+        """Return the metric family encoded in the requested format."""
+        if (encoded := self._encoded.get(open_metrics)) is not None and (
+            encoded[0] == self._generation
+        ):
+            return encoded[1]
+        series = self._series.values()
+        if open_metrics:
+            # OpenMetrics keeps the created timestamp next to its series
+            body = [
+                self._openmetrics_header,
+                *(line for lines in series for line in lines),
+            ]
+        else:
+            body = [self._text_headers[0], *(lines[0] for lines in series)]
+            if created := [lines[1] for lines in series if lines[1]]:
+                body.append(self._text_headers[1])
+                body.extend(created)
+        self._encoded[open_metrics] = (self._generation, data := "".join(body).encode())
+        return data
+
+
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -145,6 +293,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         default_metric,
     )
 
+    hass.http.register_view(PrometheusView(conf[CONF_REQUIRES_AUTH], metrics))
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
     hass.bus.listen(
         EVENT_ENTITY_REGISTRY_UPDATED,
@@ -191,6 +340,8 @@ class PrometheusMetrics:
         else:
             self.metrics_prefix = ""
         self._metrics: dict[str, MetricWrapperBase] = {}
+        self._encoded_metrics: dict[str, _EncodedMetric] = {}
+        self._encode_lock = asyncio.Lock()
         self._climate_units = climate_units
 
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
@@ -271,6 +422,60 @@ class PrometheusMetrics:
         if metrics_entity_id:
             self._remove_labelsets(metrics_entity_id)
 
+    async def async_generate_latest(
+        self, hass: HomeAssistant, encoder: Callable[[Any], bytes]
+    ) -> bytes:
+        """Encode the metrics in the executor.
+
+        Scrapes are serialized so each one applies the series changed since
+        the previous one, in order, to the encoded series.
+        """
+        async with self._encode_lock:
+            return await hass.async_add_executor_job(
+                self.generate_latest, encoder, self.async_snapshot()
+            )
+
+    @callback
+    def async_snapshot(
+        self,
+    ) -> list[tuple[str, MetricWrapperBase, _SeriesChanges | None]]:
+        """Return the metric families and their series changed since the last call."""
+        return [
+            (
+                name,
+                metric,
+                metric.pop_series_changes()
+                if isinstance(metric, _SeriesTrackingMixin)
+                else None,
+            )
+            for name, metric in self._metrics.items()
+        ]
+
+    def generate_latest(
+        self,
+        encoder: Callable[[Any], bytes],
+        snapshot: list[tuple[str, MetricWrapperBase, _SeriesChanges | None]],
+    ) -> bytes:
+        """Encode the registry and a snapshot of the metric families.
+
+        Only the series changed since the previous snapshot are encoded again.
+        """
+        open_metrics = encoder is openmetrics.generate_latest
+        output = [encoder(prometheus_client.REGISTRY).removesuffix(_OPENMETRICS_EOF)]
+        for name, metric, changes in snapshot:
+            if changes is None:
+                output.append(encoder(metric).removesuffix(_OPENMETRICS_EOF))
+                continue
+            if (encoded := self._encoded_metrics.get(name)) is None:
+                encoded = self._encoded_metrics[name] = _EncodedMetric(
+                    cast(_SeriesTrackingMixin, metric)
+                )
+            encoded.update(changes)
+            output.append(encoded.encode(open_metrics))
+        if open_metrics:
+            output.append(_OPENMETRICS_EOF)
+        return b"".join(output)
+
     def _remove_labelsets(
         self,
         entity_id: str,
@@ -328,11 +533,11 @@ class PrometheusMetrics:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
-            self._metrics[metric] = factory(
+            self._metrics[metric] = _SERIES_TRACKING_METRICS.get(factory, factory)(
                 full_metric_name,
                 documentation,
                 labels,
-                registry=prometheus_client.REGISTRY,
+                registry=None,
             )
             return cast(_MetricBaseT, self._metrics[metric])
 
@@ -818,19 +1023,23 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, metrics: PrometheusMetrics) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._metrics = metrics
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
         hass = request.app[KEY_HASS]
-        body = await hass.async_add_executor_job(
-            prometheus_client.generate_latest, prometheus_client.REGISTRY
-        )
-        return web.Response(
-            body=body,
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
-        )
+        encoder, content_type = choose_encoder(request.headers.get(hdrs.ACCEPT, ""))
+        body = await self._metrics.async_generate_latest(hass, encoder)
+        if encoder is openmetrics.generate_latest:
+            response = web.Response(
+                body=body, headers={hdrs.CONTENT_TYPE: content_type}
+            )
+        else:
+            response = web.Response(body=body, content_type=CONTENT_TYPE_TEXT_PLAIN)
+        response.enable_compression()
+        return response
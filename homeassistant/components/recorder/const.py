@@ -27,6 +27,11 @@ DOMAIN = "recorder"
 
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
+# Sent when long term statistics have been compiled, imported or modified
+SIGNAL_STATISTICS_UPDATED = "recorder_statistics_updated"
+# Sent with the end of the hour when the statistics of an hour have been compiled
+SIGNAL_STATISTICS_HOUR_COMPILED = "recorder_statistics_hour_compiled"
+
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
@@ -58,6 +63,7 @@ CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+STATISTICS_ROLLUPS_SCHEMA_VERSION = 48
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
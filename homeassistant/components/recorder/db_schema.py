@@ -77,7 +77,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 47
+SCHEMA_VERSION = 48
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,6 +93,10 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAY = "statistics_day"
+TABLE_STATISTICS_WEEK = "statistics_week"
+TABLE_STATISTICS_MONTH = "statistics_month"
+TABLE_STATISTICS_ROLLUPS = "statistics_rollups"
 TABLE_MIGRATION_CHANGES = "migration_changes"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
@@ -116,6 +120,10 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAY,
+    TABLE_STATISTICS_WEEK,
+    TABLE_STATISTICS_MONTH,
+    TABLE_STATISTICS_ROLLUPS,
 ]
 
 TABLES_TO_CHECK = [
@@ -789,6 +797,61 @@ class LegacyStatisticsShortTerm(LegacyBase, _StatisticsShortTerm):
     )
 
 
+class StatisticsDay(Base, StatisticsBase):
+    """Long term statistics summarized per local day."""
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        Index(
+            "ix_statistics_day_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_DAY
+
+
+class StatisticsWeek(Base, StatisticsBase):
+    """Long term statistics summarized per local week."""
+
+    duration = timedelta(days=7)
+
+    __table_args__ = (
+        Index(
+            "ix_statistics_week_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_WEEK
+
+
+class StatisticsMonth(Base, StatisticsBase):
+    """Long term statistics summarized per local month.
+
+    The duration is the longest month, the end of a row is found from its
+    start in the local time zone.
+    """
+
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        Index(
+            "ix_statistics_month_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_MONTH
+
+
 class _StatisticsMeta:
     """Statistics meta data."""
 
@@ -903,6 +966,28 @@ class StatisticsRuns(Base):
         )
 
 
+class StatisticsRollups(Base):
+    """Representation of how far statistics are summarized in a rollup table.
+
+    All periods which end before end_ts, in the time zone the periods were
+    summarized in, are summarized.
+    """
+
+    __tablename__ = TABLE_STATISTICS_ROLLUPS
+    __table_args__ = (_DEFAULT_TABLE_ARGS,)
+
+    period: Mapped[str] = mapped_column(String(16), primary_key=True)
+    time_zone: Mapped[str] = mapped_column(String(64))
+    end_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StatisticsRollups(period='{self.period}',"
+            f" time_zone='{self.time_zone}', end_ts={self.end_ts})>"
+        )
+
+
 EVENT_DATA_JSON = type_coerce(
     EventData.shared_data.cast(JSONB_VARIANT_CAST), JSONLiteral(none_as_null=True)
 )
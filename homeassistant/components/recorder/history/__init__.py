@@ -11,6 +11,7 @@ from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.recorder import get_instance
 
 from ..filters import Filters
+from .batch import async_state_changes_during_period
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
@@ -24,6 +25,7 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "async_state_changes_during_period",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
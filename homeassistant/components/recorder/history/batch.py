@@ -0,0 +1,322 @@
+"""Coalesce history requests made by many consumers at the same time.
+
+At startup, every state derived sensor loads the history of its source entity
+from the database. Instead of scheduling one executor job and one query per
+sensor, requests are collected while the previous batch is loading and are
+then loaded together in a single executor job. Requests for about the same
+period are answered from one multi-entity query, a request is never merged
+with a request whose period starts or ends more than
+MERGE_PERIOD_TOLERANCE away from its own.
+
+Requests with a row limit are not batched: the limit applies per entity, so
+they could only share a query that reads every row of the period, and they
+would otherwise wait on each other in a single executor job.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+import logging
+
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.recorder import get_instance
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from ..util import session_scope
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HISTORY_BATCHER: HassKey[HistoryBatcher] = HassKey("recorder_history_batcher")
+
+# Requests whose periods start and end within this of each other are merged
+MERGE_PERIOD_TOLERANCE = timedelta(minutes=1)
+
+
+@dataclass(slots=True)
+class StateChangesRequest:
+    """A pending request for the state changes of an entity."""
+
+    entity_id: str
+    start_time: datetime
+    end_time: datetime | None
+    no_attributes: bool
+    descending: bool
+    include_start_time_state: bool
+    future: asyncio.Future[dict[str, list[State]]]
+
+
+class HistoryBatcher:
+    """Collect history requests and load them together."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the batcher."""
+        self.hass = hass
+        self._pending: list[StateChangesRequest] = []
+        self._loading = False
+
+    @callback
+    def async_add(self, request: StateChangesRequest) -> None:
+        """Queue a request to be loaded with the next batch."""
+        self._pending.append(request)
+        if not self._loading:
+            self._loading = True
+            # Requests made in the same event loop iteration join the batch
+            self.hass.loop.call_soon(self._async_load_pending)
+
+    @callback
+    def _async_load_pending(self) -> None:
+        """Load the pending requests in the recorder executor."""
+        requests, self._pending = self._pending, []
+        self.hass.async_create_background_task(
+            self._async_load(requests), "recorder history batch", eager_start=False
+        )
+
+    async def _async_load(self, requests: list[StateChangesRequest]) -> None:
+        """Load a batch of requests and hand each consumer its result."""
+        try:
+            results = await get_instance(self.hass).async_add_executor_job(
+                _load_batch, self.hass, requests
+            )
+        except Exception as err:  # noqa: BLE001
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(err)
+        else:
+            for request, result in zip(requests, results, strict=True):
+                if not request.future.done():
+                    request.future.set_result(result)
+        finally:
+            # Do not leave the consumers waiting if loading was cancelled
+            for request in requests:
+                if not request.future.done():
+                    request.future.cancel()
+            # Requests made while this batch was loading form the next one
+            if self._pending:
+                self._async_load_pending()
+            else:
+                self._loading = False
+
+
+async def async_state_changes_during_period(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_id: str | None = None,
+    no_attributes: bool = False,
+    descending: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> dict[str, list[State]]:
+    """Return the state changes of an entity, batched with concurrent requests.
+
+    Takes the same arguments as state_changes_during_period. Results of
+    merged requests do not include last_reported, it equals last_updated.
+    Requests with a limit run in their own executor job.
+    """
+    if not entity_id:
+        raise ValueError("entity_id must be provided")
+    if limit:
+        # pylint: disable-next=import-outside-toplevel
+        from . import state_changes_during_period
+
+        return await get_instance(hass).async_add_executor_job(
+            partial(
+                state_changes_during_period,
+                hass,
+                start_time,
+                end_time,
+                entity_id,
+                no_attributes,
+                descending,
+                limit,
+                include_start_time_state,
+            )
+        )
+    if (batcher := hass.data.get(DATA_HISTORY_BATCHER)) is None:
+        batcher = hass.data[DATA_HISTORY_BATCHER] = HistoryBatcher(hass)
+    future: asyncio.Future[dict[str, list[State]]] = hass.loop.create_future()
+    batcher.async_add(
+        StateChangesRequest(
+            entity_id.lower(),
+            start_time,
+            end_time,
+            no_attributes,
+            descending,
+            include_start_time_state,
+            future,
+        )
+    )
+    return await future
+
+
+def _load_batch(
+    hass: HomeAssistant, requests: list[StateChangesRequest]
+) -> list[dict[str, list[State]]]:
+    """Load a batch of requests, merging the ones that allow it."""
+    # pylint: disable-next=import-outside-toplevel
+    from . import state_changes_during_period
+
+    results: dict[int, dict[str, list[State]]] = {}
+    if get_instance(hass).states_meta_manager.active:
+        for indexes in _group_requests(requests):
+            if len({requests[idx].entity_id for idx in indexes}) < 2:
+                continue
+            group = [requests[idx] for idx in indexes]
+            results.update(zip(indexes, _load_merged(hass, group), strict=True))
+    _LOGGER.debug(
+        "Loaded %s of %s history requests with a merged query",
+        len(results),
+        len(requests),
+    )
+    for idx, request in enumerate(requests):
+        if idx not in results:
+            results[idx] = state_changes_during_period(
+                hass,
+                request.start_time,
+                request.end_time,
+                request.entity_id,
+                request.no_attributes,
+                request.descending,
+                None,
+                request.include_start_time_state,
+            )
+    return [results[idx] for idx in range(len(requests))]
+
+
+@dataclass(slots=True)
+class _RequestGroup:
+    """Requests which can share a query."""
+
+    no_attributes: bool
+    start_time: datetime
+    min_end_time: datetime | None
+    max_end_time: datetime | None
+    indexes: list[int]
+
+    def accepts(self, request: StateChangesRequest) -> bool:
+        """Return if a request starting at or after the group can join it."""
+        if (
+            request.no_attributes is not self.no_attributes
+            or request.start_time - self.start_time > MERGE_PERIOD_TOLERANCE
+        ):
+            return False
+        if (end_time := request.end_time) is None or self.min_end_time is None:
+            return end_time is self.min_end_time
+        assert self.max_end_time is not None
+        return (
+            max(self.max_end_time, end_time) - min(self.min_end_time, end_time)
+            <= MERGE_PERIOD_TOLERANCE
+        )
+
+
+def _group_requests(requests: list[StateChangesRequest]) -> list[list[int]]:
+    """Group the indexes of the requests which can share a query.
+
+    The start and end times of the requests of a group are within
+    MERGE_PERIOD_TOLERANCE of each other, so a merged query reads at
+    most that much more than each request asked for.
+    """
+    groups: list[_RequestGroup] = []
+    for idx, request in sorted(
+        enumerate(requests), key=lambda item: item[1].start_time
+    ):
+        for group in groups:
+            if group.accepts(request):
+                group.indexes.append(idx)
+                if (end_time := request.end_time) is not None:
+                    assert group.min_end_time is not None
+                    assert group.max_end_time is not None
+                    group.min_end_time = min(group.min_end_time, end_time)
+                    group.max_end_time = max(group.max_end_time, end_time)
+                break
+        else:
+            groups.append(
+                _RequestGroup(
+                    request.no_attributes,
+                    request.start_time,
+                    request.end_time,
+                    request.end_time,
+                    [idx],
+                )
+            )
+    return [group.indexes for group in groups]
+
+
+def _load_merged(
+    hass: HomeAssistant, requests: list[StateChangesRequest]
+) -> list[dict[str, list[State]]]:
+    """Answer requests for several entities from a single query."""
+    # pylint: disable-next=import-outside-toplevel
+    from .modern import get_full_significant_states_with_session
+
+    start_time = min(request.start_time for request in requests)
+    end_time: datetime | None = None
+    if all(request.end_time for request in requests):
+        end_time = max(request.end_time for request in requests)  # type: ignore[type-var]
+    include_start_time_state = any(
+        request.include_start_time_state for request in requests
+    )
+    with session_scope(hass=hass, read_only=True) as session:
+        entity_states = get_full_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            list(dict.fromkeys(request.entity_id for request in requests)),
+            None,
+            include_start_time_state,
+            significant_changes_only=False,
+            no_attributes=requests[0].no_attributes,
+        )
+    return [
+        _slice_states(request, entity_states.get(request.entity_id), start_time)
+        for request in requests
+    ]
+
+
+def _slice_states(
+    request: StateChangesRequest, states: list[State] | None, query_start: datetime
+) -> dict[str, list[State]]:
+    """Cut the result of a merged query down to what a request asked for.
+
+    The merged query returns attribute changes as well, and its optional
+    start time state is the state at the earliest start of the batch.
+    """
+    if not states:
+        return {}
+    start_time = dt_util.as_utc(request.start_time)
+    end_time = request.end_time
+    start_state: State | None = None
+    changes: list[State] = []
+    for state in states:
+        last_updated = state.last_updated
+        if last_updated <= start_time:
+            if last_updated < start_time or last_updated == query_start:
+                start_state = state
+            continue
+        if end_time is not None and last_updated >= end_time:
+            break
+        if state.last_changed == last_updated:
+            changes.append(state)
+    if request.include_start_time_state and start_state is not None:
+        changes.insert(
+            0,
+            State(
+                request.entity_id,
+                start_state.state,
+                start_state.attributes,
+                last_changed=start_time,
+                last_reported=start_time,
+                last_updated=start_time,
+                validate_entity_id=False,
+            ),
+        )
+    if not changes:
+        return {}
+    if request.descending:
+        changes.reverse()
+    return {request.entity_id: changes}
@@ -53,6 +53,7 @@ from .const import (
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUPS_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -76,6 +77,7 @@ from .db_schema import (
     StatesMeta,
     Statistics,
     StatisticsMeta,
+    StatisticsRollups,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -101,7 +103,12 @@ from .queries import (
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import cleanup_statistics_timestamp_migration, get_start_time
+from .statistics import (
+    cleanup_statistics_timestamp_migration,
+    compile_missing_rollups,
+    get_compiled_statistics_end,
+    get_start_time,
+)
 from .tasks import RecorderTask
 from .util import (
     database_job_retry_wrapper,
@@ -1835,6 +1842,13 @@ class _SchemaVersion47Migrator(_SchemaVersionMigrator, target_version=47):
         )
 
 
+class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The statistics rollup tables are new tables which are created by
+        # Base.metadata.create_all, they are filled by StatisticsRollupsMigration
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2758,6 +2772,37 @@ class EntityIDPostMigration(BaseMigrationWithQuery, BaseRunTimeMigration):
         return has_used_states_entity_ids()
 
 
+class StatisticsRollupsMigration(BaseRunTimeMigration):
+    """Migration to summarize existing statistics into the rollup tables."""
+
+    required_schema_version = STATISTICS_ROLLUPS_SCHEMA_VERSION
+    migration_id = "statistics_rollups"
+    # The number of periods of each rollup table summarized per batch
+    periods_per_batch = 31
+
+    def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
+        """Summarize some periods, returns True if migration is completed."""
+        _LOGGER.debug("Summarizing statistics into the rollup tables")
+        with session_scope(session=instance.get_session()) as session:
+            if (end := get_compiled_statistics_end(session)) is None:
+                is_done = True
+            else:
+                is_done = compile_missing_rollups(session, end, self.periods_per_batch)
+        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> DataMigrationStatus:
+        """Return if the migration needs to run."""
+        needs_migrate = (
+            session.query(StatisticsRollups).first() is None
+            and session.query(Statistics.id).first() is not None
+        )
+        return DataMigrationStatus(
+            needs_migrate=needs_migrate, migration_done=not needs_migrate
+        )
+
+
 NON_LIVE_DATA_MIGRATORS = (
     StatesContextIDMigration,  # Introduced in HA Core 2023.4
     EventsContextIDMigration,  # Introduced in HA Core 2023.4
@@ -2767,6 +2812,7 @@ LIVE_DATA_MIGRATORS = (
     EventTypeIDMigration,
     EntityIDMigration,
     EventIDPostMigration,
+    StatisticsRollupsMigration,  # Introduced in HA Core 2024.12
 )
 
 
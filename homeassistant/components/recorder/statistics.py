@@ -61,8 +61,12 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDay,
+    StatisticsMonth,
+    StatisticsRollups,
     StatisticsRuns,
     StatisticsShortTerm,
+    StatisticsWeek,
 )
 from .models import (
     StatisticData,
@@ -606,6 +610,10 @@ def _compile_statistics(
     if start.minute == 55:
         # A full hour is ready, summarize it
         _compile_hourly_statistics(session, start)
+        # And the days, weeks and months it completes
+        compile_missing_rollups(
+            session, start + StatisticsShortTerm.duration, MAX_ROLLUP_PERIODS_PER_RUN
+        )
 
     session.add(StatisticsRuns(start=start))
 
@@ -1118,6 +1126,208 @@ def _reduce_statistics_per_month(
     )
 
 
+ROLLUP_TABLES: dict[str, type[StatisticsBase]] = {
+    "day": StatisticsDay,
+    "week": StatisticsWeek,
+    "month": StatisticsMonth,
+}
+
+_ROLLUP_PERIOD_FACTORIES: dict[
+    str,
+    Callable[
+        [],
+        tuple[Callable[[float, float], bool], Callable[[float], tuple[float, float]]],
+    ],
+] = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+# The number of periods of each rollup table summarized when an hour is compiled
+MAX_ROLLUP_PERIODS_PER_RUN = 100
+
+
+def _rollup_time_zone() -> str:
+    """Return the name of the time zone periods are summarized in."""
+    return str(dt_util.get_default_time_zone())
+
+
+def _get_rollup_ends(session: Session) -> dict[str, float]:
+    """Return how far each rollup table is summarized in the current time zone."""
+    time_zone = _rollup_time_zone()
+    return {
+        rollup.period: rollup.end_ts
+        for rollup in session.query(StatisticsRollups)
+        if rollup.time_zone == time_zone
+    }
+
+
+def _summarize_rollup_period(
+    session: Session,
+    table: type[StatisticsBase],
+    start_ts: float,
+    end_ts: float,
+    metadata_ids: list[int] | None,
+) -> None:
+    """Summarize the hourly statistics of a period into a rollup table.
+
+    The summary matches the reduction done by _reduce_statistics: mean, min
+    and max are aggregated and last_reset, state and sum are taken from the
+    last hour of the period.
+    """
+    mean_query = (
+        select(
+            Statistics.metadata_id,
+            func.avg(Statistics.mean),
+            func.min(Statistics.min),
+            func.max(Statistics.max),
+        )
+        .filter(Statistics.start_ts >= start_ts)
+        .filter(Statistics.start_ts < end_ts)
+        .group_by(Statistics.metadata_id)
+    )
+    last_query = (
+        select(
+            Statistics.metadata_id,
+            Statistics.last_reset_ts,
+            Statistics.state,
+            Statistics.sum,
+            func.row_number()
+            .over(
+                partition_by=Statistics.metadata_id,
+                order_by=Statistics.start_ts.desc(),
+            )
+            .label("rownum"),
+        )
+        .filter(Statistics.start_ts >= start_ts)
+        .filter(Statistics.start_ts < end_ts)
+    )
+    delete_query = session.query(table).filter(table.start_ts == start_ts)
+    if metadata_ids is not None:
+        mean_query = mean_query.filter(Statistics.metadata_id.in_(metadata_ids))
+        last_query = last_query.filter(Statistics.metadata_id.in_(metadata_ids))
+        delete_query = delete_query.filter(table.metadata_id.in_(metadata_ids))
+    delete_query.delete(synchronize_session=False)
+
+    summary: dict[int, StatisticDataTimestamp] = {
+        metadata_id: {"start_ts": start_ts, "mean": _mean, "min": _min, "max": _max}
+        for metadata_id, _mean, _min, _max in session.execute(mean_query)
+    }
+    last_subquery = last_query.subquery()
+    for metadata_id, last_reset_ts, state, _sum, _ in session.execute(
+        select(last_subquery).filter(last_subquery.c.rownum == 1)
+    ):
+        summary[metadata_id].update(
+            {"last_reset_ts": last_reset_ts, "state": state, "sum": _sum}
+        )
+    session.add_all(
+        table.from_stats_ts(metadata_id, summary_item)
+        for metadata_id, summary_item in summary.items()
+    )
+
+
+def compile_missing_rollups(session: Session, end: datetime, max_periods: int) -> bool:
+    """Summarize the periods which ended before end into the rollup tables.
+
+    Up to max_periods periods are summarized per table, returns True when all
+    tables are summarized up to end. Tables summarized in another time zone
+    are summarized again from the start.
+    """
+    time_zone = _rollup_time_zone()
+    end_ts = end.timestamp()
+    rollups = {rollup.period: rollup for rollup in session.query(StatisticsRollups)}
+    oldest_ts: float | None = None
+    done = True
+    for period, table in ROLLUP_TABLES.items():
+        _, period_start_end = _ROLLUP_PERIOD_FACTORIES[period]()
+        rollup = rollups.get(period)
+        if rollup is not None and rollup.time_zone != time_zone:
+            _LOGGER.debug("Time zone changed, summarizing %s statistics again", period)
+            session.query(table).delete(synchronize_session=False)
+            session.delete(rollup)
+            rollup = None
+        if rollup is None:
+            if oldest_ts is None:
+                oldest_ts = session.query(func.min(Statistics.start_ts)).scalar()
+            if oldest_ts is None:
+                # There are no statistics to summarize yet
+                return True
+            rollup = StatisticsRollups(
+                period=period,
+                time_zone=time_zone,
+                end_ts=period_start_end(oldest_ts)[0],
+            )
+            session.add(rollup)
+        period_start = rollup.end_ts
+        for _ in range(max_periods):
+            if (period_end := period_start_end(period_start)[1]) > end_ts:
+                break
+            _summarize_rollup_period(session, table, period_start, period_end, None)
+            period_start = period_end
+        else:
+            done &= period_start_end(period_start)[1] > end_ts
+        rollup.end_ts = period_start
+    return done
+
+
+def get_compiled_statistics_end(session: Session) -> datetime | None:
+    """Return the end of the last hour which long term statistics are compiled for."""
+    if (last_run := session.query(func.max(StatisticsRuns.start)).scalar()) is None:
+        return None
+    return (process_timestamp(last_run) + StatisticsShortTerm.duration).replace(
+        minute=0, second=0, microsecond=0
+    )
+
+
+def _update_rollups(session: Session, metadata_id: int, starts: list[float]) -> None:
+    """Summarize the rolled up periods with modified hourly statistics again."""
+    for period, rollup_end_ts in _get_rollup_ends(session).items():
+        _, period_start_end = _ROLLUP_PERIOD_FACTORIES[period]()
+        for period_start, period_end in sorted(set(map(period_start_end, starts))):
+            if period_end <= rollup_end_ts:
+                _summarize_rollup_period(
+                    session,
+                    ROLLUP_TABLES[period],
+                    period_start,
+                    period_end,
+                    [metadata_id],
+                )
+
+
+def _adjust_rollups(
+    session: Session, metadata_id: int, start_time: datetime, adj: float
+) -> None:
+    """Apply a sum adjustment to the rollup tables."""
+    for period, rollup_end_ts in _get_rollup_ends(session).items():
+        _, period_start_end = _ROLLUP_PERIOD_FACTORIES[period]()
+        table = ROLLUP_TABLES[period]
+        period_start, period_end = period_start_end(start_time.timestamp())
+        if period_end > rollup_end_ts:
+            continue
+        # The period the adjustment starts in is summarized again,
+        # later periods are adjusted like the hourly statistics
+        _summarize_rollup_period(
+            session, table, period_start, period_end, [metadata_id]
+        )
+        _adjust_sum_statistics(
+            session, table, metadata_id, dt_util.utc_from_timestamp(period_end), adj
+        )
+
+
+def _set_rollup_period_ends(
+    result: dict[str, list[StatisticsRow]], period: str
+) -> None:
+    """Set the end of the rows read from a rollup table in the local time zone."""
+    _, period_start_end = _ROLLUP_PERIOD_FACTORIES[period]()
+    ends: dict[float, float] = {}
+    for rows in result.values():
+        for row in rows:
+            if (start := row["start"]) not in ends:
+                ends[start] = period_start_end(start)[1]
+            row["end"] = ends[start]
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1773,35 +1983,80 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
 
-    if not stats:
+    # Read the periods which are summarized in a rollup table from it,
+    # only the remaining periods are reduced from hourly statistics
+    rollup_stats: Sequence[Row] = ()
+    hourly_start_time = start_time
+    if (rollup_table := ROLLUP_TABLES.get(period)) is not None and (
+        rollup_end_ts := _get_rollup_ends(session).get(period)
+    ) is not None:
+        rollup_end = dt_util.utc_from_timestamp(rollup_end_ts)
+        if end_time is not None and end_time < rollup_end:
+            rollup_end = end_time
+        if start_time < rollup_end:
+            stmt = _generate_statistics_during_period_stmt(
+                start_time, rollup_end, metadata_ids, rollup_table, types
+            )
+            rollup_stats = cast(
+                Sequence[Row],
+                execute_stmt_lambda_element(session, stmt, orm_rows=False),
+            )
+            hourly_start_time = rollup_end
+
+    stats: Sequence[Row] = ()
+    if end_time is None or hourly_start_time < end_time:
+        stmt = _generate_statistics_during_period_stmt(
+            hourly_start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
+
+    if not stats and not rollup_stats:
         return {}
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+    result: dict[str, list[StatisticsRow]] = {}
+    if stats:
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
+
+    if rollup_stats:
+        assert rollup_table is not None
+        rollup_result = _sorted_statistics_to_dict(
+            hass,
+            rollup_stats,
+            statistic_ids,
+            metadata,
+            True,
+            rollup_table,
+            units,
+            types,
+        )
+        _set_rollup_period_ends(rollup_result, period)
+        for statistic_id, rows in result.items():
+            if statistic_id in rollup_result:
+                rollup_result[statistic_id].extend(rows)
+            else:
+                rollup_result[statistic_id] = rows
+        result = rollup_result
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2345,12 +2600,17 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    starts: list[float] = []
     for stat in statistics:
+        starts.append(stat["start"].timestamp())
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
 
+    if table == Statistics:
+        _update_rollups(session, metadata_id, starts)
+
     if table != StatisticsShortTerm:
         return True
 
@@ -2481,6 +2741,13 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        _adjust_rollups(
+            session,
+            metadata[statistic_id][0],
+            start_time.replace(minute=0),
+            sum_adjustment,
+        )
+
     return True
 
 
@@ -2541,6 +2808,7 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            *ROLLUP_TABLES.values(),
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
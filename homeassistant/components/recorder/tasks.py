@@ -11,11 +11,12 @@ import logging
 import threading
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.helpers.dispatcher import dispatcher_send
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
 from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_STATISTICS_HOUR_COMPILED, SIGNAL_STATISTICS_UPDATED
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -54,6 +55,7 @@ class ChangeStatisticsUnitTask(RecorderTask):
             self.new_unit_of_measurement,
             self.old_unit_of_measurement,
         )
+        dispatcher_send(instance.hass, SIGNAL_STATISTICS_UPDATED)
 
 
 @dataclass(slots=True)
@@ -66,6 +68,7 @@ class ClearStatisticsTask(RecorderTask):
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
         statistics.clear_statistics(instance, self.statistic_ids)
+        dispatcher_send(instance.hass, SIGNAL_STATISTICS_UPDATED)
         if self.on_done:
             self.on_done()
 
@@ -87,6 +90,7 @@ class UpdateStatisticsMetadataTask(RecorderTask):
             self.new_statistic_id,
             self.new_unit_of_measurement,
         )
+        dispatcher_send(instance.hass, SIGNAL_STATISTICS_UPDATED)
         if self.on_done:
             self.on_done()
 
@@ -170,6 +174,13 @@ class StatisticsTask(RecorderTask):
     def run(self, instance: Recorder) -> None:
         """Run statistics task."""
         if statistics.compile_statistics(instance, self.start, self.fire_events):
+            if self.start.minute == 55:
+                # A full hour has been summarized
+                dispatcher_send(
+                    instance.hass,
+                    SIGNAL_STATISTICS_HOUR_COMPILED,
+                    self.start + StatisticsShortTerm.duration,
+                )
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(StatisticsTask(self.start, self.fire_events))
@@ -182,6 +193,7 @@ class CompileMissingStatisticsTask(RecorderTask):
     def run(self, instance: Recorder) -> None:
         """Run statistics task to compile missing statistics."""
         if statistics.compile_missing_statistics(instance):
+            dispatcher_send(instance.hass, SIGNAL_STATISTICS_UPDATED)
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(CompileMissingStatisticsTask())
@@ -200,6 +212,7 @@ class ImportStatisticsTask(RecorderTask):
         if statistics.import_statistics(
             instance, self.metadata, self.statistics, self.table
         ):
+            dispatcher_send(instance.hass, SIGNAL_STATISTICS_UPDATED)
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(
@@ -225,6 +238,7 @@ class AdjustStatisticsTask(RecorderTask):
             self.sum_adjustment,
             self.adjustment_unit,
         ):
+            dispatcher_send(instance.hass, SIGNAL_STATISTICS_UPDATED)
             return
         # Schedule a new adjust statistics task if this one didn't finish
         instance.queue_task(
@@ -0,0 +1,250 @@
+"""Incrementally maintained aggregates over the statistics sample window."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+import math
+
+
+class RollingAggregate(ABC):
+    """Aggregate kept up to date while samples enter and leave the window.
+
+    The window is owned by the sensor; the aggregate keeps references to its
+    ``states`` and ``ages`` deques. ``add`` is called after a sample has been
+    appended and ``remove`` after the oldest sample has been popped.
+    """
+
+    def __init__(self, states: deque[float | bool], ages: deque[datetime]) -> None:
+        """Initialize the aggregate."""
+        self._states = states
+        self._ages = ages
+
+    @abstractmethod
+    def add(self) -> None:
+        """Account for the sample appended to the window."""
+
+    @abstractmethod
+    def remove(self, value: float | bool, age: datetime) -> None:
+        """Account for the oldest sample popped from the window."""
+
+
+class _ResyncingAggregate(RollingAggregate):
+    """Floating point aggregate recomputed after a full window of removals.
+
+    Subtracting values from a running float total accumulates rounding errors,
+    so the total is rebuilt exactly once as many samples have been removed as
+    the window holds, keeping the amortized cost per update constant.
+    """
+
+    def __init__(self, states: deque[float | bool], ages: deque[datetime]) -> None:
+        """Initialize the aggregate."""
+        super().__init__(states, ages)
+        self._removals = 0
+
+    def remove(self, value: float | bool, age: datetime) -> None:
+        """Account for the oldest sample popped from the window."""
+        self._removals += 1
+        if self._removals >= len(self._states):
+            self._removals = 0
+            self.resync()
+        else:
+            self._remove(value, age)
+
+    @abstractmethod
+    def _remove(self, value: float | bool, age: datetime) -> None:
+        """Subtract the popped sample from the aggregate."""
+
+    @abstractmethod
+    def resync(self) -> None:
+        """Recompute the aggregate from the window."""
+
+
+class RollingSum(_ResyncingAggregate):
+    """Sum of a function of the samples in the window."""
+
+    def __init__(
+        self,
+        states: deque[float | bool],
+        ages: deque[datetime],
+        func: Callable[[float], float],
+    ) -> None:
+        """Initialize the aggregate."""
+        super().__init__(states, ages)
+        self._func = func
+        self.total: float = 0.0
+
+    def add(self) -> None:
+        """Account for the sample appended to the window."""
+        self.total += self._func(self._states[-1])
+
+    def _remove(self, value: float | bool, age: datetime) -> None:
+        """Subtract the popped sample from the aggregate."""
+        self.total -= self._func(value)
+
+    def resync(self) -> None:
+        """Recompute the aggregate from the window."""
+        self.total = math.fsum(map(self._func, self._states))
+
+
+class RollingPairSum(_ResyncingAggregate):
+    """Sum of a function of each pair of consecutive samples in the window."""
+
+    def __init__(
+        self,
+        states: deque[float | bool],
+        ages: deque[datetime],
+        func: Callable[[float, datetime, float, datetime], float],
+    ) -> None:
+        """Initialize the aggregate."""
+        super().__init__(states, ages)
+        self._func = func
+        self.total: float = 0.0
+
+    def add(self) -> None:
+        """Account for the sample appended to the window."""
+        if len(self._states) >= 2:
+            states = self._states
+            ages = self._ages
+            self.total += self._func(states[-2], ages[-2], states[-1], ages[-1])
+
+    def _remove(self, value: float | bool, age: datetime) -> None:
+        """Subtract the popped sample from the aggregate."""
+        if self._states:
+            self.total -= self._func(value, age, self._states[0], self._ages[0])
+
+    def resync(self) -> None:
+        """Recompute the aggregate from the window."""
+        states = list(self._states)
+        ages = list(self._ages)
+        self.total = math.fsum(
+            self._func(states[i - 1], ages[i - 1], states[i], ages[i])
+            for i in range(1, len(states))
+        )
+
+
+class RollingMoments(_ResyncingAggregate):
+    """Mean and sum of squared deviations using Welford's algorithm."""
+
+    def __init__(self, states: deque[float | bool], ages: deque[datetime]) -> None:
+        """Initialize the aggregate."""
+        super().__init__(states, ages)
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance of the window."""
+        return max(self._m2, 0.0) / (self._count - 1)
+
+    def add(self) -> None:
+        """Account for the sample appended to the window."""
+        value = self._states[-1]
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    def _remove(self, value: float | bool, age: datetime) -> None:
+        """Subtract the popped sample from the aggregate."""
+        self._count -= 1
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._m2 -= delta * (value - self._mean)
+
+    def resync(self) -> None:
+        """Recompute the aggregate from the window."""
+        self._count = len(self._states)
+        if not self._count:
+            self._mean = self._m2 = 0.0
+            return
+        self._mean = math.fsum(self._states) / self._count
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in self._states)
+
+
+class SortedSamples(RollingAggregate):
+    """Samples of the window kept in ascending order."""
+
+    def __init__(self, states: deque[float | bool], ages: deque[datetime]) -> None:
+        """Initialize the aggregate."""
+        super().__init__(states, ages)
+        self.values: list[float] = []
+
+    def add(self) -> None:
+        """Account for the sample appended to the window."""
+        insort(self.values, self._states[-1])
+
+    def remove(self, value: float | bool, age: datetime) -> None:
+        """Account for the oldest sample popped from the window."""
+        del self.values[bisect_left(self.values, value)]
+
+    def median(self) -> float:
+        """Return the median, like statistics.median."""
+        values = self.values
+        half, odd = divmod(len(values), 2)
+        if odd:
+            return values[half]
+        return (values[half - 1] + values[half]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile, like statistics.quantiles(n=100, method="exclusive").
+
+        The window needs to hold at least two samples.
+        """
+        values = self.values
+        count = len(values)
+        m = count + 1
+        j = percentile * m // 100
+        j = max(1, min(j, count - 1))
+        delta = percentile * m - j * 100
+        return (values[j - 1] * (100 - delta) + values[j] * delta) / 100
+
+
+class RollingExtreme(RollingAggregate):
+    """Oldest occurrence of the largest or smallest sample in the window.
+
+    Keeps a monotonic queue of candidates, each tagged with its position in
+    the stream of added samples so removals can be matched in O(1).
+    """
+
+    def __init__(
+        self,
+        states: deque[float | bool],
+        ages: deque[datetime],
+        maximum: bool,
+    ) -> None:
+        """Initialize the aggregate."""
+        super().__init__(states, ages)
+        self._maximum = maximum
+        self._candidates: deque[tuple[int, float, datetime]] = deque()
+        self._added = 0
+        self._removed = 0
+
+    @property
+    def age(self) -> datetime:
+        """Return the age of the extreme sample."""
+        return self._candidates[0][2]
+
+    def add(self) -> None:
+        """Account for the sample appended to the window."""
+        value = self._states[-1]
+        candidates = self._candidates
+        # Equal samples are kept so the oldest occurrence stays in front.
+        if self._maximum:
+            while candidates and candidates[-1][1] < value:
+                candidates.pop()
+        else:
+            while candidates and candidates[-1][1] > value:
+                candidates.pop()
+        candidates.append((self._added, value, self._ages[-1]))
+        self._added += 1
+
+    def remove(self, value: float | bool, age: datetime) -> None:
+        """Account for the oldest sample popped from the window."""
+        if self._candidates[0][0] == self._removed:
+            self._candidates.popleft()
+        self._removed += 1
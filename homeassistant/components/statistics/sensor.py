@@ -8,13 +8,12 @@ import contextlib
 from datetime import datetime, timedelta
 import logging
 import math
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import history
 from homeassistant.components.sensor import (
     DEVICE_CLASS_STATE_CLASSES,
     DEVICE_CLASS_UNITS,
@@ -58,6 +57,14 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .rolling import (
+    RollingAggregate,
+    RollingExtreme,
+    RollingMoments,
+    RollingPairSum,
+    RollingSum,
+    SortedSamples,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -196,6 +203,55 @@ DEFAULT_PRECISION = 2
 ICON = "mdi:calculator"
 
 
+def _sin_degrees(value: float) -> float:
+    return math.sin(math.radians(value))
+
+
+def _cos_degrees(value: float) -> float:
+    return math.cos(math.radians(value))
+
+
+def _trapezoid_area(
+    prev_value: float, prev_age: datetime, value: float, age: datetime
+) -> float:
+    return 0.5 * (value + prev_value) * (age - prev_age).total_seconds()
+
+
+def _step_area(
+    prev_value: float, prev_age: datetime, value: float, age: datetime
+) -> float:
+    return prev_value * (age - prev_age).total_seconds()
+
+
+def _absolute_difference(
+    prev_value: float, prev_age: datetime, value: float, age: datetime
+) -> float:
+    return abs(value - prev_value)
+
+
+def _nonnegative_difference(
+    prev_value: float, prev_age: datetime, value: float, age: datetime
+) -> float:
+    return value - prev_value if value >= prev_value else value - 0
+
+
+def _on_seconds(
+    prev_value: float, prev_age: datetime, value: float, age: datetime
+) -> float:
+    if prev_value is True:
+        return (age - prev_age).total_seconds()
+    return 0.0
+
+
+_PAIR_FUNCTIONS: dict[str, Callable[[float, datetime, float, datetime], float]] = {
+    STAT_AVERAGE_LINEAR: _trapezoid_area,
+    STAT_AVERAGE_STEP: _step_area,
+    STAT_NOISINESS: _absolute_difference,
+    STAT_SUM_DIFFERENCES: _absolute_difference,
+    STAT_SUM_DIFFERENCES_NONNEGATIVE: _nonnegative_difference,
+}
+
+
 def valid_state_characteristic_configuration(config: dict[str, Any]) -> dict[str, Any]:
     """Validate that the characteristic selected is valid for the source sensor type, throw if it isn't."""
     is_binary = split_entity_id(config[CONF_ENTITY_ID])[0] == BINARY_SENSOR_DOMAIN
@@ -362,10 +418,19 @@ class StatisticsSensor(SensorEntity):
         self._percentile: int = percentile
         self._attr_available: bool = False
 
-        self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
-        self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        self.states: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
         self._attr_extra_state_attributes = {}
 
+        self._sum: RollingSum | None = None
+        self._sin_sum: RollingSum | None = None
+        self._cos_sum: RollingSum | None = None
+        self._pair_sum: RollingPairSum | None = None
+        self._moments: RollingMoments | None = None
+        self._sorted: SortedSamples | None = None
+        self._extreme: RollingExtreme | None = None
+        self._aggregates: list[RollingAggregate] = self._create_aggregates()
+
         self._state_characteristic_fn: Callable[[], float | int | datetime | None] = (
             self._callable_characteristic_fn(self._state_characteristic)
         )
@@ -454,6 +519,79 @@ class StatisticsSensor(SensorEntity):
         """Register callbacks."""
         await self._async_stats_sensor_startup()
 
+    def _create_aggregates(self) -> list[RollingAggregate]:
+        """Create the rolling aggregates needed by the state characteristic.
+
+        The aggregates are updated as samples enter and leave the buffer, so
+        the characteristic does not need to walk the whole buffer on every
+        update.
+        """
+        states, ages = self.states, self.ages
+        characteristic = self._state_characteristic
+        if self.is_binary:
+            if characteristic == STAT_AVERAGE_STEP:
+                self._pair_sum = RollingPairSum(states, ages, _on_seconds)
+                return [self._pair_sum]
+            if characteristic in (
+                STAT_AVERAGE_TIMELESS,
+                STAT_COUNT_BINARY_OFF,
+                STAT_COUNT_BINARY_ON,
+                STAT_MEAN,
+            ):
+                self._sum = RollingSum(states, ages, int)
+                return [self._sum]
+            return []
+
+        if characteristic in (STAT_AVERAGE_TIMELESS, STAT_MEAN, STAT_SUM, STAT_TOTAL):
+            self._sum = RollingSum(states, ages, float)
+            return [self._sum]
+        if characteristic == STAT_MEAN_CIRCULAR:
+            self._sin_sum = RollingSum(states, ages, _sin_degrees)
+            self._cos_sum = RollingSum(states, ages, _cos_degrees)
+            return [self._sin_sum, self._cos_sum]
+        if pair_function := _PAIR_FUNCTIONS.get(characteristic):
+            self._pair_sum = RollingPairSum(states, ages, pair_function)
+            return [self._pair_sum]
+        if characteristic in (
+            STAT_DISTANCE_95P,
+            STAT_DISTANCE_99P,
+            STAT_STANDARD_DEVIATION,
+            STAT_VARIANCE,
+        ):
+            self._moments = RollingMoments(states, ages)
+            return [self._moments]
+        if characteristic in (
+            STAT_DISTANCE_ABSOLUTE,
+            STAT_MEDIAN,
+            STAT_PERCENTILE,
+            STAT_VALUE_MAX,
+            STAT_VALUE_MIN,
+        ):
+            self._sorted = SortedSamples(states, ages)
+            return [self._sorted]
+        if characteristic in (STAT_DATETIME_VALUE_MAX, STAT_DATETIME_VALUE_MIN):
+            self._extreme = RollingExtreme(
+                states, ages, maximum=characteristic == STAT_DATETIME_VALUE_MAX
+            )
+            return [self._extreme]
+        return []
+
+    def _add_sample(self, value: float | bool, age: datetime) -> None:
+        """Append a sample to the buffer, evicting the oldest one if it is full."""
+        if len(self.states) == self._samples_max_buffer_size:
+            self._remove_oldest_sample()
+        self.states.append(value)
+        self.ages.append(age)
+        for aggregate in self._aggregates:
+            aggregate.add()
+
+    def _remove_oldest_sample(self) -> None:
+        """Remove the oldest sample from the buffer."""
+        value = self.states.popleft()
+        age = self.ages.popleft()
+        for aggregate in self._aggregates:
+            aggregate.remove(value, age)
+
     def _add_state_to_queue(self, new_state: State) -> None:
         """Add the state to the queue."""
 
@@ -469,12 +607,13 @@ class StatisticsSensor(SensorEntity):
             return
 
         try:
+            value: float | bool
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                value = new_state.state == "on"
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_reported)
+                value = float(new_state.state)
+            self._add_sample(value, new_state.last_reported)
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -616,8 +755,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._remove_oldest_sample()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> datetime | None:
@@ -680,7 +818,7 @@ class StatisticsSensor(SensorEntity):
         if not self._preview_callback:
             self.async_write_ha_state()
 
-    def _fetch_states_from_database(self) -> list[State]:
+    async def _async_fetch_states_from_database(self) -> list[State]:
         """Fetch the states from the database."""
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
         lower_entity_id = self._source_entity_id.lower()
@@ -696,14 +834,15 @@ class StatisticsSensor(SensorEntity):
         else:
             start_date = datetime.fromtimestamp(0, tz=dt_util.UTC)
             _LOGGER.debug("%s: retrieving all records", self.entity_id)
-        return history.state_changes_during_period(
+        states = await history.async_state_changes_during_period(
             self.hass,
             start_date,
             entity_id=lower_entity_id,
             descending=True,
             limit=self._samples_max_buffer_size,
             include_start_time_state=False,
-        ).get(lower_entity_id, [])
+        )
+        return states.get(lower_entity_id, [])
 
     async def _initialize_from_database(self) -> None:
         """Initialize the list of states from the database.
@@ -715,9 +854,7 @@ class StatisticsSensor(SensorEntity):
         If MaxAge is provided then query will restrict to entries younger then
         current datetime - MaxAge.
         """
-        if states := await get_instance(self.hass).async_add_executor_job(
-            self._fetch_states_from_database
-        ):
+        if states := await self._async_fetch_states_from_database():
             for state in reversed(states):
                 self._add_state_to_queue(state)
                 self._calculate_state_attributes(state)
@@ -783,13 +920,7 @@ class StatisticsSensor(SensorEntity):
         if len(self.states) == 1:
             return self.states[0]
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
+            area = cast(RollingPairSum, self._pair_sum).total
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return area / age_range_seconds
         return None
@@ -798,12 +929,7 @@ class StatisticsSensor(SensorEntity):
         if len(self.states) == 1:
             return self.states[0]
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
+            area = cast(RollingPairSum, self._pair_sum).total
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return area / age_range_seconds
         return None
@@ -843,12 +969,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return cast(RollingExtreme, self._extreme).age
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return cast(RollingExtreme, self._extreme).age
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -863,24 +989,25 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            values = cast(SortedSamples, self._sorted).values
+            return values[-1] - values[0]
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return cast(RollingSum, self._sum).total / len(self.states)
         return None
 
     def _stat_mean_circular(self) -> StateType:
         if len(self.states) > 0:
-            sin_sum = sum(math.sin(math.radians(x)) for x in self.states)
-            cos_sum = sum(math.cos(math.radians(x)) for x in self.states)
+            sin_sum = cast(RollingSum, self._sin_sum).total
+            cos_sum = cast(RollingSum, self._cos_sum).total
             return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            return cast(SortedSamples, self._sorted).median()
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -894,40 +1021,33 @@ class StatisticsSensor(SensorEntity):
         if len(self.states) == 1:
             return self.states[0]
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            return cast(SortedSamples, self._sorted).percentile(self._percentile)
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) == 1:
             return 0.0
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return math.sqrt(cast(RollingMoments, self._moments).variance)
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return cast(RollingSum, self._sum).total
         return None
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) == 1:
             return 0.0
         if len(self.states) >= 2:
-            return sum(
-                abs(j - i)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return cast(RollingPairSum, self._pair_sum).total
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) == 1:
             return 0.0
         if len(self.states) >= 2:
-            return sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return cast(RollingPairSum, self._pair_sum).total
         return None
 
     def _stat_total(self) -> StateType:
@@ -935,19 +1055,19 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return cast(SortedSamples, self._sorted).values[-1]
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return cast(SortedSamples, self._sorted).values[0]
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) == 1:
             return 0.0
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return cast(RollingMoments, self._moments).variance
         return None
 
     # Statistics for binary sensor
@@ -956,10 +1076,7 @@ class StatisticsSensor(SensorEntity):
         if len(self.states) == 1:
             return 100.0 * int(self.states[0] is True)
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
+            on_seconds = cast(RollingPairSum, self._pair_sum).total
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return 100 / age_range_seconds * on_seconds
         return None
@@ -971,10 +1088,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return int(cast(RollingSum, self._sum).total)
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - int(cast(RollingSum, self._sum).total)
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -984,5 +1101,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * cast(RollingSum, self._sum).total
         return None
@@ -102,6 +102,9 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # Joined part data, stored once the segment is complete so that concurrent
+    # viewers share a single buffer instead of joining the parts per request
+    _data: bytes | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -121,6 +124,8 @@ class Segment:
     @property
     def data_size(self) -> int:
         """Return the size of all part data without init in bytes."""
+        if self._data is not None:
+            return len(self._data)
         return sum(len(part.data) for part in self.parts)
 
     @callback
@@ -139,8 +144,17 @@ class Segment:
             output.part_put()
 
     def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
-        return b"".join([part.data for part in self.parts])
+        """Return reconstructed data for all parts as bytes, without init.
+
+        The result is cached once the segment is complete since no more parts
+        will be added.
+        """
+        if self._data is not None:
+            return self._data
+        data = b"".join([part.data for part in self.parts])
+        if self.complete:
+            self._data = data
+        return data
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
@@ -64,6 +64,8 @@ class HlsStreamOutput(StreamOutput):
             deque_maxlen=MAX_SEGMENTS,
         )
         self._target_duration = stream_settings.min_segment_duration
+        # Encoded playlist shared by all viewers until the next segment or part
+        self._rendered_playlist: bytes | None = None
 
     @property
     def name(self) -> str:
@@ -74,6 +76,7 @@ class HlsStreamOutput(StreamOutput):
         """Handle cleanup."""
         super().cleanup()
         self._segments.clear()
+        self._rendered_playlist = None
 
     @property
     def target_duration(self) -> float:
@@ -88,12 +91,24 @@ class HlsStreamOutput(StreamOutput):
         Technically it should not change per the hls spec, but some cameras adjust
         their GOPs periodically so we need to account for this change.
         """
+        self._rendered_playlist = None
         super()._async_put(segment)
         self._target_duration = (
             max((s.duration for s in self._segments), default=segment.duration)
             or self.stream_settings.min_segment_duration
         )
 
+    def part_put(self) -> None:
+        """Invalidate the rendered playlist and signal the latest part segment."""
+        self._rendered_playlist = None
+        super().part_put()
+
+    def render_playlist(self) -> bytes:
+        """Return the encoded HLS playlist, rendering it only when it changed."""
+        if self._rendered_playlist is None:
+            self._rendered_playlist = HlsPlaylistView.render(self).encode("utf-8")
+        return self._rendered_playlist
+
     def discontinuity(self) -> None:
         """Fix incomplete segment at end of deque."""
         self._hass.loop.call_soon_threadsafe(self._async_discontinuity)
@@ -102,6 +117,7 @@ class HlsStreamOutput(StreamOutput):
     def _async_discontinuity(self) -> None:
         """Fix incomplete segment at end of deque in event loop."""
         # Fill in the segment duration or delete the segment if empty
+        self._rendered_playlist = None
         if self._segments:
             if (last_segment := self._segments[-1]).parts:
                 last_segment.duration = sum(
@@ -325,7 +341,7 @@ class HlsPlaylistView(StreamView):
                 return self.not_found(blocking_request, track.target_duration)
 
         response = web.Response(
-            body=self.render(track).encode("utf-8"),
+            body=track.render_playlist(),
             headers={
                 "Content-Type": FORMAT_CONTENT_TYPE[HLS_PROVIDER],
             },
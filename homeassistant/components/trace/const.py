@@ -9,11 +9,16 @@ from homeassistant.util.hass_dict import HassKey
 if TYPE_CHECKING:
     from homeassistant.helpers.storage import Store
 
-    from .models import TraceData
+    from .models import TraceData, TraceMemory
 
 
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE: HassKey[TraceData] = HassKey("trace")
+DATA_TRACE_MEMORY: HassKey[TraceMemory] = HassKey("trace_memory")
 DATA_TRACE_STORE: HassKey[Store[dict[str, list]]] = HassKey("trace_store")
 DATA_TRACES_RESTORED: HassKey[bool] = HassKey("trace_traces_restored")
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+# Bytes of finished traces kept in memory for all scripts and automations
+TRACE_MEMORY_BUDGET = 16 * 1024 * 1024
+# Finished traces kept unencoded before the oldest one is encoded
+TRACE_ENCODE_AFTER = 64
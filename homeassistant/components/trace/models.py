@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import abc
-from collections import deque
+from collections import OrderedDict, deque
 import datetime as dt
+import logging
 from typing import Any
+import zlib
+
+import orjson
 
 from homeassistant.core import Context
+from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -16,11 +21,30 @@ from homeassistant.helpers.trace import (
     trace_set_child_id,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 import homeassistant.util.uuid as uuid_util
 
+_LOGGER = logging.getLogger(__name__)
+
 type TraceData = dict[str, LimitedSizeDict[str, BaseTrace]]
 
+_JSON_ENCODER = ExtendedJSONEncoder()
+
+
+def _encode_trace(data: dict[str, Any]) -> bytes:
+    """Encode a trace like the websocket API and storage do, compressed."""
+    return zlib.compress(
+        orjson.dumps(
+            data,
+            default=_JSON_ENCODER.default,
+            option=orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME,
+        ),
+        1,
+    )
+
 
 class BaseTrace(abc.ABC):
     """Base container for a script or automation trace."""
@@ -49,6 +73,7 @@ class ActionTrace(BaseTrace):
     """Base container for a script or automation trace."""
 
     _domain: str | None = None
+    _memory: TraceMemory | None = None
 
     def __init__(
         self,
@@ -71,6 +96,7 @@ class ActionTrace(BaseTrace):
         self.key = f"{self._domain}.{item_id}"
         self._dict: dict[str, Any] | None = None
         self._short_dict: dict[str, Any] | None = None
+        self._encoded: bytes | None = None
         if trace_id_get():
             trace_set_child_id(self.key, self.run_id)
         trace_id_set((self.key, self.run_id))
@@ -83,14 +109,45 @@ class ActionTrace(BaseTrace):
         """Set error."""
         self._error = ex
 
+    def set_memory(self, memory: TraceMemory) -> None:
+        """Set the memory accounting the trace once finished."""
+        self._memory = memory
+
+    @property
+    def size(self) -> int | None:
+        """Return the size of the encoded trace, None if it is not encoded."""
+        return None if self._encoded is None else len(self._encoded)
+
     def finished(self) -> None:
         """Set finish time."""
         self._timestamp_finish = dt_util.utcnow()
         self._state = "stopped"
         self._script_execution = script_execution_get()
+        if self._memory is not None:
+            self._memory.add(self)
+
+    def encode(self) -> None:
+        """Replace the trace of the stopped execution by its encoding.
+
+        The trace elements reference the variables before each step, a
+        script looping over a large list keeps many copies of them alive.
+        The encoding only holds the variables changed by each step and is
+        decoded when the trace is requested.
+        """
+        if self._encoded is not None:
+            return
+        try:
+            self._encoded = _encode_trace(self.as_extended_dict())
+        except TypeError:
+            _LOGGER.debug("Unable to encode trace %s %s", self.key, self.run_id)
+            return
+        self._dict = None
+        self._trace = None
 
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
+        if self._encoded is not None:
+            return json_loads(zlib.decompress(self._encoded))  # type: ignore[return-value]
         if self._dict:
             return self._dict
 
@@ -172,3 +229,56 @@ class RestoredTrace(BaseTrace):
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this RestoredTrace."""
         return self._short_dict  # type: ignore[no-any-return]
+
+
+class TraceMemory:
+    """Evict finished traces which do not fit in the memory budget.
+
+    Finished traces are encoded once encode_after more traces have finished.
+    By then the traces of frequently running scripts and automations have
+    been replaced, so they are never encoded. Encoded traces are accounted by
+    the size of their encoding and evicted in least recently used order
+    across all scripts and automations.
+    """
+
+    def __init__(self, traces: TraceData, budget: int, encode_after: int) -> None:
+        """Initialize the memory accounting."""
+        self._traces = traces
+        self._budget = budget
+        self._encode_after = encode_after
+        self._unencoded: deque[ActionTrace] = deque()
+        self._sizes: OrderedDict[tuple[str, str], int] = OrderedDict()
+        self.size = 0
+
+    def add(self, trace: ActionTrace) -> None:
+        """Queue a finished trace and encode the traces finished before it."""
+        unencoded = self._unencoded
+        unencoded.append(trace)
+        while len(unencoded) > self._encode_after:
+            self._encode(unencoded.popleft())
+
+    def _encode(self, trace: ActionTrace) -> None:
+        """Encode a trace which is still stored and evict the traces over budget."""
+        key, run_id = trace.key, trace.run_id
+        if (traces := self._traces.get(key)) is None or traces.get(run_id) is not trace:
+            return
+        trace.encode()
+        if (size := trace.size) is None:
+            return
+        self._sizes[(key, run_id)] = size
+        self.size += size
+        # The newest trace is kept even if it is larger than the budget
+        while self.size > self._budget and len(self._sizes) > 1:
+            (evict_key, evict_run_id), evict_size = self._sizes.popitem(last=False)
+            self.size -= evict_size
+            self._traces[evict_key].pop(evict_run_id, None)
+
+    def discard(self, key: str, run_id: str) -> None:
+        """Stop accounting a trace which was removed."""
+        if (size := self._sizes.pop((key, run_id), None)) is not None:
+            self.size -= size
+
+    def touch(self, key: str, run_id: str) -> None:
+        """Mark a trace as recently used."""
+        if (key, run_id) in self._sizes:
+            self._sizes.move_to_end((key, run_id))
@@ -10,7 +10,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
-from .const import DATA_TRACE, DATA_TRACE_STORE, DATA_TRACES_RESTORED
+from .const import DATA_TRACE, DATA_TRACE_MEMORY, DATA_TRACE_STORE, DATA_TRACES_RESTORED
 from .models import ActionTrace, BaseTrace, RestoredTrace, TraceData
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,7 +23,9 @@ async def async_get_trace(
     # Restore saved traces if not done
     await async_restore_traces(hass)
 
-    return hass.data[DATA_TRACE][key][run_id].as_extended_dict()
+    trace = hass.data[DATA_TRACE][key][run_id]
+    hass.data[DATA_TRACE_MEMORY].touch(key, run_id)
+    return trace.as_extended_dict()
 
 
 async def async_list_contexts(
@@ -84,11 +86,18 @@ def async_store_trace(
     """Store a trace if its key is valid."""
     if key := trace.key:
         traces = hass.data[DATA_TRACE]
+        memory = hass.data[DATA_TRACE_MEMORY]
         if key not in traces:
             traces[key] = LimitedSizeDict(size_limit=stored_traces)
         else:
             traces[key].size_limit = stored_traces
-        traces[key][trace.run_id] = trace
+        key_traces = traces[key]
+        # Evict the oldest traces here to keep the memory accounting up to date
+        while key_traces and len(key_traces) >= stored_traces:
+            run_id, _ = key_traces.popitem(last=False)
+            memory.discard(key, run_id)
+        key_traces[trace.run_id] = trace
+        trace.set_memory(memory)
 
 
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
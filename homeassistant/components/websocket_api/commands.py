@@ -59,7 +59,11 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.setup import (
+    async_get_loaded_integrations,
+    async_get_setup_timings,
+    async_get_setup_trace,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -86,6 +90,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_setup_trace)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -570,6 +575,15 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/setup_trace"})
+def handle_integration_setup_trace(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration setup trace command."""
+    connection.send_result(msg["id"], async_get_setup_trace(hass))
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
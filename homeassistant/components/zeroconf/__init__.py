@@ -265,7 +265,7 @@ def _build_homekit_model_lookups(
     homekit_model_matchers: dict[re.Pattern, HomeKitDiscoveredIntegration] = {}
 
     for model, discovery in homekit_models.items():
-        if "*" in model or "?" in model or "[" in model:
+        if _is_fnmatch_pattern(model):
             homekit_model_matchers[_compile_fnmatch(model)] = discovery
         else:
             homekit_model_lookup[model] = discovery
@@ -326,15 +326,121 @@ async def _async_register_hass_zc_service(
     await aio_zc.async_register_service(info, allow_name_change=True)
 
 
-def _match_against_props(matcher: dict[str, str], props: dict[str, str | None]) -> bool:
-    """Check a matcher to ensure all values in props."""
-    for key, value in matcher.items():
-        prop_val = props.get(key)
-        if prop_val is None or not _memorized_fnmatch(prop_val.lower(), value):
+def _is_fnmatch_pattern(pattern: str) -> bool:
+    """Return if a string contains fnmatch special characters."""
+    return "*" in pattern or "?" in pattern or "[" in pattern
+
+
+def _match_against_props(
+    matcher: list[tuple[str, str, re.Pattern | None]], props: dict[str, str | None]
+) -> bool:
+    """Check a compiled properties matcher to ensure all values in props."""
+    for key, value, pattern in matcher:
+        if (prop_val := props.get(key)) is None:
+            return False
+        prop_val = prop_val.lower()
+        if pattern is None:
+            if prop_val != value:
+                return False
+        elif not pattern.match(prop_val):
             return False
     return True
 
 
+class ZeroconfTypeMatchers:
+    """Matchers of a zeroconf type indexed by their name pattern.
+
+    Exact names are looked up in a dict, names starting with a
+    fixed prefix are looked up by each prefix length and only the
+    remaining name patterns are matched as regular expressions.
+    """
+
+    __slots__ = (
+        "_domains",
+        "_properties",
+        "_any_name",
+        "_names",
+        "_prefixes",
+        "_prefix_lengths",
+        "_name_patterns",
+    )
+
+    def __init__(self, matchers: list[ZeroconfMatcher]) -> None:
+        """Build the index."""
+        self._domains: list[str] = []
+        self._properties: list[list[tuple[str, str, re.Pattern | None]] | None] = []
+        self._any_name: list[int] = []
+        self._names: dict[str, list[int]] = {}
+        self._prefixes: dict[str, list[int]] = {}
+        self._name_patterns: list[tuple[re.Pattern, int]] = []
+        for index, matcher in enumerate(matchers):
+            self._domains.append(matcher[ATTR_DOMAIN])
+            if properties := matcher.get(ATTR_PROPERTIES):
+                self._properties.append(
+                    [
+                        (
+                            key,
+                            value,
+                            _compile_fnmatch(value)
+                            if _is_fnmatch_pattern(value)
+                            else None,
+                        )
+                        for key, value in properties.items()
+                    ]
+                )
+            else:
+                self._properties.append(None)
+            if not (name := matcher.get(ATTR_NAME)):
+                self._any_name.append(index)
+            elif not _is_fnmatch_pattern(name):
+                self._names.setdefault(name, []).append(index)
+            elif name.endswith("*") and not _is_fnmatch_pattern(name[:-1]):
+                self._prefixes.setdefault(name[:-1], []).append(index)
+            else:
+                self._name_patterns.append((_compile_fnmatch(name), index))
+        self._prefix_lengths = sorted({len(prefix) for prefix in self._prefixes})
+
+    def async_matching_domains(
+        self, name: str, props: dict[str, str | None]
+    ) -> list[str]:
+        """Return the domains of the matchers matching, in matcher order.
+
+        The name must already be lower case.
+        """
+        candidates = self._any_name
+        if indexes := self._names.get(name):
+            candidates = [*candidates, *indexes]
+        name_len = len(name)
+        for length in self._prefix_lengths:
+            if length > name_len:
+                break
+            if indexes := self._prefixes.get(name[:length]):
+                candidates = [*candidates, *indexes]
+        for pattern, index in self._name_patterns:
+            if pattern.match(name):
+                candidates = [*candidates, index]
+        if candidates is not self._any_name:
+            candidates = sorted(candidates)
+        properties = self._properties
+        return [
+            self._domains[index]
+            for index in candidates
+            if (matcher := properties[index]) is None
+            or _match_against_props(matcher, props)
+        ]
+
+
+def _build_zeroconf_type_matchers(
+    zeroconf_types: dict[str, list[ZeroconfMatcher]],
+) -> dict[str, ZeroconfTypeMatchers]:
+    """Build the matcher index of each zeroconf type."""
+    return {
+        service_type: ZeroconfTypeMatchers(matchers)
+        for service_type, matchers in zeroconf_types.items()
+        if matchers
+    }
+
+
 def is_homekit_paired(props: dict[str, Any]) -> bool:
     """Check properties to see if a device is homekit paired."""
     if HOMEKIT_PAIRED_STATUS_FLAG not in props:
@@ -363,6 +469,7 @@ class ZeroconfDiscovery:
         self.zeroconf_types = zeroconf_types
         self.homekit_model_lookups = homekit_model_lookups
         self.homekit_model_matchers = homekit_model_matchers
+        self.zeroconf_type_matchers = _build_zeroconf_type_matchers(zeroconf_types)
         self.async_service_browser: AsyncServiceBrowser | None = None
 
     async def async_setup(self) -> None:
@@ -523,23 +630,14 @@ class ZeroconfDiscovery:
                 # discover it, we can stop here.
                 return
 
-        if not (matchers := self.zeroconf_types.get(service_type)):
+        # Not all homekit types are currently used for discovery
+        # so not all service type exist in zeroconf_type_matchers
+        if not (type_matchers := self.zeroconf_type_matchers.get(service_type)):
             return
 
-        # Not all homekit types are currently used for discovery
-        # so not all service type exist in zeroconf_types
-        for matcher in matchers:
-            if len(matcher) > 1:
-                if ATTR_NAME in matcher and not _memorized_fnmatch(
-                    info.name.lower(), matcher[ATTR_NAME]
-                ):
-                    continue
-                if ATTR_PROPERTIES in matcher and not _match_against_props(
-                    matcher[ATTR_PROPERTIES], props
-                ):
-                    continue
-
-            matcher_domain = matcher[ATTR_DOMAIN]
+        for matcher_domain in type_matchers.async_matching_domains(
+            info.name.lower(), props
+        ):
             # Create a type annotated regular dict since this is a hot path and creating
             # a regular dict is slightly cheaper than calling ConfigFlowContext
             context: config_entries.ConfigFlowContext = {
@@ -659,18 +757,3 @@ def _truncate_location_name_to_valid(location_name: str) -> str:
 def _compile_fnmatch(pattern: str) -> re.Pattern:
     """Compile a fnmatch pattern."""
     return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    Zeroconf has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
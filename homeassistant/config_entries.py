@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections import UserDict, defaultdict
+import bisect
+from collections import Counter, UserDict, defaultdict
 from collections.abc import (
+    AsyncGenerator,
     Callable,
     Coroutine,
     Generator,
@@ -13,12 +15,14 @@ from collections.abc import (
     Mapping,
     ValuesView,
 )
+from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from copy import deepcopy
 from datetime import datetime
 from enum import Enum, StrEnum
 import functools
 from functools import cache
+from itertools import count
 import logging
 from random import randint
 from types import MappingProxyType
@@ -541,11 +545,12 @@ class ConfigEntry(Generic[_DataT]):
         if self.source == SOURCE_IGNORE or self.disabled_by:
             return
 
-        current_entry.set(self)
-        try:
-            await self.__async_setup_with_context(hass, integration)
-        finally:
-            current_entry.set(None)
+        async with hass.config_entries.setup_scheduler.async_slot(self):
+            current_entry.set(self)
+            try:
+                await self.__async_setup_with_context(hass, integration)
+            finally:
+                current_entry.set(None)
 
     async def __async_setup_with_context(
         self,
@@ -1792,6 +1797,101 @@ class ConfigEntryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
         return data
 
 
+class ConfigEntrySetupScheduler:
+    """Limit how many config entries are set up at the same time.
+
+    The limits are set in the core config and are unlimited by default. When
+    a limit is reached, the waiting entries which are prioritized, e.g.
+    because automations depend on them, are set up first.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._priority_entry_ids: set[str] = set()
+        self._running = 0
+        self._running_per_domain: Counter[str] = Counter()
+        # Waiting entries sorted by priority and then by arrival
+        self._waiting: list[tuple[bool, int, str, asyncio.Future[None]]] = []
+        self._arrival = count()
+
+    @callback
+    def async_prioritize(self, entry_ids: Iterable[str]) -> None:
+        """Set up the given config entries before the other waiting entries."""
+        self._priority_entry_ids = set(entry_ids)
+
+    @callback
+    def _async_can_start(self, domain: str) -> bool:
+        """Return if a config entry of the domain can be set up now."""
+        config = self.hass.config
+        if (
+            limit := config.max_parallel_config_entry_setups
+        ) is not None and self._running >= limit:
+            return False
+        return (
+            limit := config.max_parallel_config_entry_setups_per_domain.get(domain)
+        ) is None or self._running_per_domain[domain] < limit
+
+    @callback
+    def _async_start(self, domain: str) -> None:
+        """Count a config entry setup as running."""
+        self._running += 1
+        self._running_per_domain[domain] += 1
+
+    @callback
+    def _async_finish(self, domain: str) -> None:
+        """Count a config entry setup as done and start the waiting ones."""
+        self._running -= 1
+        self._running_per_domain[domain] -= 1
+        for waiting in list(self._waiting):
+            _, _, waiting_domain, future = waiting
+            if future.done() or not self._async_can_start(waiting_domain):
+                continue
+            self._waiting.remove(waiting)
+            # The slot is handed over before the waiting setup resumes, so
+            # a setup arriving in the meantime cannot take it
+            self._async_start(waiting_domain)
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def async_slot(self, entry: ConfigEntry) -> AsyncGenerator[None]:
+        """Wait until the config entry can be set up."""
+        if current_entry.get() is not None:
+            # Config entries set up by another config entry, e.g. a
+            # dependency, are not held back as the other entry waits for them
+            yield
+            return
+
+        domain = entry.domain
+        if self._async_can_start(domain):
+            self._async_start(domain)
+        else:
+            future: asyncio.Future[None] = self.hass.loop.create_future()
+            waiting = (
+                entry.entry_id not in self._priority_entry_ids,
+                next(self._arrival),
+                domain,
+                future,
+            )
+            bisect.insort(self._waiting, waiting)
+            _LOGGER.debug(
+                "Waiting to set up %s (%s %s)", entry.title, domain, entry.entry_id
+            )
+            try:
+                await future
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    # The slot was handed over before the cancellation
+                    self._async_finish(domain)
+                elif waiting in self._waiting:
+                    self._waiting.remove(waiting)
+                raise
+        try:
+            yield
+        finally:
+            self._async_finish(domain)
+
+
 class ConfigEntries:
     """Manage the configuration entries.
 
@@ -1806,6 +1906,7 @@ class ConfigEntries:
         self._hass_config = hass_config
         self._entries = ConfigEntryItems(hass)
         self._store = ConfigEntryStore(hass)
+        self.setup_scheduler = ConfigEntrySetupScheduler(hass)
         EntityRegistryDisabledHandler(hass).async_setup()
 
     @callback
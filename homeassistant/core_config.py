@@ -83,8 +83,11 @@ _LOGGER = logging.getLogger(__name__)
 
 DATA_CUSTOMIZE: HassKey[EntityValues] = HassKey("hass_customize")
 
+CONF_CONFIG_ENTRY_SETUP: Final = "config_entry_setup"
 CONF_CREDENTIAL: Final = "credential"
 CONF_ICE_SERVERS: Final = "ice_servers"
+CONF_MAX_PARALLEL: Final = "max_parallel"
+CONF_MAX_PARALLEL_PER_INTEGRATION: Final = "max_parallel_per_integration"
 CONF_WEBRTC: Final = "webrtc"
 
 CORE_STORAGE_KEY = "core.config"
@@ -300,6 +303,18 @@ CORE_CONFIG_SCHEMA = vol.All(
             vol.Optional(CONF_COUNTRY): cv.country,
             vol.Optional(CONF_LANGUAGE): cv.language,
             vol.Optional(CONF_DEBUG): cv.boolean,
+            vol.Optional(CONF_CONFIG_ENTRY_SETUP): vol.Schema(
+                {
+                    vol.Optional(CONF_MAX_PARALLEL): vol.All(
+                        vol.Coerce(int), vol.Range(min=1)
+                    ),
+                    vol.Optional(
+                        CONF_MAX_PARALLEL_PER_INTEGRATION
+                    ): cv.schema_with_slug_keys(
+                        vol.All(vol.Coerce(int), vol.Range(min=1))
+                    ),
+                }
+            ),
             vol.Optional(CONF_WEBRTC): vol.Schema(
                 {
                     vol.Required(CONF_ICE_SERVERS): vol.All(
@@ -389,6 +404,13 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: dict) -> Non
     if config.get(CONF_DEBUG):
         hac.debug = True
 
+    if CONF_CONFIG_ENTRY_SETUP in config:
+        setup_config = config[CONF_CONFIG_ENTRY_SETUP]
+        hac.max_parallel_config_entry_setups = setup_config.get(CONF_MAX_PARALLEL)
+        hac.max_parallel_config_entry_setups_per_domain = setup_config.get(
+            CONF_MAX_PARALLEL_PER_INTEGRATION, {}
+        )
+
     if CONF_WEBRTC in config:
         hac.webrtc.ice_servers = [
             RTCIceServer(
@@ -584,6 +606,11 @@ class Config:
 
         self.webrtc = RTCConfiguration()
 
+        # How many config entries are set up at the same time, in total and
+        # per integration, None and missing integrations are unlimited
+        self.max_parallel_config_entry_setups: int | None = None
+        self.max_parallel_config_entry_setups_per_domain: dict[str, int] = {}
+
     def async_initialize(self) -> None:
         """Finish initializing a config object.
 
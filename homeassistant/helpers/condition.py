@@ -11,6 +11,7 @@ import functools as ft
 import logging
 import re
 import sys
+from time import perf_counter
 from typing import Any, Protocol, cast
 
 import voluptuous as vol
@@ -65,6 +66,7 @@ from .template import Template, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_id_get,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -92,6 +94,36 @@ _PLATFORM_ALIASES = {
     "zone": None,
 }
 
+# Relative costs of evaluating conditions, and and or conditions evaluate
+# cheap conditions first as they are likely to decide the result
+_COST_CHEAP = 0
+_COST_NUMERIC = 1
+_COST_EXPENSIVE = 2
+
+_CONDITION_COSTS = {
+    "numeric_state": _COST_NUMERIC,
+    "state": _COST_CHEAP,
+    "sun": _COST_NUMERIC,
+    "time": _COST_NUMERIC,
+    "trigger": _COST_CHEAP,
+    "zone": _COST_NUMERIC,
+}
+
+# Conditions which only read state, they may be evaluated in any order.
+# Device and integration provided conditions are not reordered.
+_SIDE_EFFECT_FREE_CONDITIONS = {
+    "and",
+    "not",
+    "numeric_state",
+    "or",
+    "state",
+    "sun",
+    "template",
+    "time",
+    "trigger",
+    "zone",
+}
+
 INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
@@ -177,14 +209,67 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
         """Trace condition."""
-        with trace_condition(variables):
-            result = condition(hass, variables)
+        with trace_condition(variables) as trace_element:
+            if trace_id_get() is None:
+                result = condition(hass, variables)
+            else:
+                # Only record the time taken when the trace is stored
+                start = perf_counter()
+                try:
+                    result = condition(hass, variables)
+                finally:
+                    trace_element.set_duration(perf_counter() - start)
             condition_trace_update_result(result=result)
             return result
 
     return wrapper
 
 
+def _condition_cost(config: ConfigType) -> int:
+    """Return the relative cost of evaluating a condition."""
+    if not isinstance(config, dict):
+        return _COST_EXPENSIVE
+    cost = _CONDITION_COSTS.get(config.get(CONF_CONDITION), _COST_EXPENSIVE)  # type: ignore[arg-type]
+    if CONF_VALUE_TEMPLATE in config:
+        return _COST_EXPENSIVE
+    return cost
+
+
+def _is_side_effect_free(config: ConfigType) -> bool:
+    """Return if a condition only reads state."""
+    if not isinstance(config, dict):
+        return False
+    if config.get(CONF_CONDITION) not in _SIDE_EFFECT_FREE_CONDITIONS:
+        return False
+    return all(
+        _is_side_effect_free(condition) for condition in config.get("conditions", ())
+    )
+
+
+def _plan_checks(configs: list[ConfigType]) -> list[int]:
+    """Return the order to evaluate conditions in, cheapest first.
+
+    Only conditions which read state are reordered, conditions which may
+    have side effects keep their position and nothing is moved across them.
+    Conditions of the same cost are evaluated in config order.
+
+    Reordering changes which conditions are evaluated before the result is
+    decided, and so which conditions appear in the trace and in what order.
+    """
+    costs = [_condition_cost(config) for config in configs]
+    plan: list[int] = []
+    segment: list[int] = []
+    for index, config in enumerate(configs):
+        if _is_side_effect_free(config):
+            segment.append(index)
+            continue
+        plan.extend(sorted(segment, key=costs.__getitem__))
+        plan.append(index)
+        segment = []
+    plan.extend(sorted(segment, key=costs.__getitem__))
+    return plan
+
+
 async def _async_get_condition_platform(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionProtocol | None:
@@ -263,6 +348,7 @@ async def async_and_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'AND'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    plan = [(index, checks[index]) for index in _plan_checks(config["conditions"])]
 
     @trace_condition_function
     def if_and_condition(
@@ -270,7 +356,7 @@ async def async_and_from_config(
     ) -> bool:
         """Test and condition."""
         errors = []
-        for index, check in enumerate(checks):
+        for index, check in plan:
             try:
                 with trace_path(["conditions", str(index)]):
                     if check(hass, variables) is False:
@@ -282,6 +368,7 @@ async def async_and_from_config(
 
         # Raise the errors if no check was false
         if errors:
+            errors.sort(key=lambda error: error.index)
             raise ConditionErrorContainer("and", errors=errors)
 
         return True
@@ -294,6 +381,7 @@ async def async_or_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'OR'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    plan = [(index, checks[index]) for index in _plan_checks(config["conditions"])]
 
     @trace_condition_function
     def if_or_condition(
@@ -301,7 +389,7 @@ async def async_or_from_config(
     ) -> bool:
         """Test or condition."""
         errors = []
-        for index, check in enumerate(checks):
+        for index, check in plan:
             try:
                 with trace_path(["conditions", str(index)]):
                     if check(hass, variables) is True:
@@ -313,6 +401,7 @@ async def async_or_from_config(
 
         # Raise the errors if no check was true
         if errors:
+            errors.sort(key=lambda error: error.index)
             raise ConditionErrorContainer("or", errors=errors)
 
         return False
@@ -498,19 +587,47 @@ def async_numeric_state(
     return True
 
 
+def _async_get_threshold(
+    hass: HomeAssistant,
+    threshold: float | str | None,
+    parsed: dict[str, tuple[State, float]],
+) -> float | str | None:
+    """Return a threshold, parsing the state of a threshold entity.
+
+    The parsed state is reused until the state of the entity changes. States
+    which can't be parsed are returned as entity ID for async_numeric_state
+    to report them.
+    """
+    if not isinstance(threshold, str):
+        return threshold
+    if (threshold_state := hass.states.get(threshold)) is None:
+        return threshold
+    if (cached := parsed.get(threshold)) is not None and cached[0] is threshold_state:
+        return cached[1]
+    try:
+        value = float(threshold_state.state)
+    except ValueError:
+        return threshold
+    parsed[threshold] = (threshold_state, value)
+    return value
+
+
 def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
     """Wrap action method with state based condition."""
     entity_ids = config.get(CONF_ENTITY_ID, [])
     attribute = config.get(CONF_ATTRIBUTE)
-    below = config.get(CONF_BELOW)
-    above = config.get(CONF_ABOVE)
+    below_threshold = config.get(CONF_BELOW)
+    above_threshold = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
+    parsed_thresholds: dict[str, tuple[State, float]] = {}
 
     @trace_condition_function
     def if_numeric_state(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
         """Test numeric state condition."""
+        below = _async_get_threshold(hass, below_threshold, parsed_thresholds)
+        above = _async_get_threshold(hass, above_threshold, parsed_thresholds)
         errors = []
         for index, entity_id in enumerate(entity_ids):
             try:
@@ -1077,10 +1194,12 @@ async def async_conditions_from_config(
         for condition_config in condition_configs
     ]
 
+    plan = [(index, checks[index]) for index in _plan_checks(condition_configs)]
+
     def check_conditions(variables: TemplateVarsType = None) -> bool:
         """AND all conditions."""
         errors: list[ConditionErrorIndex] = []
-        for index, check in enumerate(checks):
+        for index, check in plan:
             try:
                 with trace_path(["condition", str(index)]):
                     if check(hass, variables) is False:
@@ -1093,6 +1212,7 @@ async def async_conditions_from_config(
                 )
 
         if errors:
+            errors.sort(key=lambda error: error.index)
             logger.warning(
                 "Error evaluating condition in '%s':\n%s",
                 name,
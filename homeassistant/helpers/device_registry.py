@@ -531,9 +531,10 @@ class DeviceRegistryItems[_EntryTypeT: (DeviceEntry, DeletedDeviceEntry)](
 ):
     """Container for device registry items, maps device id -> entry.
 
-    Maintains two additional indexes:
+    Maintains three additional indexes:
     - (connection_type, connection identifier) -> entry
     - (DOMAIN, identifier) -> entry
+    - config_entry_id -> dict[key, True]
     """
 
     def __init__(self) -> None:
@@ -541,6 +542,7 @@ class DeviceRegistryItems[_EntryTypeT: (DeviceEntry, DeletedDeviceEntry)](
         super().__init__()
         self._connections: dict[tuple[str, str], _EntryTypeT] = {}
         self._identifiers: dict[tuple[str, str], _EntryTypeT] = {}
+        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
 
     def _index_entry(self, key: str, entry: _EntryTypeT) -> None:
         """Index an entry."""
@@ -548,6 +550,8 @@ class DeviceRegistryItems[_EntryTypeT: (DeviceEntry, DeletedDeviceEntry)](
             self._connections[connection] = entry
         for identifier in entry.identifiers:
             self._identifiers[identifier] = entry
+        for config_entry_id in entry.config_entries:
+            self._config_entry_id_index[config_entry_id][key] = True
 
     def _unindex_entry(
         self, key: str, replacement_entry: _EntryTypeT | None = None
@@ -558,6 +562,8 @@ class DeviceRegistryItems[_EntryTypeT: (DeviceEntry, DeletedDeviceEntry)](
             del self._connections[connection]
         for identifier in old_entry.identifiers:
             del self._identifiers[identifier]
+        for config_entry_id in old_entry.config_entries:
+            self._unindex_entry_value(key, config_entry_id, self._config_entry_id_index)
 
     def get_entry(
         self,
@@ -576,6 +582,15 @@ class DeviceRegistryItems[_EntryTypeT: (DeviceEntry, DeletedDeviceEntry)](
                 return self._connections[connection]
         return None
 
+    def get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[_EntryTypeT]:
+        """Get devices for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
 
 class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
     """Container for active (non-deleted) device registry entries."""
@@ -586,13 +601,13 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
         Maintains three additional indexes:
 
         - area_id -> dict[key, True]
-        - config_entry_id -> dict[key, True]
         - label -> dict[key, True]
+        - via_device_id -> dict[key, True]
         """
         super().__init__()
         self._area_id_index: RegistryIndexType = defaultdict(dict)
-        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
+        self._via_device_id_index: RegistryIndexType = defaultdict(dict)
 
     def _index_entry(self, key: str, entry: DeviceEntry) -> None:
         """Index an entry."""
@@ -601,8 +616,8 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
             self._area_id_index[area_id][key] = True
         for label in entry.labels:
             self._labels_index[label][key] = True
-        for config_entry_id in entry.config_entries:
-            self._config_entry_id_index[config_entry_id][key] = True
+        if (via_device_id := entry.via_device_id) is not None:
+            self._via_device_id_index[via_device_id][key] = True
 
     def _unindex_entry(
         self, key: str, replacement_entry: DeviceEntry | None = None
@@ -614,8 +629,8 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
         if labels := entry.labels:
             for label in labels:
                 self._unindex_entry_value(key, label, self._labels_index)
-        for config_entry_id in entry.config_entries:
-            self._unindex_entry_value(key, config_entry_id, self._config_entry_id_index)
+        if via_device_id := entry.via_device_id:
+            self._unindex_entry_value(key, via_device_id, self._via_device_id_index)
         super()._unindex_entry(key, replacement_entry)
 
     def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
@@ -628,14 +643,10 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
         data = self.data
         return [data[key] for key in self._labels_index.get(label, ())]
 
-    def get_devices_for_config_entry_id(
-        self, config_entry_id: str
-    ) -> list[DeviceEntry]:
-        """Get devices for config entry."""
+    def get_devices_for_via_device_id(self, via_device_id: str) -> list[DeviceEntry]:
+        """Get devices connected through a device."""
         data = self.data
-        return [
-            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
-        ]
+        return [data[key] for key in self._via_device_id_index.get(via_device_id, ())]
 
 
 class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
@@ -1125,9 +1136,8 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             id=device.id,
             orphaned_timestamp=None,
         )
-        for other_device in list(self.devices.values()):
-            if other_device.via_device_id == device_id:
-                self.async_update_device(other_device.id, via_device_id=None)
+        for other_device in self.devices.get_devices_for_via_device_id(device_id):
+            self.async_update_device(other_device.id, via_device_id=None)
         self.hass.bus.async_fire_internal(
             EVENT_DEVICE_REGISTRY_UPDATED,
             _EventDeviceRegistryUpdatedData_CreateRemove(
@@ -1217,10 +1227,10 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
         now_time = time.time()
         for device in self.devices.get_devices_for_config_entry_id(config_entry_id):
             self.async_update_device(device.id, remove_config_entry_id=config_entry_id)
-        for deleted_device in list(self.deleted_devices.values()):
+        for deleted_device in self.deleted_devices.get_devices_for_config_entry_id(
+            config_entry_id
+        ):
             config_entries = deleted_device.config_entries
-            if config_entry_id not in config_entries:
-                continue
             if config_entries == {config_entry_id}:
                 # Add a time stamp when the deleted device became orphaned
                 self.deleted_devices[deleted_device.id] = attr.evolve(
@@ -1228,8 +1238,6 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
                 )
             else:
                 config_entries = config_entries - {config_entry_id}
-                # No need to reindex here since we currently
-                # do not have a lookup by config entry
                 self.deleted_devices[deleted_device.id] = attr.evolve(
                     deleted_device, config_entries=config_entries
                 )
@@ -567,9 +567,13 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         self._device_id_index: RegistryIndexType = defaultdict(dict)
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
+        # Joined JSON representations of all entries, cleared on any change
+        self._partial_json_repr: bytes | None = None
+        self._display_json_repr: bytes | None = None
 
     def _index_entry(self, key: str, entry: RegistryEntry) -> None:
         """Index an entry."""
+        self._partial_json_repr = self._display_json_repr = None
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
         # python has no ordered set, so we use a dict with True values
@@ -587,6 +591,7 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         self, key: str, replacement_entry: RegistryEntry | None = None
     ) -> None:
         """Unindex an entry."""
+        self._partial_json_repr = self._display_json_repr = None
         entry = self.data[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
@@ -604,6 +609,36 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         """Return device ids."""
         return self._device_id_index.keys()
 
+    def get_partial_json_repr(self) -> bytes:
+        """Return the partial JSON representations of all entries.
+
+        The entries are comma separated, ready to be put in a JSON array.
+        """
+        if (json_repr := self._partial_json_repr) is None:
+            json_repr = self._partial_json_repr = b",".join(
+                [
+                    entry.partial_json_repr
+                    for entry in self.data.values()
+                    if entry.partial_json_repr is not None
+                ]
+            )
+        return json_repr
+
+    def get_display_json_repr(self) -> bytes:
+        """Return the display JSON representations of all enabled entries.
+
+        The entries are comma separated, ready to be put in a JSON array.
+        """
+        if (json_repr := self._display_json_repr) is None:
+            json_repr = self._display_json_repr = b",".join(
+                [
+                    entry.display_json_repr
+                    for entry in self.data.values()
+                    if entry.disabled_by is None and entry.display_json_repr is not None
+                ]
+            )
+        return json_repr
+
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
         return self._index.get(key)
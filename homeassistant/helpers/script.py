@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+from collections.abc import AsyncGenerator, Callable, Coroutine, Mapping, Sequence
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from copy import copy
@@ -491,7 +491,8 @@ class _ScriptRun:
         return ScriptRunResult(self._conversation_response, response, self._variables)
 
     async def _async_step(self, log_exceptions: bool) -> None:
-        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+        script_step = self._script._steps[self._step]  # noqa: SLF001
+        continue_on_error = script_step.continue_on_error
 
         with trace_path(str(self._step)):
             async with trace_action(
@@ -500,10 +501,9 @@ class _ScriptRun:
                 if self._stop.done():
                     return
 
-                action = cv.determine_script_action(self._action)
+                action = script_step.action
 
-                if CONF_ENABLED in self._action:
-                    enabled = self._action[CONF_ENABLED]
+                if (enabled := script_step.enabled) is not True:
                     if isinstance(enabled, Template):
                         try:
                             enabled = enabled.async_render(limited=True)
@@ -521,9 +521,8 @@ class _ScriptRun:
                         trace_set_result(enabled=False)
                         return
 
-                handler = f"_async_{action}_step"
                 try:
-                    await getattr(self, handler)()
+                    await script_step.handler(self)
                 except Exception as ex:  # noqa: BLE001
                     self._handle_exception(
                         ex, continue_on_error, self._log_exceptions or log_exceptions
@@ -821,7 +820,9 @@ class _ScriptRun:
         self._script.last_action = self._action.get(
             CONF_ALIAS, self._action[CONF_CONDITION]
         )
-        cond = await self._async_get_condition(self._action)
+        (cond,) = await self._script._async_get_step_conditions(  # noqa: SLF001
+            self._step, [self._action]
+        )
         try:
             trace_element = trace_stack_top(trace_stack_cv)
             if trace_element:
@@ -939,9 +940,9 @@ class _ScriptRun:
                 await async_run_sequence(iteration, extra_msg)
 
         elif CONF_WHILE in repeat:
-            conditions = [
-                await self._async_get_condition(config) for config in repeat[CONF_WHILE]
-            ]
+            conditions = await self._script._async_get_step_conditions(  # noqa: SLF001
+                self._step, repeat[CONF_WHILE]
+            )
             for iteration in itertools.count(1):
                 set_repeat_var(iteration)
                 try:
@@ -986,9 +987,9 @@ class _ScriptRun:
                 await async_run_sequence(iteration)
 
         elif CONF_UNTIL in repeat:
-            conditions = [
-                await self._async_get_condition(config) for config in repeat[CONF_UNTIL]
-            ]
+            conditions = await self._script._async_get_step_conditions(  # noqa: SLF001
+                self._step, repeat[CONF_UNTIL]
+            )
             for iteration in itertools.count(1):
                 set_repeat_var(iteration)
                 await async_run_sequence(iteration)
@@ -1376,6 +1377,28 @@ def _referenced_extract_ids(data: Any, key: str, found: set[str]) -> None:
             found.add(item_id)
 
 
+@dataclass(slots=True)
+class _ScriptStep:
+    """An action of a script, with what running it needs resolved once."""
+
+    action: str
+    handler: Callable[[_ScriptRun], Coroutine[Any, Any, None]]
+    continue_on_error: bool
+    enabled: bool | Template
+    conditions: list[ConditionCheckerType] | None = None
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> _ScriptStep:
+        """Compile an action config."""
+        action = cv.determine_script_action(config)
+        return cls(
+            action,
+            getattr(_ScriptRun, f"_async_{action}_step"),
+            config.get(CONF_CONTINUE_ON_ERROR, False),
+            config.get(CONF_ENABLED, True),
+        )
+
+
 class _ChooseData(TypedDict):
     choices: list[tuple[list[ConditionCheckerType], Script]]
     default: Script | None
@@ -1434,6 +1457,7 @@ class Script:
 
         self._hass = hass
         self.sequence = sequence
+        self._steps = [_ScriptStep.from_config(action) for action in sequence]
         self.name = name
         self.unique_id = f"{domain}.{name}-{id(self)}"
         self.domain = domain
@@ -1832,6 +1856,17 @@ class Script:
             self._config_cache[config_cache_key] = cond
         return cond
 
+    async def _async_get_step_conditions(
+        self, step: int, configs: list[ConfigType]
+    ) -> list[ConditionCheckerType]:
+        """Return the conditions of a step, creating them on first use."""
+        script_step = self._steps[step]
+        if (conditions := script_step.conditions) is None:
+            conditions = script_step.conditions = [
+                await self._async_get_condition(config) for config in configs
+            ]
+        return conditions
+
     def _prep_repeat_script(self, step: int) -> Script:
         action = self.sequence[step]
         step_name = action.get(CONF_ALIAS, f"Repeat at step {step+1}")
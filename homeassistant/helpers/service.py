@@ -32,6 +32,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -79,6 +80,11 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+TARGET_RESOLUTION_CACHE: HassKey[_TargetResolutionCache] = HassKey(
+    "service_target_resolution_cache"
+)
+
+MAX_CACHED_TARGETS = 256
 
 
 @cache
@@ -502,10 +508,14 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
 
 
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
-    """Extract referenced entity IDs from a service call."""
+    """Extract referenced entity IDs from a service call.
+
+    The entities, devices and areas referenced through devices, areas, floors
+    and labels are cached per target until a registry is updated.
+    """
     selector = ServiceTargetSelector(service_call)
     selected = SelectedEntities()
 
@@ -526,12 +536,86 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
-    entities = entity_registry.async_get(hass).entities
+    ent_reg = entity_registry.async_get(hass)
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
+    floor_reg = floor_registry.async_get(hass)
+    label_reg = label_registry.async_get(hass)
+
+    if (target_cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is None:
+        target_cache = hass.data[TARGET_RESOLUTION_CACHE] = _TargetResolutionCache(hass)
+    registries = (ent_reg, dev_reg, area_reg, floor_reg, label_reg)
+    if target_cache.registries != registries:
+        target_cache.registries = registries
+        target_cache.resolved.clear()
+
+    key = (
+        frozenset(selector.device_ids),
+        frozenset(selector.area_ids),
+        frozenset(selector.floor_ids),
+        frozenset(selector.label_ids),
+    )
+    if (resolved := target_cache.resolved.get(key)) is None:
+        resolved = _resolve_registry_targets(
+            selector, ent_reg, dev_reg, area_reg, floor_reg, label_reg
+        )
+        if len(target_cache.resolved) >= MAX_CACHED_TARGETS:
+            del target_cache.resolved[next(iter(target_cache.resolved))]
+        target_cache.resolved[key] = resolved
+
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.missing_floors.update(resolved.missing_floors)
+    selected.missing_labels.update(resolved.missing_labels)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.referenced_areas.update(resolved.referenced_areas)
+    return selected
+
+
+class _TargetResolutionCache:
+    """Cache of the registry entries referenced by service call targets.
+
+    The cache is cleared when any of the registries is updated.
+    """
+
+    __slots__ = ("registries", "resolved")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache and listen for registry updates."""
+        self.registries: tuple[Any, ...] = ()
+        self.resolved: dict[
+            tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]],
+            SelectedEntities,
+        ] = {}
+        for event_type in (
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+            label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+        ):
+            hass.bus.async_listen(event_type, self._async_clear)
+
+    @callback
+    def _async_clear(self, event: Event[Any]) -> None:
+        """Clear the cache when a registry is updated."""
+        self.resolved.clear()
+
+
+def _resolve_registry_targets(  # noqa: C901
+    selector: ServiceTargetSelector,
+    ent_reg: entity_registry.EntityRegistry,
+    dev_reg: device_registry.DeviceRegistry,
+    area_reg: area_registry.AreaRegistry,
+    floor_reg: floor_registry.FloorRegistry,
+    label_reg: label_registry.LabelRegistry,
+) -> SelectedEntities:
+    """Resolve the devices, areas, floors and labels of a target to entities."""
+    selected = SelectedEntities()
+    entities = ent_reg.entities
 
     if selector.floor_ids:
-        floor_reg = floor_registry.async_get(hass)
         for floor_id in selector.floor_ids:
             if floor_id not in floor_reg.floors:
                 selected.missing_floors.add(floor_id)
@@ -545,7 +629,6 @@ def async_extract_referenced_entity_ids(  # noqa: C901
             selected.missing_devices.add(device_id)
 
     if selector.label_ids:
-        label_reg = label_registry.async_get(hass)
         for label_id in selector.label_ids:
             if label_id not in label_reg.labels:
                 selected.missing_labels.add(label_id)
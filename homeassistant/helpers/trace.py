@@ -21,6 +21,7 @@ class TraceElement:
     __slots__ = (
         "_child_key",
         "_child_run_id",
+        "_duration",
         "_error",
         "_last_variables",
         "path",
@@ -34,6 +35,7 @@ class TraceElement:
         """Container for trace data."""
         self._child_key: str | None = None
         self._child_run_id: str | None = None
+        self._duration: float | None = None
         self._error: BaseException | None = None
         self.path: str = path
         self._result: dict[str, Any] | None = None
@@ -52,6 +54,10 @@ class TraceElement:
         self._child_key = child_key
         self._child_run_id = child_run_id
 
+    def set_duration(self, duration: float) -> None:
+        """Set the seconds the traced evaluation took."""
+        self._duration = duration
+
     def set_error(self, ex: BaseException | None) -> None:
         """Set error."""
         self._error = ex
@@ -90,6 +96,8 @@ class TraceElement:
             }
         if self._variables:
             result["changed_variables"] = self._variables
+        if self._duration is not None:
+            result["duration"] = self._duration
         if self._error is not None:
             result["error"] = str(self._error) or self._error.__class__.__name__
         if self._result is not None:
@@ -6,17 +6,23 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+from functools import partial
 import logging
 from timeit import default_timer as timer
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
-from homeassistant.helpers.entityfilter import convert_include_exclude_filter
+from homeassistant.helpers.entityfilter import (
+    FILTER_SCHEMA,
+    convert_include_exclude_filter,
+)
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +314,593 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def hls_concurrent_clients(hass):
+    """Serve 8 LL-HLS clients on each of 4 streams for 1000 segments."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.camera.prefs import DynamicStreamSettings
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.stream.core import (
+        IdleTimer,
+        Part,
+        Segment,
+        StreamSettings,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.stream.hls import HlsStreamOutput
+
+    async def idle_callback():
+        """Ignore idle timeouts."""
+
+    stream_settings = StreamSettings(
+        ll_hls=True,
+        min_segment_duration=1.5,
+        part_target_duration=0.5,
+        hls_advance_part_limit=3,
+        hls_part_timeout=1.0,
+    )
+    tracks = [
+        HlsStreamOutput(
+            hass,
+            IdleTimer(hass, 300, idle_callback),
+            stream_settings,
+            DynamicStreamSettings(),
+        )
+        for _ in range(4)
+    ]
+    part_data = bytes(64 * 1024)
+    start_time = dt_util.utcnow()
+    served = 0
+
+    start = timer()
+
+    for sequence in range(1000):
+        for track in tracks:
+            segment = Segment(
+                sequence=sequence,
+                init=b"",
+                stream_id=0,
+                start_time=start_time,
+                _stream_outputs=[track],
+            )
+            # Let the segment be put to the track from the event loop
+            await asyncio.sleep(0)
+            for part_num in range(4):
+                segment.async_add_part(
+                    Part(duration=0.5, has_keyframe=part_num == 0, data=part_data),
+                    2.0 if part_num == 3 else 0,
+                )
+                for _ in range(8):
+                    served += len(track.render_playlist())
+            for _ in range(8):
+                served += len(segment.get_data())
+
+    elapsed = timer() - start
+
+    for track in tracks:
+        track.cleanup()
+
+    assert served
+    return elapsed
+
+
+@benchmark
+async def influxdb_line_protocol(hass):
+    """Encode 100k state changes of 1000 entities as InfluxDB line protocol."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import influxdb
+
+    event_to_line = influxdb._generate_event_to_line(  # noqa: SLF001
+        influxdb.INFLUX_SCHEMA({"tags_attributes": ["friendly_name"]})
+    )
+    events = [
+        core.Event(
+            EVENT_STATE_CHANGED,
+            {
+                "new_state": core.State(
+                    f"sensor.power_{idx % 1000}",
+                    str(idx / 10),
+                    {
+                        "unit_of_measurement": "W",
+                        "device_class": "power",
+                        "friendly_name": f"Power {idx % 1000}",
+                        "state_class": "measurement",
+                    },
+                )
+            },
+        )
+        for idx in range(10**5)
+    ]
+
+    start = timer()
+    for event in events:
+        event_to_line(event)
+    return timer() - start
+
+
+@benchmark
+async def prometheus_scrape(hass):
+    """Scrape 5000 entities 100 times with 10 state changes between scrapes."""
+    # pylint: disable-next=import-outside-toplevel
+    from prometheus_client.exposition import choose_encoder
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import prometheus
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.entity_values import EntityValues
+
+    metrics = prometheus.PrometheusMetrics(
+        FILTER_SCHEMA({}),
+        "homeassistant",
+        hass.config.units.temperature_unit,
+        EntityValues({}),
+        None,
+        None,
+    )
+    units = ["W", "kWh", "°C", "%", "lx"]
+    for idx in range(5000):
+        metrics.handle_state(
+            core.State(
+                f"sensor.sensor_{idx}",
+                str(idx),
+                {"unit_of_measurement": units[idx % 5], "friendly_name": f"S {idx}"},
+            )
+        )
+    encoder, _ = choose_encoder("")
+
+    start = timer()
+    for scrape in range(100):
+        for idx in range(10):
+            metrics.handle_state(
+                core.State(
+                    f"sensor.sensor_{scrape * 10 + idx}",
+                    str(scrape),
+                    {
+                        "unit_of_measurement": units[idx % 5],
+                        "friendly_name": f"S {idx}",
+                    },
+                )
+            )
+        metrics.generate_latest(encoder, metrics.async_snapshot())
+    return timer() - start
+
+
+@benchmark
+async def statistics_rolling_window(hass):
+    """Feed 20000 samples through statistics sensors with a 10000 sample buffer."""
+    # The sensor entity is not exported from the component root, and the
+    # benchmark drives it directly without setting up the platform
+    # pylint: disable-next=import-outside-toplevel,hass-component-root-import
+    from homeassistant.components.statistics.sensor import StatisticsSensor
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    sensors = [
+        StatisticsSensor(
+            hass,
+            "sensor.power",
+            characteristic,
+            None,
+            characteristic,
+            10000,
+            None,
+            False,
+            2,
+            95,
+        )
+        for characteristic in (
+            "mean",
+            "median",
+            "percentile",
+            "distance_95_percent_of_values",
+            "mean_circular",
+            "average_linear",
+        )
+    ]
+    now = dt_util.utcnow()
+    states = [
+        core.State(
+            "sensor.power",
+            str((idx * 7919) % 5000 / 10),
+            last_reported=now + timedelta(seconds=idx),
+        )
+        for idx in range(20000)
+    ]
+
+    start = timer()
+    for state in states:
+        for sensor in sensors:
+            sensor._add_state_to_queue(state)  # noqa: SLF001
+            sensor._update_value()  # noqa: SLF001
+    return timer() - start
+
+
+@benchmark
+async def script_runs(hass):
+    """Run a script with conditions, variables and an event 10000 times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.script import Script
+
+    count = 0
+    runs = 10**4
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    hass.bus.async_listen("benchmark_event", listener)
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"condition": "template", "value_template": "{{ value > 0 }}"},
+            {"variables": {"double": "{{ value * 2 }}"}},
+            {
+                "repeat": {
+                    "while": [
+                        {"condition": "template", "value_template": "{{ false }}"}
+                    ],
+                    "sequence": [{"event": "never_fired"}],
+                }
+            },
+            {"event": "benchmark_event", "event_data": {"value": "{{ double }}"}},
+        ]
+    )
+    script = Script(hass, sequence, "benchmark", "script")
+
+    start = timer()
+    for idx in range(runs):
+        await script.async_run({"value": idx + 1}, core.Context())
+    await hass.async_block_till_done()
+
+    assert count == runs
+
+    return timer() - start
+
+
+@benchmark
+async def service_target_resolution(hass):
+    """Resolve a floor target of 2000 entities on 400 devices 10000 times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import config_entries
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        floor_registry as fr,
+        label_registry as lr,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+    await ar.async_load(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    await fr.async_load(hass)
+    await lr.async_load(hass)
+    area_reg = ar.async_get(hass)
+    dev_reg = dr.async_get(hass)
+    ent_reg = er.async_get(hass)
+    floor = fr.async_get(hass).async_create("Ground floor")
+    config_entry = config_entries.ConfigEntry(
+        data={},
+        discovery_keys={},
+        domain="benchmark",
+        minor_version=1,
+        options={},
+        source=config_entries.SOURCE_USER,
+        title="Benchmark",
+        unique_id=None,
+        version=1,
+    )
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    hass.config_entries._entries[config_entry.entry_id] = config_entry  # noqa: SLF001
+    for area_idx in range(20):
+        area = area_reg.async_create(f"Area {area_idx}", floor_id=floor.floor_id)
+        for device_idx in range(20):
+            device = dev_reg.async_get_or_create(
+                config_entry_id=config_entry.entry_id,
+                identifiers={("benchmark", f"{area_idx}-{device_idx}")},
+            )
+            dev_reg.async_update_device(device.id, area_id=area.id)
+            for entity_idx in range(5):
+                ent_reg.async_get_or_create(
+                    "light",
+                    "benchmark",
+                    f"{area_idx}-{device_idx}-{entity_idx}",
+                    device_id=device.id,
+                )
+    call = core.ServiceCall("light", "turn_off", {"floor_id": floor.floor_id})
+
+    start = timer()
+    for _ in range(10**4):
+        selected = async_extract_referenced_entity_ids(hass, call)
+    assert len(selected.indirectly_referenced) == 2000
+    return timer() - start
+
+
+@benchmark
+async def modbus_block_reads(hass):
+    """Poll 10 slaves of 50 two register sensors 100 times."""
+    # pylint: disable-next=import-outside-toplevel
+    from unittest.mock import AsyncMock, patch
+
+    # pylint: disable-next=import-outside-toplevel
+    from pymodbus.register_read_message import ReadHoldingRegistersResponse
+
+    # The hub is not exported from the component root
+    # pylint: disable-next=import-outside-toplevel,hass-component-root-import
+    from homeassistant.components.modbus import const as modbus_const, modbus
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.const import (
+        CONF_DELAY,
+        CONF_HOST,
+        CONF_NAME,
+        CONF_PORT,
+        CONF_TIMEOUT,
+        CONF_TYPE,
+    )
+
+    async def read_holding_registers(address, count, **kwargs):
+        return ReadHoldingRegistersResponse(list(range(address, address + count)))
+
+    client = AsyncMock()
+    client.read_holding_registers.side_effect = read_holding_registers
+    with patch.object(modbus, "AsyncModbusTcpClient", return_value=client):
+        hub = modbus.ModbusHub(
+            hass,
+            {
+                CONF_NAME: "benchmark",
+                CONF_TYPE: modbus_const.TCP,
+                CONF_DELAY: 0,
+                CONF_HOST: "localhost",
+                CONF_PORT: 502,
+                CONF_TIMEOUT: 3,
+            },
+        )
+        await hub.async_setup()
+        await hass.async_block_till_done()
+    reads = [(slave, address) for slave in range(1, 11) for address in range(0, 100, 2)]
+
+    start = timer()
+    for _ in range(100):
+        results = await asyncio.gather(
+            *(
+                hub.async_pb_call(
+                    slave, address, 2, modbus_const.CALL_TYPE_REGISTER_HOLDING
+                )
+                for slave, address in reads
+            )
+        )
+    elapsed = timer() - start
+    assert results[-1].registers == [98, 99]
+    assert client.read_holding_registers.await_count == 100 * 10
+    return elapsed
+
+
+@benchmark
+async def zeroconf_matching(hass):
+    """Match a service for each generated zeroconf matcher 100 times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import zeroconf
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.generated.zeroconf import ZEROCONF
+
+    type_matchers = zeroconf._build_zeroconf_type_matchers(ZEROCONF)  # noqa: SLF001
+    services = []
+    for service_type, matchers in ZEROCONF.items():
+        services.append((type_matchers[service_type], f"unknown.{service_type}", {}))
+        for matcher in matchers:
+            name = matcher.get("name", "device").replace("*", "x").replace("?", "x")
+            props = {
+                key: value.replace("*", "x")
+                for key, value in matcher.get("properties", {}).items()
+            }
+            services.append(
+                (type_matchers[service_type], f"{name}.{service_type}", props)
+            )
+
+    start = timer()
+    for _ in range(100):
+        for matchers, name, props in services:
+            matchers.async_matching_domains(name, props)
+    return timer() - start
+
+
+@benchmark
+async def google_report_state_serialize(hass):
+    """Report 100 rounds of 500 light state changes to Google."""
+    # pylint: disable-next=import-outside-toplevel
+    from unittest.mock import AsyncMock, Mock, patch
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import loader
+
+    # The report state implementation is not exported from the component root
+    # pylint: disable-next=import-outside-toplevel,hass-component-root-import
+    from homeassistant.components.google_assistant import report_state
+
+    google_config = Mock(
+        entity_config={},
+        is_supported_cache={},
+        should_expose=lambda state: True,
+        async_report_state_all=AsyncMock(),
+    )
+    scheduled = []
+
+    @core.callback
+    def _async_call_later(hass, delay, action):
+        """Queue the report instead of waiting for the report window."""
+        scheduled.append(action)
+        return lambda: None
+
+    # The significant change checker loads the integration platforms
+    loader.async_setup(hass)
+    hass.set_state(core.CoreState.running)
+    entity_ids = [f"light.kitchen_{idx}" for idx in range(500)]
+    for entity_id in entity_ids:
+        hass.states.async_set(
+            entity_id, "on", {"brightness": 0, "supported_color_modes": ["brightness"]}
+        )
+
+    with patch.object(report_state, "async_call_later", _async_call_later):
+        report_state.async_enable_report_state(hass, google_config)
+        # Send the initial report
+        await scheduled.pop().target(None)
+
+        start = timer()
+        for percentage in range(1, 101):
+            # The brightness is reported to Google as a percentage
+            brightness = round(percentage * 255 / 100)
+            for entity_id in entity_ids:
+                hass.states.async_set(
+                    entity_id,
+                    "on",
+                    {"brightness": brightness, "supported_color_modes": ["brightness"]},
+                )
+            # The report window passed
+            await scheduled.pop().target(None)
+        runtime = timer() - start
+
+    payloads = [
+        call.args[0] for call in google_config.async_report_state_all.call_args_list
+    ]
+    reported = sum(len(payload["devices"]["states"]) for payload in payloads[1:])
+    assert reported == 50000
+    assert payloads[-1]["devices"]["states"]["light.kitchen_0"]["brightness"] == 100
+    print(
+        f"Reported {reported / runtime:.0f} states/s"
+        f" in {len(payloads) - 1} report state payloads"
+    )
+    return runtime
+
+
+@benchmark
+async def esphome_state_bursts(hass):
+    """Apply 100 bursts of 5 updates for each of 200 ESPHome sensors."""
+    # pylint: disable-next=import-outside-toplevel
+    from unittest.mock import Mock
+
+    # pylint: disable-next=import-outside-toplevel
+    from aioesphomeapi import APIClient, SensorInfo, SensorState
+
+    # The runtime data is not exported from the component root
+    # pylint: disable-next=import-outside-toplevel,hass-component-root-import
+    from homeassistant.components.esphome.entry_data import RuntimeEntryData
+
+    entry_data = RuntimeEntryData(
+        entry_id="benchmark",
+        title="Benchmark",
+        client=Mock(spec=APIClient),
+        store=Mock(),
+    )
+    keys = range(200)
+    entry_data.info[SensorInfo] = {
+        key: SensorInfo(object_id=f"sensor_{key}", key=key) for key in keys
+    }
+    sensor_states = entry_data.state[SensorState]
+
+    def _write_state(key):
+        hass.states.async_set(f"sensor.esphome_{key}", str(sensor_states[key].state))
+
+    for key in keys:
+        entry_data.async_subscribe_state_update(
+            SensorState, key, partial(_write_state, key)
+        )
+
+    start = timer()
+    for burst in range(100):
+        for value in range(burst * 5, burst * 5 + 5):
+            for key in keys:
+                entry_data.async_update_state(SensorState(key=key, state=value))
+        await asyncio.sleep(0)
+    assert hass.states.get("sensor.esphome_0").state == "499"
+    return timer() - start
+
+
+@benchmark
+async def device_registry_lookups(hass):
+    """Remove 10 hubs of 200 devices and clear their config entries."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import config_entries
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import device_registry as dr
+
+    await dr.async_load(hass)
+    dev_reg = dr.async_get(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    hubs = {}
+    for entry_idx in range(10):
+        config_entry = config_entries.ConfigEntry(
+            data={},
+            discovery_keys={},
+            domain="benchmark",
+            minor_version=1,
+            options={},
+            source=config_entries.SOURCE_USER,
+            title=f"Benchmark {entry_idx}",
+            unique_id=None,
+            version=1,
+        )
+        hass.config_entries._entries[config_entry.entry_id] = config_entry  # noqa: SLF001
+        hub = dev_reg.async_get_or_create(
+            config_entry_id=config_entry.entry_id,
+            identifiers={("benchmark", f"hub-{entry_idx}")},
+        )
+        hubs[config_entry.entry_id] = hub.id
+        for device_idx in range(200):
+            dev_reg.async_get_or_create(
+                config_entry_id=config_entry.entry_id,
+                identifiers={("benchmark", f"{entry_idx}-{device_idx}")},
+                via_device=("benchmark", f"hub-{entry_idx}"),
+            )
+            deleted = dev_reg.async_get_or_create(
+                config_entry_id=config_entry.entry_id,
+                identifiers={("benchmark", f"deleted-{entry_idx}-{device_idx}")},
+            )
+            dev_reg.async_remove_device(deleted.id)
+
+    start = timer()
+    for config_entry_id, hub_id in hubs.items():
+        dev_reg.async_remove_device(hub_id)
+        dev_reg.async_clear_config_entry(config_entry_id)
+    elapsed = timer() - start
+    assert not dev_reg.devices
+    return elapsed
+
+
+@benchmark
+async def entity_registry_list(hass):
+    """List a 5000 entity registry 1000 times, changing it every 100 lists."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import entity_registry as er
+
+    await er.async_load(hass)
+    ent_reg = er.async_get(hass)
+    for idx in range(5000):
+        ent_reg.async_get_or_create("sensor", "benchmark", str(idx))
+
+    start = timer()
+    for idx in range(1000):
+        if not idx % 100:
+            ent_reg.async_update_entity("sensor.benchmark_0", name=f"Sensor {idx}")
+        ent_reg.entities.get_partial_json_repr()
+        ent_reg.entities.get_display_json_repr()
+    return timer() - start
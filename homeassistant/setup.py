@@ -72,6 +72,13 @@ DATA_SETUP_TIME: HassKey[
     defaultdict[str, defaultdict[str | None, defaultdict[SetupPhases, float]]]
 ] = HassKey("setup_time")
 
+# DATA_SETUP_TIMELINE is a list, recording when each setup phase and
+# each wait inside a setup phase started and how long it took, in the
+# order they finished.
+DATA_SETUP_TIMELINE: HassKey[
+    list[tuple[str, str | None, SetupPhases, float, float]]
+] = HassKey("setup_timeline")
+
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
@@ -713,6 +720,7 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
         integration, group = running
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
+        _setup_timeline(hass).append((integration, group, phase, started, time_taken))
         _LOGGER.debug(
             "Adding wait for %s for %s (%s) of %.2f",
             phase,
@@ -730,6 +738,14 @@ def _setup_times(
     return defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
 
 
+@singleton.singleton(DATA_SETUP_TIMELINE)
+def _setup_timeline(
+    hass: core.HomeAssistant,
+) -> list[tuple[str, str | None, SetupPhases, float, float]]:
+    """Return the setup timeline list."""
+    return []
+
+
 @contextlib.contextmanager
 def async_start_setup(
     hass: core.HomeAssistant,
@@ -776,6 +792,7 @@ def async_start_setup(
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
         group_setup_times[phase] = max(group_setup_times[phase], time_taken)
+        _setup_timeline(hass).append((integration, group, phase, started, time_taken))
         if group is None:
             _LOGGER.info(
                 "Setup of domain %s took %.2f seconds", integration, time_taken
@@ -822,3 +839,57 @@ def async_get_domain_setup_times(
 ) -> Mapping[str | None, dict[SetupPhases, float]]:
     """Return timing data for each integration."""
     return _setup_times(hass).get(domain, {})
+
+
+@callback
+def async_get_setup_trace(hass: core.HomeAssistant) -> dict[str, Any]:
+    """Return the startup timeline in the Chrome trace event format.
+
+    Each integration is a process and each group (config entry/platform
+    instance) is a thread so parallel setups are shown side by side.
+
+    The durations are wall clock times, so unlike async_get_setup_timings
+    they include the time waited for other operations. These waits are
+    added as separate events nested in the setup phase which waited.
+    """
+    timeline = _setup_timeline(hass)
+    if not timeline:
+        return {"traceEvents": [], "displayTimeUnit": "ms"}
+    first_started = min(started for _, _, _, started, _ in timeline)
+    pids: dict[str, int] = {}
+    tids: dict[tuple[str, str | None], int] = {}
+    events: list[dict[str, Any]] = []
+    for integration, group, phase, started, time_taken in timeline:
+        if (pid := pids.get(integration)) is None:
+            pid = pids[integration] = len(pids) + 1
+            events.append(
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "args": {"name": integration},
+                }
+            )
+        if (tid := tids.get((integration, group))) is None:
+            tid = tids[(integration, group)] = len(tids) + 1
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": group or integration},
+                }
+            )
+        events.append(
+            {
+                "name": str(phase),
+                "cat": "setup",
+                "ph": "X",
+                "ts": round((started - first_started) * 1_000_000),
+                "dur": round(time_taken * 1_000_000),
+                "pid": pid,
+                "tid": tid,
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
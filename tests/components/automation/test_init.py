@@ -1241,6 +1241,53 @@ async def test_reload_identical_automations_without_id(
         assert len(calls) == 10
 
 
+async def test_reload_changed_automation_without_id(
+    hass: HomeAssistant, calls: list[ServiceCall], caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test only the changed one of automations with the same alias is created."""
+    with patch(
+        "homeassistant.components.automation.AutomationEntity", wraps=AutomationEntity
+    ) as automation_entity_init:
+        config = {
+            automation.DOMAIN: [
+                {
+                    "alias": "dolly",
+                    "triggers": {"platform": "event", "event_type": f"test_event_{i}"},
+                    "actions": [{"action": "test.automation"}],
+                }
+                for i in range(3)
+            ]
+        }
+        assert await async_setup_component(hass, automation.DOMAIN, config)
+        assert automation_entity_init.call_count == 3
+        automation_entity_init.reset_mock()
+
+        config[automation.DOMAIN][1]["triggers"]["event_type"] = "test_event"
+        caplog.set_level(logging.DEBUG, logger="homeassistant.components.automation")
+        with patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=config,
+        ):
+            await hass.services.async_call(
+                automation.DOMAIN, SERVICE_RELOAD, blocking=True
+            )
+
+        assert automation_entity_init.call_count == 1
+        assert "Created dolly in" in caplog.text
+        assert "2 unchanged, 1 removed, 1 created" in caplog.text
+
+        for event_type in (
+            "test_event",
+            "test_event_0",
+            "test_event_1",
+            "test_event_2",
+        ):
+            hass.bus.async_fire(event_type)
+        await hass.async_block_till_done()
+        assert len(calls) == 3
+
+
 @pytest.mark.parametrize(
     "automation_config",
     [
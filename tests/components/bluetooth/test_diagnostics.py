@@ -157,6 +157,11 @@ async def test_diagnostics(
                         "vendor_id": "cc01",
                     },
                 },
+                "advertisement_counters": {
+                    "received": 0,
+                    "deduped": 0,
+                    "dispatched": 0,
+                },
                 "advertisement_tracker": {
                     "fallback_intervals": {},
                     "intervals": {},
@@ -302,6 +307,11 @@ async def test_diagnostics_macos(
                         "vendor_id": "Unknown",
                     }
                 },
+                "advertisement_counters": {
+                    "received": 1,
+                    "deduped": 0,
+                    "dispatched": 1,
+                },
                 "advertisement_tracker": {
                     "fallback_intervals": {},
                     "intervals": {},
@@ -496,6 +506,11 @@ async def test_diagnostics_remote_adapter(
                         "vendor_id": "cc01",
                     }
                 },
+                "advertisement_counters": {
+                    "received": ANY,
+                    "deduped": 0,
+                    "dispatched": ANY,
+                },
                 "advertisement_tracker": {
                     "fallback_intervals": {},
                     "intervals": {},
@@ -33,6 +33,7 @@ from homeassistant.components.bluetooth import (
     storage,
 )
 from homeassistant.components.bluetooth.const import (
+    ADVERTISEMENT_DEDUP_SECONDS,
     SOURCE_LOCAL,
     UNAVAILABLE_TRACK_SECONDS,
 )
@@ -1162,6 +1163,87 @@ async def test_debug_logging(
     assert "wohand_good_signal_hci0" not in caplog.text
 
 
+@pytest.mark.usefixtures("enable_bluetooth")
+async def test_dedup_advertisements(
+    hass: HomeAssistant,
+    register_hci0_scanner: None,
+    register_hci1_scanner: None,
+) -> None:
+    """Test identical advertisements are only dispatched once within the window."""
+    callbacks: list[BluetoothServiceInfoBleak] = []
+
+    @callback
+    def _fake_subscriber(
+        service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+    ) -> None:
+        callbacks.append(service_info)
+
+    cancel = bluetooth.async_register_callback(
+        hass,
+        _fake_subscriber,
+        {"address": "44:44:33:11:23:45"},
+        BluetoothScanningMode.ACTIVE,
+    )
+    manager = _get_manager()
+    start_time_monotonic = 50.0
+    switchbot_device = generate_ble_device("44:44:33:11:23:45", "wohand")
+    switchbot_adv = generate_advertisement_data(
+        local_name="wohand", manufacturer_data={89: b"\x01"}, rssi=-90
+    )
+    switchbot_adv_changed = generate_advertisement_data(
+        local_name="wohand", manufacturer_data={89: b"\x02"}, rssi=-60
+    )
+    switchbot_adv_back = generate_advertisement_data(
+        local_name="wohand", manufacturer_data={89: b"\x01"}, rssi=-30
+    )
+    # The advertisement changing back on another source is dispatched
+    for adv, offset, source in (
+        (switchbot_adv, 0, "hci0"),
+        (switchbot_adv_changed, 1, "hci1"),
+        (switchbot_adv_back, 2, "hci0"),
+    ):
+        inject_advertisement_with_time_and_source(
+            hass, switchbot_device, adv, start_time_monotonic + offset, source
+        )
+
+    assert [service_info.manufacturer_data for service_info in callbacks] == [
+        {89: b"\x01"},
+        {89: b"\x02"},
+        {89: b"\x01"},
+    ]
+
+    # The manager already drops unchanged advertisements of the same
+    # source, so hand the same service info to the dispatch stage again
+    service_info = callbacks[-1]
+    manager._discover_service_info(service_info)
+    assert len(callbacks) == 3
+    manager._discover_service_info(
+        BluetoothServiceInfoBleak(
+            name=service_info.name,
+            address=service_info.address,
+            rssi=service_info.rssi,
+            manufacturer_data=service_info.manufacturer_data,
+            service_data=service_info.service_data,
+            service_uuids=service_info.service_uuids,
+            source=service_info.source,
+            device=service_info.device,
+            advertisement=service_info.advertisement,
+            connectable=service_info.connectable,
+            time=service_info.time + ADVERTISEMENT_DEDUP_SECONDS,
+            tx_power=service_info.tx_power,
+        )
+    )
+    assert len(callbacks) == 4
+
+    diagnostics = await manager.async_diagnostics()
+    assert diagnostics["advertisement_counters"] == {
+        "received": 5,
+        "deduped": 1,
+        "dispatched": 4,
+    }
+    cancel()
+
+
 @pytest.mark.usefixtures("enable_bluetooth", "macos_adapter")
 async def test_set_fallback_interval_small(hass: HomeAssistant) -> None:
     """Test we can set the fallback advertisement interval."""
@@ -1,10 +1,12 @@
 """The tests for the camera component."""
 
+import asyncio
 from http import HTTPStatus
 import io
 from types import ModuleType
 from unittest.mock import ANY, AsyncMock, Mock, PropertyMock, mock_open, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from syrupy.assertion import SnapshotAssertion
 from webrtc_models import RTCIceCandidate
@@ -204,6 +206,79 @@ async def test_get_image_fails(hass: HomeAssistant) -> None:
         await camera.async_get_image(hass, "camera.demo_camera")
 
 
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_coalesces_concurrent_requests(hass: HomeAssistant) -> None:
+    """Test concurrent requests for the same image share a single fetch."""
+    fetch_started = asyncio.Event()
+    release_fetch = asyncio.Event()
+
+    async def _slow_camera_image(*args, **kwargs) -> bytes:
+        fetch_started.set()
+        await release_fetch.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_slow_camera_image,
+    ) as mock_camera_image:
+        first = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera")
+        )
+        await fetch_started.wait()
+        second = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera")
+        )
+        release_fetch.set()
+        assert (await first).content == b"Test"
+        assert (await second).content == b"Test"
+        assert mock_camera_image.call_count == 1
+
+        # Without an image cache duration a new request fetches again
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera_image.call_count == 2
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_cache_duration(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test images are reused within the image cache duration."""
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=300, second_height=200
+    )
+    with (
+        patch(
+            "homeassistant.components.camera.Camera.image_cache_duration",
+            new_callable=PropertyMock(return_value=10),
+        ),
+        patch(
+            "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+            return_value=turbo_jpeg,
+        ),
+        patch(
+            "homeassistant.components.demo.camera.Path.read_bytes",
+            autospec=True,
+            return_value=b"Valid jpeg",
+        ) as mock_camera,
+    ):
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"Valid jpeg"
+        assert await camera.async_get_image(hass, "camera.demo_camera") is image
+        assert mock_camera.call_count == 1
+
+        # Scaled variants are derived from the fresh full size image
+        scaled = await camera.async_get_image(
+            hass, "camera.demo_camera", width=4, height=3
+        )
+        assert scaled.content == EMPTY_8_6_JPEG
+        assert mock_camera.call_count == 1
+
+        freezer.tick(11)
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"Valid jpeg"
+        assert mock_camera.call_count == 2
+
+
 @pytest.mark.usefixtures("mock_camera")
 @pytest.mark.parametrize(
     ("filename_template", "expected_filename", "expected_issues"),
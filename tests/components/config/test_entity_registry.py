@@ -159,6 +159,35 @@ async def test_list_entities(
     ]
 
 
+async def test_list_entities_after_update(
+    hass: HomeAssistant,
+    client: MockHAClientWebSocket,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test listed entries reflect registry changes."""
+    entity_registry.async_get_or_create(
+        "test_domain", "test_platform", "1234", suggested_object_id="name"
+    )
+    entity_registry.async_get_or_create(
+        "test_domain", "test_platform", "5678", suggested_object_id="other"
+    )
+
+    await client.send_json_auto_id({"type": "config/entity_registry/list"})
+    msg = await client.receive_json()
+    assert [entry["name"] for entry in msg["result"]] == [None, None]
+
+    entity_registry.async_update_entity("test_domain.name", name="New name")
+    entity_registry.async_remove("test_domain.other")
+
+    await client.send_json_auto_id({"type": "config/entity_registry/list"})
+    msg = await client.receive_json()
+    assert [entry["name"] for entry in msg["result"]] == ["New name"]
+
+    await client.send_json_auto_id({"type": "config/entity_registry/list_for_display"})
+    msg = await client.receive_json()
+    assert [entry["ei"] for entry in msg["result"]["entities"]] == ["test_domain.name"]
+
+
 async def test_list_entities_for_display(
     hass: HomeAssistant, client: MockHAClientWebSocket
 ) -> None:
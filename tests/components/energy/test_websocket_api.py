@@ -1,14 +1,20 @@
 """Test the Energy websocket API."""
 
+from datetime import datetime, timedelta
 from typing import Any
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from homeassistant.components.energy import data, is_configured
 from homeassistant.components.recorder import Recorder
-from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.components.recorder.const import SIGNAL_STATISTICS_HOUR_COMPILED
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    statistics_during_period,
+)
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 
@@ -1159,3 +1165,141 @@ async def test_fossil_energy_consumption_check_missing_hour(
         hour3.isoformat(),
         hour4.isoformat(),
     ]
+
+
+@pytest.mark.freeze_time("2021-12-01 00:00:00+00:00")
+async def test_fossil_energy_consumption_rollups(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test fossil_energy_consumption is answered from rollups until statistics change."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    end = dt_util.as_utc(dt_util.parse_datetime("2021-11-01 00:00:00"))
+    energy_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    co2_metadata = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": "Fossil percentage",
+        "source": "test",
+        "statistic_id": "test:fossil_percentage",
+        "unit_of_measurement": "%",
+    }
+    # One kWh every 6 hours with a fossil percentage of 50%, and two kWh in
+    # the last hour before now, which may not be compiled yet
+    last_hour = dt_util.utcnow() - timedelta(hours=1)
+    periods = [start + timedelta(hours=6 * idx) for idx in range(61 * 4)]
+    periods.append(last_hour)
+    async_add_external_statistics(
+        hass,
+        energy_metadata,
+        [
+            {"start": period, "last_reset": None, "state": idx, "sum": idx + 1}
+            for idx, period in enumerate(periods[:-1])
+        ]
+        + [{"start": last_hour, "last_reset": None, "state": 0, "sum": 246}],
+    )
+    async_add_external_statistics(
+        hass,
+        co2_metadata,
+        [{"start": period, "last_reset": None, "mean": 50} for period in periods],
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+
+    async def fossil_energy(
+        period: str, period_start: datetime, period_end: datetime
+    ) -> dict[str, float]:
+        await client.send_json_auto_id(
+            {
+                "type": "energy/fossil_energy_consumption",
+                "start_time": period_start.isoformat(),
+                "end_time": period_end.isoformat(),
+                "energy_statistic_ids": ["test:total_energy_import"],
+                "co2_statistic_id": "test:fossil_percentage",
+                "period": period,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        return response["result"]
+
+    october = dt_util.as_utc(dt_util.parse_datetime("2021-10-01 00:00:00"))
+    with patch(
+        "homeassistant.components.recorder.statistics.statistics_during_period",
+        wraps=statistics_during_period,
+    ) as statistics_mock:
+        assert await fossil_energy("month", start, end) == {
+            start.isoformat(): pytest.approx(60),
+            october.isoformat(): pytest.approx(62),
+        }
+        assert statistics_mock.call_count == 1
+
+        # Periods within the loaded range are answered from the rollups
+        day_start = dt_util.as_utc(dt_util.parse_datetime("2021-10-10 00:00:00"))
+        assert await fossil_energy("day", day_start, day_start + timedelta(days=2)) == {
+            day_start.isoformat(): pytest.approx(2),
+            (day_start + timedelta(days=1)).isoformat(): pytest.approx(2),
+        }
+        assert await fossil_energy(
+            "hour", day_start, day_start + timedelta(hours=12)
+        ) == {
+            day_start.isoformat(): pytest.approx(0.5),
+            (day_start + timedelta(hours=6)).isoformat(): pytest.approx(0.5),
+        }
+        assert await fossil_energy("day", start + timedelta(hours=3), october) == {
+            start.isoformat(): pytest.approx(1.5),
+            **{
+                (start + timedelta(days=day)).isoformat(): pytest.approx(2)
+                for day in range(1, 30)
+            },
+        }
+        assert statistics_mock.call_count == 1
+
+        # Only the missing hours are loaded
+        assert await fossil_energy("month", start, end + timedelta(days=30)) == {
+            start.isoformat(): pytest.approx(60),
+            october.isoformat(): pytest.approx(62),
+            end.isoformat(): pytest.approx(1),
+        }
+        assert statistics_mock.call_count == 2
+        assert statistics_mock.call_args[0][1] == end
+
+        # A compiled hour extends the rollups with the hours compiled since
+        # their end, and keeps what was final
+        async_dispatcher_send(hass, SIGNAL_STATISTICS_HOUR_COMPILED, dt_util.utcnow())
+        await hass.async_block_till_done()
+        assert statistics_mock.call_count == 3
+        assert statistics_mock.call_args[0][1] == last_hour
+        assert statistics_mock.call_args[0][2] == dt_util.utcnow()
+        assert await fossil_energy("hour", last_hour, dt_util.utcnow()) == {
+            last_hour.isoformat(): pytest.approx(1),
+        }
+        assert await fossil_energy("month", start, end) == {
+            start.isoformat(): pytest.approx(60),
+            october.isoformat(): pytest.approx(62),
+        }
+        assert statistics_mock.call_count == 3
+
+        # Changed statistics invalidate the rollups
+        async_add_external_statistics(
+            hass,
+            co2_metadata,
+            [{"start": october, "last_reset": None, "mean": 100}],
+        )
+        await async_wait_recording_done(hass)
+        assert await fossil_energy("month", start, end) == {
+            start.isoformat(): pytest.approx(60),
+            october.isoformat(): pytest.approx(62.5),
+        }
+        assert statistics_mock.call_count == 4
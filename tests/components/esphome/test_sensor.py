@@ -27,6 +27,8 @@ from homeassistant.const import (
     ATTR_DEVICE_CLASS,
     ATTR_ICON,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
+    STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
 )
@@ -35,6 +37,8 @@ from homeassistant.helpers import entity_registry as er
 
 from .conftest import MockESPHomeDevice
 
+from tests.common import async_capture_events
+
 
 async def test_generic_numeric_sensor(
     hass: HomeAssistant,
@@ -95,6 +99,98 @@ async def test_generic_numeric_sensor(
     assert state.state == "70"
 
 
+async def test_sensor_burst_writes_latest_state(
+    hass: HomeAssistant,
+    mock_client: APIClient,
+    mock_esphome_device: Callable[
+        [APIClient, list[EntityInfo], list[UserService], list[EntityState]],
+        Awaitable[MockESPHomeDevice],
+    ],
+) -> None:
+    """Test a burst of updates only writes the latest state of each sensor."""
+    entity_info = [
+        SensorInfo(
+            object_id="mysensor",
+            key=1,
+            name="my sensor",
+            unique_id="my_sensor",
+        ),
+        SensorInfo(
+            object_id="mysensor_forced",
+            key=2,
+            name="my sensor forced",
+            unique_id="my_sensor_forced",
+            force_update=True,
+        ),
+    ]
+    states = [SensorState(key=1, state=50), SensorState(key=2, state=50)]
+    mock_device = await mock_esphome_device(
+        mock_client=mock_client,
+        entity_info=entity_info,
+        user_service=[],
+        states=states,
+    )
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    for value in (60, 70, 80):
+        mock_device.set_state(SensorState(key=1, state=value))
+        mock_device.set_state(SensorState(key=2, state=value))
+    await hass.async_block_till_done()
+
+    # The first update is written right away, the rest of the burst
+    # only writes the latest state, force update sensors write every state
+    assert [
+        (event.data["entity_id"], event.data["new_state"].state) for event in events
+    ] == [
+        ("sensor.test_mysensor", "60"),
+        ("sensor.test_mysensor_forced", "60"),
+        ("sensor.test_mysensor_forced", "70"),
+        ("sensor.test_mysensor_forced", "80"),
+        ("sensor.test_mysensor", "80"),
+    ]
+
+
+async def test_sensor_burst_dropped_on_disconnect(
+    hass: HomeAssistant,
+    mock_client: APIClient,
+    mock_esphome_device: Callable[
+        [APIClient, list[EntityInfo], list[UserService], list[EntityState]],
+        Awaitable[MockESPHomeDevice],
+    ],
+) -> None:
+    """Test the pending updates of a burst are dropped when disconnecting."""
+    entity_info = [
+        SensorInfo(
+            object_id="mysensor",
+            key=1,
+            name="my sensor",
+            unique_id="my_sensor",
+        ),
+    ]
+    states = [SensorState(key=1, state=50)]
+    mock_device = await mock_esphome_device(
+        mock_client=mock_client,
+        entity_info=entity_info,
+        user_service=[],
+        states=states,
+    )
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    entry_data = mock_device.entry.runtime_data
+    mock_device.set_state(SensorState(key=1, state=60))
+    mock_device.set_state(SensorState(key=1, state=70))
+    assert entry_data._pending_state_updates
+    await mock_device.mock_disconnect(False)
+    assert not entry_data._pending_state_updates
+    assert entry_data._pending_state_updates_handle is None
+    await hass.async_block_till_done()
+
+    assert [event.data["new_state"].state for event in events] == [
+        "60",
+        STATE_UNAVAILABLE,
+    ]
+
+
 async def test_generic_numeric_sensor_with_entity_category_and_icon(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
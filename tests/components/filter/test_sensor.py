@@ -498,6 +498,62 @@ def test_time_sma(values: list[State]) -> None:
     assert filtered.state == 21.5
 
 
+@pytest.mark.parametrize(
+    "create_filter",
+    [
+        lambda: RangeFilter(entity=None, precision=1, lower_bound=5, upper_bound=25),
+        lambda: OutlierFilter(window_size=4, precision=2, entity=None, radius=3.0),
+        lambda: LowPassFilter(window_size=3, precision=0, entity=None, time_constant=4),
+        lambda: ThrottleFilter(window_size=3, entity=None),
+        lambda: TimeThrottleFilter(
+            window_size=timedelta(seconds=100), precision=1, entity=None
+        ),
+        lambda: TimeSMAFilter(
+            window_size=timedelta(seconds=150), precision=3, entity=None, type="last"
+        ),
+    ],
+)
+def test_filter_values_matches_filter_state(create_filter) -> None:
+    """Test filtering a batch gives the same results as filtering each state."""
+    timestamp = dt_util.utcnow()
+    states = []
+    for idx in range(40):
+        timestamp += timedelta(seconds=(idx * 37) % 90 + 1)
+        value = "unknown" if idx % 13 == 5 else str((idx * 7919) % 31 - 1.5)
+        states.append(State("sensor.test_monitored", value, last_updated=timestamp))
+
+    single = create_filter()
+    expected = []
+    for state in states:
+        try:
+            filtered = single.filter_state(State.from_dict(state.as_dict()))
+        except ValueError:
+            expected.append(None)
+            continue
+        expected.append(None if single.skip_processing else filtered.state)
+
+    batched = create_filter()
+    results = []
+    for batch in (states[:17], states[17:]):
+        values = [state.state for state in batch]
+        passed = batched.filter_values([state.last_updated for state in batch], values)
+        results.extend(
+            value if result else None
+            for value, result in zip(values, passed, strict=True)
+        )
+
+    assert results == expected
+    assert [(s.timestamp, s.state) for s in batched.states] == [
+        (s.timestamp, s.state) for s in single.states
+    ]
+    next_state = State("sensor.test_monitored", "12", last_updated=timestamp)
+    assert (
+        batched.filter_state(State.from_dict(next_state.as_dict())).state
+        == single.filter_state(State.from_dict(next_state.as_dict())).state
+    )
+    assert batched.skip_processing == single.skip_processing
+
+
 async def test_reload(recorder_mock: Recorder, hass: HomeAssistant) -> None:
     """Verify we can reload filter sensors."""
     hass.states.async_set("sensor.test_monitored", 12345)
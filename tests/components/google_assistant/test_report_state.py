@@ -147,6 +147,48 @@ async def test_report_state(
     assert len(mock_report.mock_calls) == 0
 
 
+async def test_report_state_latest_change(hass: HomeAssistant) -> None:
+    """Test an entity changing again before the report is only reported once."""
+    assert await async_setup_component(hass, "switch", {})
+    hass.states.async_set("light.ceiling", "off")
+
+    with (
+        patch.object(
+            BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        ) as mock_report,
+        patch.object(report_state, "INITIAL_REPORT_DELAY", 0),
+    ):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report:
+        hass.states.async_set("light.ceiling", "on")
+        hass.states.async_set("light.kitchen", "on")
+        hass.states.async_set("light.ceiling", "off")
+        await hass.async_block_till_done()
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
+
+        assert len(mock_report.mock_calls) == 1
+        assert mock_report.mock_calls[0][1][0] == {
+            "devices": {
+                "states": {
+                    "light.ceiling": {"on": False, "online": True},
+                    "light.kitchen": {"on": True, "online": True},
+                },
+            }
+        }
+
+    unsub()
+
+
 @pytest.mark.freeze_time("2023-08-01 00:00:00+00:00")
 async def test_report_notifications(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
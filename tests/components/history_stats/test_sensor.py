@@ -304,9 +304,13 @@ async def test_measure_multiple(recorder_mock: Recorder, hass: HomeAssistant) ->
             ]
         }
 
+    async def _async_fake_states(*args, **kwargs):
+        return _fake_states(*args, **kwargs)
+
+    # The requests for both entities are loaded as one batch
     with patch(
-        "homeassistant.components.recorder.history.state_changes_during_period",
-        _fake_states,
+        "homeassistant.components.recorder.history.async_state_changes_during_period",
+        _async_fake_states,
     ):
         await async_setup_component(
             hass,
@@ -709,6 +713,181 @@ async def test_async_start_from_history_and_switch_to_watching_state_changes_sin
     assert hass.states.get("sensor.sensor1").state == "1.75"
 
 
+async def test_rolling_window_shares_history_and_uses_state_changes(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+) -> None:
+    """Test sensors of one entity share a single history fetch as the window rolls."""
+    await hass.config.async_set_time_zone("UTC")
+    utcnow = dt_util.utcnow()
+    start_time = utcnow.replace(hour=0, minute=0, second=0, microsecond=0)
+    fetches = 0
+
+    # Start     Startup             t0        t1                  t2
+    # |--60min--|--------30min------|---15min-|-------45min-------|
+    # |---on----|---------on--------|---off---|--------on---------|
+
+    def _fake_states(*args, **kwargs):
+        nonlocal fetches
+        fetches += 1
+        return {
+            "binary_sensor.state": [
+                ha.State(
+                    "binary_sensor.state",
+                    "on",
+                    last_changed=start_time,
+                    last_updated=start_time,
+                ),
+            ]
+        }
+
+    startup_time = start_time + timedelta(minutes=60)
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            _fake_states,
+        ),
+        freeze_time(startup_time),
+    ):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.state",
+                        "name": "sensor1",
+                        "state": "on",
+                        "end": "{{ utcnow() }}",
+                        "duration": {"hours": 1},
+                        "type": "time",
+                    },
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.state",
+                        "name": "sensor2",
+                        "state": "on",
+                        "end": "{{ utcnow() }}",
+                        "duration": {"hours": 1},
+                        "type": "count",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "1.0"
+    assert hass.states.get("sensor.sensor2").state == "1"
+
+    t0 = startup_time + timedelta(minutes=30)
+    with freeze_time(t0):
+        hass.states.async_set("binary_sensor.state", "off")
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "1.0"
+    assert hass.states.get("sensor.sensor2").state == "1"
+
+    t1 = t0 + timedelta(minutes=15)
+    with freeze_time(t1):
+        hass.states.async_set("binary_sensor.state", "on")
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "0.75"
+    assert hass.states.get("sensor.sensor2").state == "2"
+
+    t2 = t1 + timedelta(minutes=45)
+    with freeze_time(t2):
+        async_fire_time_changed(hass, t2)
+        await hass.async_block_till_done()
+
+    # The off period is still in the window, the on period before it is not
+    assert hass.states.get("sensor.sensor1").state == "0.75"
+    assert hass.states.get("sensor.sensor2").state == "1"
+
+    t3 = t2 + timedelta(minutes=30)
+    with freeze_time(t3):
+        async_fire_time_changed(hass, t3)
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "1.0"
+    assert hass.states.get("sensor.sensor2").state == "1"
+    assert fetches == 1
+
+
+async def test_state_change_between_setup_and_start(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+) -> None:
+    """Test a state change while Home Assistant is starting is not lost."""
+    hass.set_state(ha.CoreState.not_running)
+    await hass.config.async_set_time_zone("UTC")
+    utcnow = dt_util.utcnow()
+    start_time = utcnow.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    # Start     Setup     t0        Started   End
+    # |--60min--|--15min--|--15min--|--30min--|
+    # |-------unavailable-|-------on----------|
+
+    def _fake_states(*args, **kwargs):
+        return {
+            "binary_sensor.state": [
+                ha.State(
+                    "binary_sensor.state",
+                    "unavailable",
+                    last_changed=start_time,
+                    last_updated=start_time,
+                ),
+            ]
+        }
+
+    setup_time = start_time + timedelta(minutes=60)
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            _fake_states,
+        ),
+        freeze_time(setup_time),
+    ):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.state",
+                        "name": "sensor1",
+                        "state": "on",
+                        "end": "{{ utcnow() }}",
+                        "duration": {"hours": 1},
+                        "type": "time",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "0.0"
+
+    t0 = setup_time + timedelta(minutes=15)
+    with freeze_time(t0):
+        hass.states.async_set("binary_sensor.state", "on")
+        await hass.async_block_till_done()
+
+    started_time = t0 + timedelta(minutes=15)
+    with freeze_time(started_time):
+        await hass.async_start()
+        await hass.async_block_till_done()
+
+    end_time = started_time + timedelta(minutes=30)
+    with freeze_time(end_time):
+        async_fire_time_changed(hass, end_time)
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "0.75"
+
+
 async def test_async_start_from_history_and_switch_to_watching_state_changes_single_expanding_window(
     recorder_mock: Recorder,
     hass: HomeAssistant,
@@ -1284,6 +1463,7 @@ async def test_measure_from_end_going_backwards(
     t0 = start_time + timedelta(minutes=20)
     t1 = t0 + timedelta(minutes=10)
     t2 = t1 + timedelta(minutes=10)
+    end_time = start_time + timedelta(minutes=60)
 
     # Start     t0        t1        t2        End
     # |--20min--|--20min--|--10min--|--10min--|
@@ -1303,7 +1483,7 @@ async def test_measure_from_end_going_backwards(
             "homeassistant.components.recorder.history.state_changes_during_period",
             _fake_states,
         ),
-        freeze_time(start_time),
+        freeze_time(end_time),
     ):
         await async_setup_component(
             hass,
@@ -1360,7 +1540,7 @@ async def test_measure_from_end_going_backwards(
     assert hass.states.get("sensor.sensor3").state == "2"
     assert hass.states.get("sensor.sensor4").state == "83.3"
 
-    past_next_update = start_time + timedelta(minutes=30)
+    past_next_update = end_time + timedelta(minutes=2)
     with (
         patch(
             "homeassistant.components.recorder.history.state_changes_during_period",
@@ -1384,6 +1564,7 @@ async def test_measure_cet(recorder_mock: Recorder, hass: HomeAssistant) -> None
     t0 = start_time + timedelta(minutes=20)
     t1 = t0 + timedelta(minutes=10)
     t2 = t1 + timedelta(minutes=10)
+    end_time = start_time + timedelta(minutes=60)
 
     # Start     t0        t1        t2        End
     # |--20min--|--20min--|--10min--|--10min--|
@@ -1403,7 +1584,7 @@ async def test_measure_cet(recorder_mock: Recorder, hass: HomeAssistant) -> None
             "homeassistant.components.recorder.history.state_changes_during_period",
             _fake_states,
         ),
-        freeze_time(start_time),
+        freeze_time(end_time),
     ):
         await async_setup_component(
             hass,
@@ -5,8 +5,12 @@ from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
 import logging
+import re
+from typing import Any
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
+from freezegun.api import FrozenDateTimeFactory
+from influxdb.line_protocol import make_line
 import pytest
 
 from homeassistant.components import influxdb
@@ -65,12 +69,37 @@ def mock_client_fixture(
         yield client
 
 
+class LineMatcher:
+    """Match a line protocol line with any timestamp."""
+
+    def __init__(self, point: dict[str, Any]) -> None:
+        """Encode the expected point with the influxdb reference encoder.
+
+        Numeric fields are always written as floats.
+        """
+        fields = {
+            key: float(value) if type(value) is int else value
+            for key, value in point["fields"].items()
+        }
+        self.line = make_line(point["measurement"], tags=point["tags"], fields=fields)
+
+    def __eq__(self, other: object) -> bool:
+        """Return if other is the expected line followed by a timestamp."""
+        return isinstance(other, str) and bool(
+            re.fullmatch(rf"{re.escape(self.line)} \d+", other)
+        )
+
+    def __repr__(self) -> str:
+        """Return the expected line."""
+        return f"{self.line} <timestamp>"
+
+
 @pytest.fixture(name="get_mock_call")
 def get_mock_call_fixture(request: pytest.FixtureRequest):
     """Get version specific lambda to make write API call mock."""
 
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {"bucket": DEFAULT_BUCKET, "record": [LineMatcher(p) for p in body]}
 
         if precision is not None:
             data["write_precision"] = precision
@@ -79,7 +108,11 @@ def get_mock_call_fixture(request: pytest.FixtureRequest):
 
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: call(
+        [LineMatcher(point) for point in body],
+        time_precision=precision,
+        protocol="line",
+    )
 
 
 def _get_write_api_mock_v1(mock_influx_client):
@@ -1706,3 +1739,52 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "precision", "timestamp"),
+    [
+        (influxdb.DEFAULT_API_VERSION, None, "1704164645123456000"),
+        (influxdb.DEFAULT_API_VERSION, "us", "1704164645123456"),
+        (influxdb.DEFAULT_API_VERSION, "ms", "1704164645123"),
+        (influxdb.DEFAULT_API_VERSION, "s", "1704164645"),
+    ],
+    indirect=["mock_client"],
+)
+async def test_event_listener_line_protocol(
+    hass: HomeAssistant,
+    mock_client,
+    freezer: FrozenDateTimeFactory,
+    precision,
+    timestamp,
+) -> None:
+    """Test the line protocol escaping and timestamp precision."""
+    config = {"tags_attributes": ["room"]}
+    if precision is not None:
+        config["precision"] = precision
+    await _setup(hass, mock_client, config, _get_write_api_mock_v1)
+
+    freezer.move_to("2024-01-02 03:04:05.123456+00:00")
+    hass.states.async_set(
+        "fake.entity_id",
+        "on, really",
+        {
+            "unit_of_measurement": "my unit",
+            "room": "living room",
+            "quote": 'say "hi"',
+            "infinite": float("inf"),
+        },
+    )
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+
+    write_api = _get_write_api_mock_v1(mock_client)
+    assert write_api.call_count == 1
+    assert write_api.call_args == call(
+        [
+            "my\\ unit,domain=fake,entity_id=entity_id,room=living\\ room "
+            'quote_str="say \\"hi\\"",state="on, really" ' + timestamp
+        ],
+        time_precision=precision,
+        protocol="line",
+    )
@@ -99,6 +99,10 @@ async def test_load_telegam_history(
     assert assert_telegram_history(loaded_telegrams)
     # TelegramDict "payload" is a tuple, this shall be restored when loading from JSON
     assert isinstance(loaded_telegrams[1]["payload"], tuple)
+    # the last telegram of each group address is restored
+    last_ga_telegrams = hass.data[KNX_MODULE_KEY].telegrams.last_ga_telegrams
+    assert list(last_ga_telegrams) == ["1/3/4", "2/2/2"]
+    assert last_ga_telegrams["2/2/2"] is loaded_telegrams[1]
 
 
 async def test_remove_telegam_history(
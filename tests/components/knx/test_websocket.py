@@ -180,6 +180,32 @@ async def test_knx_group_monitor_info_command(
     assert res["result"]["recent_telegrams"] == []
 
 
+async def test_knx_group_telegrams_command(
+    hass: HomeAssistant, knx: KNXTestKit, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test knx/group_telegrams command."""
+    await knx.setup_integration({})
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": "knx/group_telegrams"})
+    res = await client.receive_json()
+    assert res["success"], res
+    assert res["result"] == {}
+
+    # get some telegrams to populate the cache
+    await knx.receive_write("1/1/1", True)
+    await knx.receive_read("2/2/2")  # read telegram shall be ignored
+    await knx.receive_write("1/1/1", False)
+    await knx.receive_write("3/3/3", 0x34)
+
+    await client.send_json_auto_id({"type": "knx/group_telegrams"})
+    res = await client.receive_json()
+    assert res["success"], res
+    assert len(res["result"]) == 2
+    assert res["result"]["1/1/1"]["payload"] == 0
+    assert res["result"]["3/3/3"]["payload"] == 0x34
+
+
 async def test_knx_subscribe_telegrams_command_recent_telegrams(
     hass: HomeAssistant, knx: KNXTestKit, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -13,6 +13,7 @@ This file is responsible for testing:
 It uses binary_sensors/sensors to do black box testing of the read calls.
 """
 
+import asyncio
 from datetime import timedelta
 import logging
 from unittest import mock
@@ -1235,3 +1236,136 @@ async def test_reset_platform(hass: HomeAssistant) -> None:
     """Run test for async_reset_platform."""
     await async_reset_platform(hass, "modbus")
     assert DOMAIN not in hass.data
+
+
+@pytest.mark.parametrize("do_config", [{}])
+async def test_pb_read_block(hass: HomeAssistant, mock_modbus) -> None:
+    """Run test for merging concurrent reads into block reads."""
+    hub = hass.data[DOMAIN][TEST_MODBUS_NAME]
+    mock_modbus.read_holding_registers.reset_mock()
+    mock_modbus.read_holding_registers.return_value = ReadResult(list(range(10)))
+    results = await asyncio.gather(
+        hub.async_pb_call(1, 103, 1, CALL_TYPE_REGISTER_HOLDING),
+        hub.async_pb_call(1, 100, 2, CALL_TYPE_REGISTER_HOLDING),
+        hub.async_pb_call(1, 500, 1, CALL_TYPE_REGISTER_HOLDING),
+    )
+    assert [result.registers for result in results[:2]] == [[3], [0, 1]]
+    assert [
+        call.args for call in mock_modbus.read_holding_registers.call_args_list
+    ] == [(100, 4), (500, 1)]
+
+
+@pytest.mark.parametrize("do_config", [{}])
+async def test_pb_read_block_failed(hass: HomeAssistant, mock_modbus) -> None:
+    """Run test for a failing block read falling back to single reads."""
+    hub = hass.data[DOMAIN][TEST_MODBUS_NAME]
+    mock_modbus.read_holding_registers.reset_mock()
+
+    async def read_holding_registers(address, count, **kwargs):
+        if count > 1:
+            raise ModbusException("gap address does not exist")
+        return ReadResult([address])
+
+    mock_modbus.read_holding_registers.side_effect = read_holding_registers
+    for _ in range(2):
+        results = await asyncio.gather(
+            hub.async_pb_call(1, 100, 1, CALL_TYPE_REGISTER_HOLDING),
+            hub.async_pb_call(1, 102, 1, CALL_TYPE_REGISTER_HOLDING),
+        )
+        assert [result.registers for result in results] == [[100], [102]]
+    # The failed block is not read again
+    assert [
+        call.args for call in mock_modbus.read_holding_registers.call_args_list
+    ] == [(100, 3), (100, 1), (102, 1), (100, 1), (102, 1)]
+
+
+@pytest.mark.parametrize("do_config", [{}])
+async def test_pb_read_block_offline(hass: HomeAssistant, mock_modbus) -> None:
+    """Run test for a block of an offline slave retrying one read per poll."""
+    hub = hass.data[DOMAIN][TEST_MODBUS_NAME]
+    mock_modbus.read_holding_registers.reset_mock()
+    mock_modbus.read_holding_registers.side_effect = ModbusException("offline")
+    for _ in range(3):
+        results = await asyncio.gather(
+            hub.async_pb_call(1, 100, 1, CALL_TYPE_REGISTER_HOLDING),
+            hub.async_pb_call(1, 102, 1, CALL_TYPE_REGISTER_HOLDING),
+        )
+        assert results == [None, None]
+    assert [
+        call.args for call in mock_modbus.read_holding_registers.call_args_list
+    ] == [(100, 3), (100, 1), (102, 1), (100, 3), (100, 1), (100, 3), (102, 1)]
+
+    # The block is read again once the slave is back
+    mock_modbus.read_holding_registers.side_effect = None
+    mock_modbus.read_holding_registers.return_value = ReadResult([1, 2, 3])
+    results = await asyncio.gather(
+        hub.async_pb_call(1, 100, 1, CALL_TYPE_REGISTER_HOLDING),
+        hub.async_pb_call(1, 102, 1, CALL_TYPE_REGISTER_HOLDING),
+    )
+    assert [result.registers for result in results] == [[1], [3]]
+
+
+@pytest.mark.parametrize("do_config", [{}])
+async def test_pb_read_block_offline_gap_illegal(
+    hass: HomeAssistant, mock_modbus
+) -> None:
+    """Run test for a slave offline at start with an illegal gap address."""
+    hub = hass.data[DOMAIN][TEST_MODBUS_NAME]
+    mock_modbus.read_holding_registers.reset_mock()
+    mock_modbus.read_holding_registers.side_effect = ModbusException("offline")
+    results = await asyncio.gather(
+        hub.async_pb_call(1, 100, 1, CALL_TYPE_REGISTER_HOLDING),
+        hub.async_pb_call(1, 102, 1, CALL_TYPE_REGISTER_HOLDING),
+    )
+    assert results == [None, None]
+
+    # The slave is back, but the block read fails on the gap address
+    async def read_holding_registers(address, count, **kwargs):
+        if count > 1:
+            raise ModbusException("gap address does not exist")
+        return ReadResult([address])
+
+    mock_modbus.read_holding_registers.side_effect = read_holding_registers
+    mock_modbus.read_holding_registers.reset_mock()
+    for _ in range(2):
+        results = await asyncio.gather(
+            hub.async_pb_call(1, 100, 1, CALL_TYPE_REGISTER_HOLDING),
+            hub.async_pb_call(1, 102, 1, CALL_TYPE_REGISTER_HOLDING),
+        )
+        assert [result.registers for result in results] == [[100], [102]]
+    # The block is known to fail and is not read again
+    assert [
+        call.args for call in mock_modbus.read_holding_registers.call_args_list
+    ] == [(100, 3), (100, 1), (102, 1), (100, 1), (102, 1)]
+
+
+@pytest.mark.parametrize("do_config", [{}])
+async def test_track_poll(
+    hass: HomeAssistant, mock_modbus, freezer: FrozenDateTimeFactory
+) -> None:
+    """Run test for polling the entities of a slave together."""
+    hub = hass.data[DOMAIN][TEST_MODBUS_NAME]
+    updates = []
+
+    async def update(now):
+        updates.append(now)
+
+    remove_first = hub.async_track_poll(1, 10, update)
+    remove_second = hub.async_track_poll(1, 10, update)
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(updates) == 2
+    assert updates[0] == updates[1]
+
+    remove_first()
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(updates) == 3
+
+    remove_second()
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(updates) == 3
@@ -1,13 +1,21 @@
 """The tests for the Prometheus exporter."""
 
+import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
+import time
 from typing import Any, Self
 from unittest import mock
 
 from freezegun import freeze_time
 import prometheus_client
+from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.openmetrics import exposition as openmetrics
+from prometheus_client.openmetrics.exposition import (
+    CONTENT_TYPE_LATEST as CONTENT_TYPE_OPENMETRICS,
+)
 from prometheus_client.utils import floatToGoString
 import pytest
 
@@ -78,8 +86,10 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_values import EntityValues
+from homeassistant.helpers.entityfilter import FILTER_SCHEMA
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 
@@ -581,6 +591,172 @@ async def test_view_default_namespace(
     ).withValue(15.6).assert_in_metrics(body)
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_openmetrics(
+    client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
+) -> None:
+    """Test prometheus metrics view negotiating the OpenMetrics format."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT,
+        headers={"Accept": "application/openmetrics-text; version=1.0.0"},
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-type"] == CONTENT_TYPE_OPENMETRICS
+    body = (await resp.text()).split("\n")
+
+    # A single EOF marker terminates the exposition
+    assert body.count("# EOF") == 1
+    assert body[-2:] == ["# EOF", ""]
+    assert "# TYPE state_change counter" in body
+    assert (
+        'state_change_total{domain="sensor",entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 1.0'
+    ) in body
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_updates_changed_metrics(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test that only changed series are encoded again between scrapes."""
+    metric = EntityMetric(
+        metric_name="sensor_unit_kwh",
+        domain="sensor",
+        friendly_name="Television Energy",
+        entity="sensor.television_energy",
+    )
+    body = await generate_latest_metrics(client)
+    metric.withValue(74.0).assert_in_metrics(body)
+
+    with mock.patch.object(
+        MetricWrapperBase,
+        "collect",
+        autospec=True,
+        side_effect=MetricWrapperBase.collect,
+    ) as collect:
+        body = await generate_latest_metrics(client)
+        metric.withValue(74.0).assert_in_metrics(body)
+        assert collect.call_count == 0
+
+        set_state_with_entry(hass, sensor_entities["sensor_4"], 75)
+        await hass.async_block_till_done()
+
+        body = await generate_latest_metrics(client)
+        metric.withValue(75.0).assert_in_metrics(body)
+        # Only the four series touched by the state change are encoded again
+        assert sorted(call.args[0]._name for call in collect.call_args_list) == [
+            "entity_available",
+            "last_updated_time_seconds",
+            "sensor_unit_kwh",
+            "state_change",
+        ]
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_concurrent_scrapes(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test concurrent scrapes are encoded one after the other."""
+    metric = EntityMetric(
+        metric_name="sensor_unit_kwh",
+        domain="sensor",
+        friendly_name="Television Energy",
+        entity="sensor.television_energy",
+    )
+    await generate_latest_metrics(client)
+    set_state_with_entry(hass, sensor_entities["sensor_4"], 75)
+    await hass.async_block_till_done()
+
+    encodes: list[str] = []
+    generate_latest = prometheus.PrometheusMetrics.generate_latest
+
+    def _generate_latest(*args: Any) -> bytes:
+        encodes.append("start")
+        time.sleep(0.05)
+        result = generate_latest(*args)
+        encodes.append("end")
+        return result
+
+    with mock.patch.object(
+        prometheus.PrometheusMetrics,
+        "generate_latest",
+        autospec=True,
+        side_effect=_generate_latest,
+    ):
+        bodies = await asyncio.gather(
+            generate_latest_metrics(client), generate_latest_metrics(client)
+        )
+
+    assert encodes == ["start", "end", "start", "end"]
+    for body in bodies:
+        metric.withValue(75.0).assert_in_metrics(body)
+
+
+@pytest.mark.parametrize(
+    "encoder",
+    [prometheus_client.generate_latest, openmetrics.generate_latest],
+)
+async def test_incremental_exposition_matches_full(
+    monkeypatch: pytest.MonkeyPatch,
+    encoder: Callable[[Any], bytes],
+) -> None:
+    """Test the incrementally encoded exposition matches a full encode."""
+    monkeypatch.setattr(
+        prometheus_client, "REGISTRY", prometheus_client.CollectorRegistry()
+    )
+    metrics = prometheus.PrometheusMetrics(
+        FILTER_SCHEMA({}),
+        "",
+        UnitOfTemperature.CELSIUS,
+        EntityValues({}),
+        None,
+        None,
+    )
+
+    def full_encode() -> bytes:
+        registry = prometheus_client.CollectorRegistry()
+        for metric in metrics._metrics.values():
+            registry.register(metric)
+        return encoder(registry)
+
+    def incremental_encode() -> bytes:
+        return metrics.generate_latest(encoder, metrics.async_snapshot())
+
+    metrics.handle_state(
+        State(
+            "sensor.outside",
+            "12.3",
+            {
+                ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS,
+                ATTR_DEVICE_CLASS: SensorDeviceClass.TEMPERATURE,
+                ATTR_FRIENDLY_NAME: 'Outside "North"\\Wall',
+            },
+        )
+    )
+    metrics.handle_state(
+        State(
+            "climate.heatpump",
+            climate.HVACMode.HEAT,
+            {
+                ATTR_HVAC_MODES: [climate.HVACMode.HEAT, climate.HVACMode.OFF],
+                ATTR_CURRENT_TEMPERATURE: 20,
+                ATTR_FRIENDLY_NAME: "Heat\npump",
+            },
+        )
+    )
+    assert incremental_encode() == full_encode()
+
+    metrics.handle_state(State("sensor.outside", "13", {ATTR_FRIENDLY_NAME: "Outside"}))
+    metrics.handle_state(State("climate.heatpump", STATE_UNAVAILABLE))
+    assert incremental_encode() == full_encode()
+    # Nothing changed since the previous scrape
+    assert incremental_encode() == full_encode()
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_sensor_unit(
     client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from copy import copy
 from datetime import datetime, timedelta
 import json
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
@@ -172,6 +173,156 @@ async def test_state_changes_during_period(
     assert_multiple_states_equal_without_context(states[:limit], hist[entity_id])
 
 
+async def test_async_state_changes_during_period_batched(
+    hass: HomeAssistant,
+) -> None:
+    """Test concurrent requests are answered like single requests."""
+    start = dt_util.utcnow()
+    point1 = start + timedelta(seconds=1)
+    point2 = point1 + timedelta(seconds=1)
+    end = point2 + timedelta(seconds=1)
+
+    with freeze_time(start) as freezer:
+        hass.states.async_set("sensor.one", "1")
+        hass.states.async_set("sensor.two", "a")
+        freezer.move_to(point1)
+        hass.states.async_set("sensor.one", "2")
+        hass.states.async_set("sensor.one", "2", {"attribute": "changed"})
+        hass.states.async_set("sensor.two", "b")
+        freezer.move_to(point2)
+        hass.states.async_set("sensor.one", "3")
+        hass.states.async_set("sensor.two", "c")
+        freezer.move_to(end)
+        hass.states.async_set("sensor.one", "4")
+    await async_wait_recording_done(hass)
+
+    requests = [
+        {"start_time": start, "end_time": end, "entity_id": "sensor.one"},
+        {
+            "start_time": point1 + timedelta(milliseconds=500),
+            "entity_id": "sensor.one",
+            "no_attributes": True,
+        },
+        {
+            "start_time": point1 + timedelta(milliseconds=500),
+            "entity_id": "sensor.two",
+            "include_start_time_state": False,
+            "descending": True,
+        },
+        {"start_time": start, "entity_id": "sensor.two", "limit": 2},
+        {"start_time": start, "entity_id": "sensor.missing"},
+    ]
+    batched = await asyncio.gather(
+        *(
+            history.async_state_changes_during_period(hass, **request)
+            for request in requests
+        )
+    )
+
+    for request, result in zip(requests, batched, strict=True):
+        expected = history.state_changes_during_period(hass, **request)
+        assert result.keys() == expected.keys()
+        for entity_id, states in expected.items():
+            assert_multiple_states_equal_without_context_and_last_changed(
+                states, result[entity_id]
+            )
+            assert [state.last_changed for state in states] == [
+                state.last_changed for state in result[entity_id]
+            ]
+
+
+async def test_async_state_changes_during_period_limit_not_batched(
+    hass: HomeAssistant,
+) -> None:
+    """Test requests with a limit do not wait for a shared batch."""
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "a")
+    await async_wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.recorder.history.batch._load_batch"
+    ) as load_batch:
+        results = await asyncio.gather(
+            history.async_state_changes_during_period(
+                hass, start, entity_id="sensor.one", descending=True, limit=1
+            ),
+            history.async_state_changes_during_period(
+                hass, start, entity_id="sensor.two", descending=True, limit=1
+            ),
+        )
+
+    load_batch.assert_not_called()
+    assert [state.state for state in results[0]["sensor.one"]] == ["1"]
+    assert [state.state for state in results[1]["sensor.two"]] == ["a"]
+
+
+async def test_async_state_changes_during_period_merges_close_periods(
+    hass: HomeAssistant,
+) -> None:
+    """Test only requests for about the same period share a query."""
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "a")
+    hass.states.async_set("sensor.three", "x")
+    await async_wait_recording_done(hass)
+    end = dt_util.utcnow() + timedelta(seconds=1)
+
+    requests = [
+        {
+            "start_time": start - timedelta(days=30),
+            "end_time": end,
+            "entity_id": "sensor.one",
+        },
+        {
+            "start_time": start - timedelta(hours=1),
+            "end_time": end,
+            "entity_id": "sensor.two",
+        },
+        {
+            "start_time": start - timedelta(hours=1) + timedelta(seconds=10),
+            "end_time": end,
+            "entity_id": "sensor.three",
+        },
+    ]
+    with patch(
+        "homeassistant.components.recorder.history.batch._load_merged",
+        wraps=history.batch._load_merged,
+    ) as load_merged:
+        results = await asyncio.gather(
+            *(
+                history.async_state_changes_during_period(hass, **request)
+                for request in requests
+            )
+        )
+
+    assert len(load_merged.mock_calls) == 1
+    assert [request.entity_id for request in load_merged.mock_calls[0].args[1]] == [
+        "sensor.two",
+        "sensor.three",
+    ]
+    assert [
+        [state.state for state in result[request["entity_id"]]]
+        for request, result in zip(requests, results, strict=True)
+    ] == [["1"], ["a"], ["x"]]
+
+
+async def test_async_state_changes_during_period_batch_cancelled(
+    hass: HomeAssistant,
+) -> None:
+    """Test consumers are not left waiting when loading a batch is cancelled."""
+    instance = recorder.get_instance(hass)
+    with (
+        patch.object(
+            instance, "async_add_executor_job", side_effect=asyncio.CancelledError
+        ),
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await history.async_state_changes_during_period(
+            hass, dt_util.utcnow(), entity_id="sensor.one"
+        )
+
+
 async def test_state_changes_during_period_last_reported(
     hass: HomeAssistant,
 ) -> None:
@@ -0,0 +1,193 @@
+"""The tests for the recorder migration from schema version 47."""
+
+from datetime import timedelta
+import importlib
+import sys
+from unittest.mock import patch
+
+from freezegun import freeze_time
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import Session
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import migration, statistics
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDay,
+    StatisticsMonth,
+    StatisticsRollups,
+    StatisticsWeek,
+)
+from homeassistant.components.recorder.queries import get_migration_changes
+from homeassistant.components.recorder.util import (
+    execute_stmt_lambda_element,
+    session_scope,
+)
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .common import async_recorder_block_till_done, async_wait_recording_done
+
+from tests.common import async_test_home_assistant
+from tests.typing import RecorderInstanceGenerator
+
+CREATE_ENGINE_TARGET = "homeassistant.components.recorder.core.create_engine"
+SCHEMA_MODULE = "tests.components.recorder.db_schema_47"
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+async def _async_wait_migration_done(hass: HomeAssistant) -> None:
+    """Wait for the migration to be done."""
+    await recorder.get_instance(hass).async_block_till_done()
+    await async_recorder_block_till_done(hass)
+
+
+def _get_migration_id(hass: HomeAssistant) -> dict[str, int]:
+    with session_scope(hass=hass, read_only=True) as session:
+        return dict(execute_stmt_lambda_element(session, get_migration_changes()))
+
+
+def _create_engine_test(*args, **kwargs):
+    """Test version of create_engine that initializes with old schema.
+
+    This simulates an existing db with the old schema.
+    """
+    importlib.import_module(SCHEMA_MODULE)
+    old_db_schema = sys.modules[SCHEMA_MODULE]
+    engine = create_engine(*args, **kwargs)
+    old_db_schema.Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(old_db_schema.StatisticsRuns(start=statistics.get_start_time()))
+        session.add(
+            old_db_schema.SchemaChanges(schema_version=old_db_schema.SCHEMA_VERSION)
+        )
+        session.commit()
+    return engine
+
+
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.usefixtures("hass_storage")  # Prevent test hass from writing to storage
+async def test_migrate_statistics_rollups(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Test the rollup tables are created and existing statistics are summarized."""
+    importlib.import_module(SCHEMA_MODULE)
+    old_db_schema = sys.modules[SCHEMA_MODULE]
+
+    now = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    first_hour = now - timedelta(days=45)
+
+    def _insert_statistics():
+        with session_scope(hass=hass) as session:
+            metadata = old_db_schema.StatisticsMeta(
+                statistic_id="sensor.energy",
+                source="recorder",
+                unit_of_measurement="kWh",
+                has_mean=False,
+                has_sum=True,
+                name=None,
+            )
+            session.add(metadata)
+            session.flush()
+            session.add_all(
+                old_db_schema.Statistics(
+                    metadata_id=metadata.id,
+                    created_ts=now.timestamp(),
+                    start_ts=(first_hour + timedelta(hours=hour)).timestamp(),
+                    state=hour,
+                    sum=hour,
+                )
+                for hour in range(0, 24 * 45, 5)
+            )
+            session.add(old_db_schema.StatisticsRuns(start=now - timedelta(minutes=5)))
+
+    # Create database with old schema
+    with (
+        patch.object(recorder, "db_schema", old_db_schema),
+        patch.object(migration, "SCHEMA_VERSION", old_db_schema.SCHEMA_VERSION),
+        patch.object(migration.StatisticsRollupsMigration, "migrate_data"),
+        patch(CREATE_ENGINE_TARGET, new=_create_engine_test),
+    ):
+        async with (
+            async_test_home_assistant() as hass,
+            async_test_recorder(hass) as instance,
+        ):
+            await instance.async_add_executor_job(_insert_statistics)
+
+            await async_wait_recording_done(hass)
+            await _async_wait_migration_done(hass)
+
+            await hass.async_stop()
+            await hass.async_block_till_done()
+
+    def _fetch_rollups():
+        with session_scope(hass=hass, read_only=True) as session:
+            table_names = inspect(session.connection()).get_table_names()
+            return (
+                table_names,
+                {
+                    rollup.period: rollup.end_ts
+                    for rollup in session.query(StatisticsRollups)
+                },
+                {
+                    table.__tablename__: session.query(table).count()
+                    for table in (StatisticsDay, StatisticsWeek, StatisticsMonth)
+                },
+            )
+
+    # Run again with new schema, let migration run
+    async with async_test_home_assistant() as hass:
+        with (
+            freeze_time(now),
+            patch.object(migration.StatisticsRollupsMigration, "periods_per_batch", 4),
+        ):
+            async with async_test_recorder(hass) as instance:
+                await hass.async_block_till_done()
+                await async_wait_recording_done(hass)
+                # Each batch queues the next one until the migration is done
+                for _ in range(20):
+                    await _async_wait_migration_done(hass)
+                    migration_changes = await instance.async_add_executor_job(
+                        _get_migration_id, hass
+                    )
+                    if (
+                        migration.StatisticsRollupsMigration.migration_id
+                        in migration_changes
+                    ):
+                        break
+
+                (
+                    table_names,
+                    rollup_ends,
+                    rollup_counts,
+                ) = await instance.async_add_executor_job(_fetch_rollups)
+                # The periods are summarized in the configured time zone
+                _, day_start_end = statistics.reduce_day_ts_factory()
+                _, month_start_end = statistics.reduce_month_ts_factory()
+
+                await hass.async_stop()
+                await hass.async_block_till_done()
+
+    assert {
+        "statistics_day",
+        "statistics_week",
+        "statistics_month",
+        "statistics_rollups",
+    } <= set(table_names)
+    # All periods which ended before the last compiled hour are summarized,
+    # even though the migration only summarizes 4 periods per batch
+    assert rollup_ends["day"] == day_start_end(now.timestamp())[0]
+    assert rollup_ends["month"] == month_start_end(now.timestamp())[0]
+    assert rollup_counts["statistics_day"] >= 44
+    assert rollup_counts["statistics_week"] >= 5
+    assert rollup_counts["statistics_month"] >= 1
+    assert (
+        migration_changes[migration.StatisticsRollupsMigration.migration_id]
+        == migration.StatisticsRollupsMigration.migration_version
+    )
@@ -9,7 +9,12 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDay,
+    StatisticsMonth,
+    StatisticsRollups,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -1844,6 +1849,176 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+async def test_statistics_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone,
+) -> None:
+    """Test day, week and month statistics are read from the rollup tables."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+
+    zero = dt_util.utcnow()
+    mean_statistics = []
+    sum_statistics = []
+    for hour in range(0, 24 * 30, 7):
+        start = zero + timedelta(days=2, hours=hour)
+        mean_statistics.append(
+            {"start": start, "max": hour + 1, "mean": hour % 4, "min": -hour}
+        )
+        sum_statistics.append(
+            {"start": start, "last_reset": None, "state": hour % 10, "sum": hour}
+        )
+    metadata = {
+        "has_mean": False,
+        "has_sum": False,
+        "name": None,
+        "source": "test",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        metadata | {"has_mean": True, "statistic_id": "test:mean"},
+        mean_statistics,
+    )
+    async_add_external_statistics(
+        hass,
+        metadata | {"has_sum": True, "statistic_id": "test:sum"},
+        sum_statistics,
+    )
+    await async_wait_recording_done(hass)
+
+    def get_stats() -> dict[str, dict[str, list[dict[str, Any]]]]:
+        return {
+            period: statistics_during_period(
+                hass,
+                zero,
+                period=period,
+                statistic_ids={"test:mean", "test:sum"},
+                types={"change", "last_reset", "max", "mean", "min", "state", "sum"},
+            )
+            for period in ("day", "week", "month")
+        }
+
+    # Nothing is summarized yet, the hourly statistics are reduced
+    expected = get_stats()
+    assert len(expected["day"]["test:sum"]) >= 30
+
+    # Summarize up to the middle of the imported statistics
+    with session_scope(hass=hass) as session:
+        assert not statistics.compile_missing_rollups(
+            session, zero + timedelta(days=20), 5
+        )
+    with session_scope(hass=hass) as session:
+        assert statistics.compile_missing_rollups(
+            session, zero + timedelta(days=20), 100
+        )
+        assert session.query(StatisticsDay).count()
+    assert get_stats() == expected
+
+    # Summarize all of them
+    with session_scope(hass=hass) as session:
+        assert statistics.compile_missing_rollups(
+            session, zero + timedelta(days=62), 100
+        )
+        assert session.query(StatisticsMonth).count() == 4
+    assert get_stats() == expected
+
+    # Imported statistics and adjustments update the summarized periods
+    async_add_external_statistics(
+        hass,
+        metadata | {"has_sum": True, "statistic_id": "test:sum"},
+        [
+            {
+                "start": zero + timedelta(days=2, hours=7),
+                "last_reset": None,
+                "state": 1,
+                "sum": 1000,
+            }
+        ],
+    )
+    recorder.get_instance(hass).async_adjust_statistics(
+        "test:sum", zero + timedelta(days=10, hours=3), 100, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    stats = get_stats()
+    assert stats != expected
+    with patch.object(statistics, "_get_rollup_ends", return_value={}):
+        assert get_stats() == stats
+
+
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+async def test_compile_hourly_statistics_summarizes_missing_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test compiling an hour summarizes the missing periods in batches."""
+    await hass.config.async_set_time_zone("UTC")
+    await async_wait_recording_done(hass)
+
+    zero = dt_util.utcnow()
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": False,
+            "has_sum": True,
+            "name": None,
+            "source": "test",
+            "statistic_id": "test:sum",
+            "unit_of_measurement": "kWh",
+        },
+        [
+            {"start": zero + timedelta(hours=hour), "state": hour, "sum": hour}
+            for hour in range(0, 24 * 10, 3)
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    def get_rollups() -> tuple[dict[str, float], int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return (
+                {
+                    rollup.period: rollup.end_ts
+                    for rollup in session.query(StatisticsRollups)
+                },
+                session.query(StatisticsDay).count(),
+            )
+
+    with patch.object(statistics, "MAX_ROLLUP_PERIODS_PER_RUN", 3):
+        # Only 5 minute periods which complete an hour summarize the rollups
+        do_adhoc_statistics(hass, start=zero + timedelta(days=11, minutes=50))
+        await async_wait_recording_done(hass)
+        assert get_rollups() == ({}, 0)
+
+        # At most MAX_ROLLUP_PERIODS_PER_RUN periods are summarized per table
+        do_adhoc_statistics(hass, start=zero + timedelta(days=11, minutes=55))
+        await async_wait_recording_done(hass)
+        rollup_ends, day_count = get_rollups()
+        assert rollup_ends == {
+            "day": (zero + timedelta(days=3)).timestamp(),
+            # 2022-10-01 is a Saturday, the week ending 2022-10-17 is not done
+            "week": dt_util.parse_datetime("2022-10-10 00:00:00+00:00").timestamp(),
+            "month": zero.timestamp(),
+        }
+        assert day_count == 3
+
+        # The next hour continues where the previous one stopped
+        do_adhoc_statistics(hass, start=zero + timedelta(days=11, hours=1, minutes=55))
+        await async_wait_recording_done(hass)
+        rollup_ends, day_count = get_rollups()
+        assert rollup_ends["day"] == (zero + timedelta(days=6)).timestamp()
+        assert day_count == 6
+
+    do_adhoc_statistics(hass, start=zero + timedelta(days=11, hours=2, minutes=55))
+    await async_wait_recording_done(hass)
+    rollup_ends, day_count = get_rollups()
+    assert rollup_ends["day"] == (zero + timedelta(days=11)).timestamp()
+    # The days after the imported statistics have nothing to summarize
+    assert day_count == 10
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
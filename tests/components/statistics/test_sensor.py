@@ -1481,6 +1481,69 @@ async def test_state_characteristic_mean_circular(hass: HomeAssistant) -> None:
     )
 
 
+async def test_state_characteristics_rolling_buffer(hass: HomeAssistant) -> None:
+    """Test characteristics stay correct while samples are evicted from the buffer."""
+    sampling_size = 5
+    expected_functions = {
+        "distance_absolute": lambda values: max(values) - min(values),
+        "mean": statistics.mean,
+        "median": statistics.median,
+        "percentile": lambda values: statistics.quantiles(
+            values, n=100, method="exclusive"
+        )[89],
+        "standard_deviation": statistics.stdev,
+        "sum": sum,
+        "sum_differences": lambda values: sum(
+            abs(j - i) for i, j in zip(values, values[1:], strict=False)
+        ),
+        "sum_differences_nonnegative": lambda values: sum(
+            j - i if j >= i else j for i, j in zip(values, values[1:], strict=False)
+        ),
+        "value_max": max,
+        "value_min": min,
+        "variance": statistics.variance,
+    }
+
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": f"test_{characteristic}",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": characteristic,
+                    "sampling_size": sampling_size,
+                    "percentile": 90,
+                    "precision": 6,
+                }
+                for characteristic in expected_functions
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    values = [*VALUES_NUMERIC, *reversed(VALUES_NUMERIC), *VALUES_NUMERIC]
+    for count, value in enumerate(values, 1):
+        hass.states.async_set(
+            "sensor.test_monitored",
+            str(value),
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+        await hass.async_block_till_done()
+        if count < sampling_size:
+            continue
+
+        window = values[count - sampling_size : count]
+        for characteristic, function in expected_functions.items():
+            state = hass.states.get(f"sensor.test_{characteristic}")
+            assert state is not None
+            assert float(state.state) == pytest.approx(
+                round(function(window), 6), abs=1e-6
+            ), characteristic
+
+
 async def test_invalid_state_characteristic(hass: HomeAssistant) -> None:
     """Test the detection of wrong state_characteristics selected."""
     assert await async_setup_component(
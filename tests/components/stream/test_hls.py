@@ -383,6 +383,45 @@ async def test_hls_playlist_view(
     await stream.stop()
 
 
+async def test_hls_playlist_and_segment_data_cached(
+    hass: HomeAssistant, setup_component, stream_worker_sync
+) -> None:
+    """Test the rendered playlist and segment data are shared between requests."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+    for i in range(2):
+        segment = Segment(sequence=i, duration=SEGMENT_DURATION)
+        hls.put(segment)
+    await hass.async_block_till_done()
+
+    playlist = hls.render_playlist()
+    assert playlist.decode("utf-8") == make_playlist(
+        sequence=0, segments=[make_segment(0), make_segment(1)]
+    )
+    assert hls.render_playlist() is playlist
+
+    # A new segment invalidates the rendered playlist
+    segment = Segment(sequence=2, duration=SEGMENT_DURATION, _stream_outputs=[hls])
+    await hass.async_block_till_done()
+    assert hls.render_playlist().decode("utf-8") == make_playlist(
+        sequence=0, segments=[make_segment(0), make_segment(1), make_segment(2)]
+    )
+
+    # The joined data of a complete segment is only built once
+    segment.async_add_part(
+        Part(duration=SEGMENT_DURATION, has_keyframe=True, data=FAKE_PAYLOAD),
+        SEGMENT_DURATION,
+    )
+    data = segment.get_data()
+    assert data == FAKE_PAYLOAD
+    assert segment.get_data() is data
+    assert segment.data_size == len(FAKE_PAYLOAD)
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
 async def test_hls_max_segments(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
@@ -9,7 +9,7 @@ from unittest.mock import patch
 import pytest
 from pytest_unordered import unordered
 
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import DATA_TRACE, DEFAULT_STORED_TRACES
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
 from homeassistant.helpers.typing import UNDEFINED
@@ -602,6 +602,108 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_memory_budget(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain: str
+) -> None:
+    """Test finished traces are evicted when they exceed the memory budget."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": [
+            {"variables": {"items": list(range(10000))}},
+            {"event": "some_event"},
+        ],
+    }
+    moon_config = {
+        "id": "moon",
+        "triggers": {"platform": "event", "event_type": "test_event2"},
+        "actions": {"event": "another_event"},
+    }
+    with (
+        patch("homeassistant.components.trace.TRACE_MEMORY_BUDGET", 8000),
+        patch("homeassistant.components.trace.TRACE_ENCODE_AFTER", 0),
+    ):
+        await _setup_automation_or_script(hass, domain, [sun_config, moon_config])
+
+    client = await hass_ws_client()
+
+    # The trace of "sun" is kept as long as it is the only one
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    run_id = _find_run_id(response["result"], domain, "sun")
+    assert run_id
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    trace = response["result"]
+    assert trace["state"] == "stopped"
+    prefix = "action" if domain == "automation" else "sequence"
+    assert trace["trace"][f"{prefix}/0"][0]["changed_variables"]["items"] == list(
+        range(10000)
+    )
+
+    # Traces of "moon" evict the trace of "sun" which exceeds the budget
+    for _ in range(3):
+        await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+        await hass.async_block_till_done()
+    await client.send_json({"id": 3, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == 0
+    assert len(_find_traces(response["result"], domain, "moon")) == 3
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_encoded_after_later_traces(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain: str
+) -> None:
+    """Test finished traces are only encoded once later traces finished."""
+    moon_config = {
+        "id": "moon",
+        "triggers": {"platform": "event", "event_type": "test_event2"},
+        "actions": {"event": "another_event"},
+    }
+    with patch("homeassistant.components.trace.TRACE_ENCODE_AFTER", 2):
+        await _setup_automation_or_script(hass, domain, [moon_config])
+
+    for _ in range(3):
+        await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+        await hass.async_block_till_done()
+
+    traces = list(hass.data[DATA_TRACE][f"{domain}.moon"].values())
+    assert traces[0].size is not None
+    assert [trace.size for trace in traces[1:]] == [None, None]
+
+    # Encoded and unencoded traces are returned alike
+    client = await hass_ws_client()
+    for trace in traces:
+        await client.send_json_auto_id(
+            {
+                "type": "trace/get",
+                "domain": domain,
+                "item_id": "moon",
+                "run_id": trace.run_id,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"]["state"] == "stopped"
+        assert response["result"]["trace"]
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
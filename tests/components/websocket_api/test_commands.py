@@ -2563,6 +2563,26 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_setup_trace(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test getting the integration setup trace."""
+    trace = {"traceEvents": [], "displayTimeUnit": "ms"}
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_setup_trace",
+        return_value=trace,
+    ):
+        await websocket_client.send_json({"id": 7, "type": "integration/setup_trace"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == trace
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -1655,3 +1655,36 @@ async def test_zeroconf_rediscover_no_match(
 
         assert len(mock_service_browser.mock_calls) == 1
         assert len(mock_config_flow.mock_calls) == 1
+
+
+def test_zeroconf_type_matchers() -> None:
+    """Test the indexed matchers of a zeroconf type match like fnmatch."""
+    matchers = zeroconf.ZeroconfTypeMatchers(
+        [
+            {"domain": "any"},
+            {"domain": "exact", "name": "shelly1"},
+            {"domain": "prefix", "name": "shelly*"},
+            {"domain": "short_prefix", "name": "sh*"},
+            {"domain": "pattern", "name": "*elly?"},
+            {"domain": "props", "properties": {"vendor": "acme*", "model": "x"}},
+            {"domain": "prefix_props", "name": "shelly*", "properties": {"id": "1"}},
+        ]
+    )
+
+    assert matchers.async_matching_domains("shelly1", {}) == [
+        "any",
+        "exact",
+        "prefix",
+        "short_prefix",
+        "pattern",
+    ]
+    assert matchers.async_matching_domains("shelly", {"id": "1"}) == [
+        "any",
+        "prefix",
+        "short_prefix",
+        "prefix_props",
+    ]
+    assert matchers.async_matching_domains(
+        "s", {"vendor": "ACME Corp", "model": "X"}
+    ) == ["any", "props"]
+    assert matchers.async_matching_domains("other", {"vendor": "acme"}) == ["any"]
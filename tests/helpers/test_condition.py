@@ -258,13 +258,21 @@ async def test_and_condition_with_template(hass: HomeAssistant) -> None:
     config = await condition.async_validate_condition_config(hass, config)
     test = await condition.async_from_config(hass, config)
 
+    # The numeric state condition is evaluated before the template condition
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -300,13 +308,21 @@ async def test_and_condition_shorthand(hass: HomeAssistant) -> None:
     assert config["alias"] == "And Condition Shorthand"
     assert "and" not in config
 
+    # The numeric state condition is evaluated before the template condition
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -342,13 +358,21 @@ async def test_and_condition_list_shorthand(hass: HomeAssistant) -> None:
     assert config["alias"] == "And Condition List Shorthand"
     assert "and" not in config
 
+    # The numeric state condition is evaluated before the template condition
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -1806,6 +1830,77 @@ async def test_numeric_state_using_input_number(hass: HomeAssistant) -> None:
         )
 
 
+async def test_numeric_state_threshold_entity_changes(hass: HomeAssistant) -> None:
+    """Test numeric_state follows a threshold entity and records its duration."""
+    hass.states.async_set("number.high", 50)
+    config = {
+        "condition": "and",
+        "conditions": [
+            {
+                "condition": "numeric_state",
+                "entity_id": "sensor.temperature",
+                "below": "number.high",
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 42)
+    assert test(hass)
+    assert test(hass)
+
+    hass.states.async_set("number.high", 40)
+    assert not test(hass)
+
+    hass.states.async_set("number.high", "unknown")
+    assert not test(hass)
+
+    hass.states.async_set("number.high", 60)
+    assert test(hass)
+
+    # The time taken is only recorded when the trace is stored
+    condition_trace = trace.trace_get(clear=False)
+    trace.trace_clear()
+    assert all(
+        "duration" not in element.as_dict()
+        for key in ("", "conditions/0")
+        for element in condition_trace[key]
+    )
+    token = trace.trace_id_cv.set(("automation.test", "1234"))
+    try:
+        assert test(hass)
+    finally:
+        trace.trace_id_cv.reset(token)
+    condition_trace = trace.trace_get(clear=False)
+    assert all(
+        isinstance(element.as_dict()["duration"], float)
+        for key in ("", "conditions/0")
+        for element in condition_trace[key]
+    )
+
+
+def test_plan_checks_keeps_conditions_with_side_effects() -> None:
+    """Test conditions are not reordered across conditions with side effects."""
+    configs = [
+        {"condition": "template", "value_template": "{{ true }}"},
+        {"condition": "state", "entity_id": "light.a", "state": "on"},
+        {"condition": "device", "device_id": "abcd", "domain": "light"},
+        {"condition": "template", "value_template": "{{ true }}"},
+        {
+            "condition": "and",
+            "conditions": [
+                {"condition": "device", "device_id": "abcd", "domain": "light"}
+            ],
+        },
+        {"condition": "trigger", "id": "a"},
+        {"condition": "template", "value_template": "{{ true }}"},
+        {"condition": "state", "entity_id": "light.b", "state": "on"},
+    ]
+    assert condition._plan_checks(configs) == [1, 0, 2, 3, 4, 5, 7, 6]
+
+
 async def test_zone_raises(hass: HomeAssistant) -> None:
     """Test that zone raises ConditionError on errors."""
     config = {
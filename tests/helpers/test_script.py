@@ -2169,6 +2169,41 @@ async def test_condition_all_cached(hass: HomeAssistant) -> None:
     assert len(script_obj._config_cache) == 2
 
 
+async def test_step_conditions_resolved_once(hass: HomeAssistant) -> None:
+    """Test the conditions of a step are only looked up on its first run."""
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "condition": "template",
+                "value_template": '{{ states.test.entity.state == "hello" }}',
+            },
+            {
+                "repeat": {
+                    "until": [
+                        {"condition": "template", "value_template": "{{ true }}"}
+                    ],
+                    "sequence": [{"event": "test_event"}],
+                }
+            },
+        ]
+    )
+    script_obj = script.Script(
+        hass, sequence, "Test Name", "test_domain", script_mode="parallel", max_runs=2
+    )
+    events = async_capture_events(hass, "test_event")
+
+    hass.states.async_set("test.entity", "hello")
+    with patch.object(
+        script_obj, "_async_get_condition", wraps=script_obj._async_get_condition
+    ) as get_condition:
+        await script_obj.async_run(context=Context())
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+
+    assert len(events) == 2
+    assert get_condition.call_count == 2
+
+
 @pytest.mark.parametrize("count", [3, script.ACTION_TRACE_NODE_MAX_LEN * 2])
 async def test_repeat_count(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, count
@@ -788,6 +788,30 @@ async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     )
 
 
+@pytest.mark.usefixtures("floor_area_mock")
+async def test_extract_referenced_entity_ids_cached(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test resolved targets are cached until a registry is updated."""
+    call = ServiceCall("light", "turn_on", {"area_id": "test-area"})
+
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.indirectly_referenced == {"light.in_area", "light.assigned_to_area"}
+    selected.indirectly_referenced.add("light.not_referenced")
+
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.indirectly_referenced == {"light.in_area", "light.assigned_to_area"}
+
+    entity_registry.async_update_entity("light.in_own_area", area_id="test-area")
+
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.indirectly_referenced == {
+        "light.in_area",
+        "light.assigned_to_area",
+        "light.in_own_area",
+    }
+
+
 async def test_async_get_all_descriptions(hass: HomeAssistant) -> None:
     """Test async_get_all_descriptions."""
     group_config = {DOMAIN_GROUP: {}}
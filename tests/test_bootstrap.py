@@ -22,6 +22,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import CoreState, HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.translation import async_translations_loaded
 from homeassistant.helpers.typing import ConfigType
@@ -1516,6 +1517,57 @@ async def test_setup_does_base_platforms_first(hass: HomeAssistant) -> None:
     assert order[3:] == ["root", "first_dep", "second_dep"]
 
 
+async def test_prioritize_automation_config_entries(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the config entries used by automations are set up first."""
+    entries = [
+        MockConfigEntry(domain="test", entry_id=f"entry_{idx}") for idx in range(4)
+    ]
+    for entry in entries:
+        entry.add_to_hass(hass)
+    entity_registry.async_get_or_create(
+        "light", "test", "1", config_entry=entries[0], suggested_object_id="kitchen"
+    )
+    entity_registry.async_get_or_create(
+        "sensor", "test", "2", config_entry=entries[1], suggested_object_id="door"
+    )
+    device = device_registry.async_get_or_create(
+        config_entry_id=entries[2].entry_id, identifiers={("test", "device")}
+    )
+    entity_registry.async_get_or_create(
+        "switch", "test", "3", config_entry=entries[3], suggested_object_id="unused"
+    )
+    config = {
+        "automation": [
+            {
+                "triggers": [
+                    {"trigger": "state", "entity_id": "sensor.door, sensor.unknown"}
+                ],
+                "actions": [
+                    {
+                        "action": "light.turn_on",
+                        "target": {"entity_id": ["light.kitchen"]},
+                    }
+                ],
+            }
+        ],
+        "automation extra": {
+            "triggers": [{"trigger": "device", "device_id": device.id}],
+            "actions": [],
+        },
+    }
+
+    with patch.object(
+        hass.config_entries.setup_scheduler, "async_prioritize"
+    ) as mock_prioritize:
+        bootstrap._async_prioritize_automation_config_entries(hass, config)
+
+    assert mock_prioritize.call_args[0][0] == {"entry_0", "entry_1", "entry_2"}
+
+
 def test_should_rollover_is_always_false() -> None:
     """Test that shouldRollover always returns False."""
     assert (
@@ -1959,6 +1959,119 @@ async def test_entry_cannot_be_loaded_twice(
     assert entry.state is state
 
 
+async def test_setup_entries_limited(hass: HomeAssistant) -> None:
+    """Test the number of config entries set up at the same time is limited."""
+    hass.config.max_parallel_config_entry_setups = 3
+    hass.config.max_parallel_config_entry_setups_per_domain = {"comp": 2}
+    started: list[str] = []
+    finish: dict[str, asyncio.Event] = {}
+
+    async def mock_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+        """Mock setting up an entry."""
+        started.append(entry.entry_id)
+        finish[entry.entry_id] = asyncio.Event()
+        await finish[entry.entry_id].wait()
+        return True
+
+    for domain, count in (("comp", 4), ("test", 2)):
+        mock_integration(hass, MockModule(domain, async_setup_entry=mock_setup_entry))
+        mock_platform(hass, f"{domain}.config_flow", None)
+        for idx in range(1, count + 1):
+            MockConfigEntry(domain=domain, entry_id=f"{domain}_{idx}").add_to_hass(hass)
+    hass.config_entries.setup_scheduler.async_prioritize(["comp_4"])
+
+    async def wait_for_setups(count: int) -> None:
+        async with asyncio.timeout(5):
+            while len(started) < count:
+                await asyncio.sleep(0)
+        # Give the entries which should wait the chance to start
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+    setup_tasks = [
+        hass.async_create_task(async_setup_component(hass, "comp", {})),
+        hass.async_create_task(async_setup_component(hass, "test", {})),
+    ]
+    await wait_for_setups(3)
+    assert started == ["comp_1", "comp_2", "test_1"]
+
+    # The prioritized entry is set up first
+    finish["comp_1"].set()
+    await wait_for_setups(4)
+    assert started == ["comp_1", "comp_2", "test_1", "comp_4"]
+
+    # The waiting entries of domains at their limit are skipped
+    finish["test_1"].set()
+    await wait_for_setups(5)
+    assert started == ["comp_1", "comp_2", "test_1", "comp_4", "test_2"]
+
+    for entry_id in ("comp_2", "comp_4", "test_2"):
+        finish[entry_id].set()
+    await wait_for_setups(6)
+    finish["comp_3"].set()
+    assert all(await asyncio.gather(*setup_tasks))
+    assert all(
+        entry.state is config_entries.ConfigEntryState.LOADED
+        for entry in hass.config_entries.async_entries()
+    )
+
+
+async def test_setup_entries_limited_nested(hass: HomeAssistant) -> None:
+    """Test a config entry set up by another config entry is not limited."""
+    hass.config.max_parallel_config_entry_setups = 1
+
+    async def mock_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+        """Mock setting up an entry which needs another integration."""
+        return await async_setup_component(hass, "test", {})
+
+    mock_integration(hass, MockModule("comp", async_setup_entry=mock_setup_entry))
+    mock_integration(
+        hass, MockModule("test", async_setup_entry=AsyncMock(return_value=True))
+    )
+    mock_platform(hass, "comp.config_flow", None)
+    mock_platform(hass, "test.config_flow", None)
+    comp_entry = MockConfigEntry(domain="comp")
+    comp_entry.add_to_hass(hass)
+    test_entry = MockConfigEntry(domain="test")
+    test_entry.add_to_hass(hass)
+
+    assert await async_setup_component(hass, "comp", {})
+    assert comp_entry.state is config_entries.ConfigEntryState.LOADED
+    assert test_entry.state is config_entries.ConfigEntryState.LOADED
+
+
+async def test_setup_entries_limited_cancelled(hass: HomeAssistant) -> None:
+    """Test a cancelled waiting config entry setup does not take a slot."""
+    hass.config.max_parallel_config_entry_setups = 1
+    finish = asyncio.Event()
+
+    async def mock_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+        """Mock setting up an entry."""
+        await finish.wait()
+        return True
+
+    mock_integration(hass, MockModule("comp", async_setup_entry=mock_setup_entry))
+    mock_platform(hass, "comp.config_flow", None)
+    hass.config.components.add("comp")
+    entries = [MockConfigEntry(domain="comp") for _ in range(3)]
+    tasks = []
+    for entry in entries:
+        entry.add_to_hass(hass)
+        tasks.append(
+            hass.async_create_task(hass.config_entries.async_setup(entry.entry_id))
+        )
+    await asyncio.sleep(0)
+
+    tasks[1].cancel()
+    finish.set()
+    assert await tasks[0]
+    assert await tasks[2]
+    with pytest.raises(asyncio.CancelledError):
+        await tasks[1]
+    assert entries[1].state is config_entries.ConfigEntryState.NOT_LOADED
+    assert entries[2].state is config_entries.ConfigEntryState.LOADED
+
+
 async def test_entry_setup_without_lock_raises(hass: HomeAssistant) -> None:
     """Test trying to setup a config entry without the lock."""
     entry = MockConfigEntry(
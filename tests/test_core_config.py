@@ -67,6 +67,8 @@ def test_core_config_schema() -> None:
         {"radius": -10},
         {"webrtc": "bla"},
         {"webrtc": {}},
+        {"config_entry_setup": {"max_parallel": 0}},
+        {"config_entry_setup": {"max_parallel_per_integration": {"hue": 0}}},
     ):
         with pytest.raises(MultipleInvalid):
             CORE_CONFIG_SCHEMA(value)
@@ -85,6 +87,10 @@ def test_core_config_schema() -> None:
             "language": "sv",
             "radius": "10",
             "webrtc": {"ice_servers": [{"url": "stun:custom_stun_server:3478"}]},
+            "config_entry_setup": {
+                "max_parallel": 10,
+                "max_parallel_per_integration": {"hue": 1},
+            },
         }
     )
 
@@ -413,6 +419,10 @@ async def test_loading_configuration(hass: HomeAssistant) -> None:
             "language": "sv",
             "radius": 150,
             "webrtc": {"ice_servers": [{"url": "stun:custom_stun_server:3478"}]},
+            "config_entry_setup": {
+                "max_parallel": 10,
+                "max_parallel_per_integration": {"hue": 1},
+            },
         },
     )
 
@@ -437,6 +447,8 @@ async def test_loading_configuration(hass: HomeAssistant) -> None:
     assert hass.config.webrtc == RTCConfiguration(
         [RTCIceServer(urls=["stun:custom_stun_server:3478"])]
     )
+    assert hass.config.max_parallel_config_entry_setups == 10
+    assert hass.config.max_parallel_config_entry_setups_per_domain == {"hue": 1}
 
 
 @pytest.mark.parametrize(
@@ -994,6 +994,15 @@ async def test_async_start_setup_config_entry_platform_wait(
             setup.SetupPhases.CONFIG_ENTRY_SETUP: 120.0,
         },
     }
+    # The trace shows the wait inside of the config entry setup
+    assert [
+        (phase, time_taken)
+        for _, group, phase, _, time_taken in setup._setup_timeline(hass)
+        if group == "entry_id"
+    ] == [
+        (setup.SetupPhases.WAIT_IMPORT_PLATFORMS, 100.0),
+        (setup.SetupPhases.CONFIG_ENTRY_SETUP, 120.0),
+    ]
 
 
 async def test_async_start_setup_top_level_yaml(hass: HomeAssistant) -> None:
@@ -1150,6 +1159,58 @@ async def test_async_get_setup_timings(hass: HomeAssistant) -> None:
     }
 
 
+async def test_async_get_setup_trace(hass: HomeAssistant) -> None:
+    """Test we can export the setup timeline as a Chrome trace."""
+    assert setup.async_get_setup_trace(hass) == {
+        "traceEvents": [],
+        "displayTimeUnit": "ms",
+    }
+    setup._setup_timeline(hass).extend(
+        [
+            ("august", "entry_id", setup.SetupPhases.CONFIG_ENTRY_SETUP, 10.5, 1.0),
+            ("august", None, setup.SetupPhases.SETUP, 10.0, 2.5),
+        ]
+    )
+    assert setup.async_get_setup_trace(hass) == {
+        "traceEvents": [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "august"}},
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 1,
+                "args": {"name": "entry_id"},
+            },
+            {
+                "name": "config_entry_setup",
+                "cat": "setup",
+                "ph": "X",
+                "ts": 500000,
+                "dur": 1000000,
+                "pid": 1,
+                "tid": 1,
+            },
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 2,
+                "args": {"name": "august"},
+            },
+            {
+                "name": "setup",
+                "cat": "setup",
+                "ph": "X",
+                "ts": 0,
+                "dur": 2500000,
+                "pid": 1,
+                "tid": 2,
+            },
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+
 async def test_setup_config_entry_from_yaml(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None: